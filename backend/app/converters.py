@@ -9,10 +9,14 @@ from app.schemas import (
     SeatOut,
     TableOut,
     MetricsOut,
+    ConflictOut,
+    ImprovementOut,
     SeatingPlanOut,
+    WeightSweepOut,
 )
 
 from seating_solver.models import (
+    Conflict as SolverConflict,
     Guest as SolverGuest,
     Table as SolverTable,
 )
@@ -31,6 +35,9 @@ def guest_in_to_solver(g: GuestIn) -> SolverGuest:
         name=g.name,
         gender=g.gender,
         marital_status=g.maritalStatus,
+        partner_id=g.partnerId,
+        party_id=g.partyId,
+        party_seat=g.partySeat,
         wants_to_sit_next_to=g.wantsToSitNextTo,
         must_not_sit_next_to=g.mustNotSitNextTo,
         # If SolverGuest doesn't yet have these fields, remove them here.
@@ -51,6 +58,11 @@ def table_in_to_solver(t: TableIn) -> SolverTable:
     )
 
 
+def conflict_to_out(c: SolverConflict) -> ConflictOut:
+    """Convert a solver Conflict into the API-layer ConflictOut."""
+    return ConflictOut(kind=c.kind, guestIds=c.guest_ids, message=c.message)
+
+
 def seating_plan_dict_to_out(d: Dict[str, Any]) -> SeatingPlanOut:
     """
     Convert the plain dict produced by seating_plan_to_dict(plan)
@@ -85,4 +97,29 @@ def seating_plan_dict_to_out(d: Dict[str, Any]) -> SeatingPlanOut:
             splitCouples=metrics["splitCouples"],
         ),
         attemptsMade=d["attemptsMade"],
+        elapsedMs=d.get("elapsedMs"),
+        improvementCurve=[
+            ImprovementOut(
+                attempt=p["attempt"],
+                elapsedMs=p["elapsedMs"],
+                score=p["score"],
+            )
+            for p in d.get("improvementCurve", [])
+        ],
+        conflicts=[
+            ConflictOut(kind=c["kind"], guestIds=c["guestIds"], message=c["message"])
+            for c in d.get("conflicts", [])
+        ],
+        alternatives=[seating_plan_dict_to_out(a) for a in d.get("alternatives", [])],
+    )
+
+
+def weight_sweep_dict_to_out(d: Dict[str, Any]) -> WeightSweepOut:
+    """Convert the dict produced by weight_sweep_to_dict(sweep) into WeightSweepOut."""
+    return WeightSweepOut(
+        plans=[seating_plan_dict_to_out(p) for p in d["plans"]],
+        pareto=[seating_plan_dict_to_out(p) for p in d.get("pareto", [])],
+        poolSize=d["poolSize"],
+        cached=d["cached"],
+        elapsedMs=d["elapsedMs"],
     )
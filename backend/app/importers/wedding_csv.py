@@ -5,6 +5,7 @@ import io
 from typing import List, Tuple, Dict, Any
 
 from app.schemas import GuestIn
+from seating_solver.problem import parse_married_to
 
 
 def _normalise_gender(raw: str | None) -> str | None:
@@ -28,6 +29,12 @@ def parse_wedding_csv(file_bytes: bytes) -> Tuple[List[GuestIn], List[str]]:
       - Marital_Status
       - Wants to sit next to
       - Must not sit next to
+
+    Optional columns:
+      - Partner   (partner's name; falls back to "Married to <name>"
+                   in Marital_Status when absent)
+
+    Partners are resolved to guest IDs here, once, and stored as partnerId.
     """
     text = file_bytes.decode("utf-8-sig")  # handle BOM if present
     f = io.StringIO(text)
@@ -62,6 +69,8 @@ def parse_wedding_csv(file_bytes: bytes) -> Tuple[List[GuestIn], List[str]]:
         wants_names = [part.strip() for part in wants_raw.split(",") if part.strip()]
         must_not_names = [part.strip() for part in must_not_raw.split(",") if part.strip()]
 
+        partner_name = (row.get("Partner") or "").strip() or parse_married_to(marital_status)
+
         guest_id = f"guest-{len(guests) + 1}"
         norm_name = name.lower()
 
@@ -84,6 +93,7 @@ def parse_wedding_csv(file_bytes: bytes) -> Tuple[List[GuestIn], List[str]]:
                 "rowNumber": row_num,
                 "wantsByName": wants_names,
                 "mustNotByName": must_not_names,
+                "partnerByName": partner_name,
             },
         )
         guests.append(guest)
@@ -133,6 +143,33 @@ def parse_wedding_csv(file_bytes: bytes) -> Tuple[List[GuestIn], List[str]]:
         guest.wantsToSitNextTo = wants_ids
         guest.mustNotSitNextTo = must_not_ids
 
+    # Third pass: resolve partners into partnerId, keeping the link symmetric
+    guests_by_id: Dict[str, GuestIn] = {g.id: g for g in guests}
+
+    for guest in guests:
+        partner_name = (guest.attributes or {}).get("partnerByName")
+        if not partner_name or guest.partnerId:
+            continue
+
+        target_id = name_to_primary_id.get(partner_name.lower())
+        if not target_id or target_id == guest.id:
+            warnings.append(
+                f"Guest '{guest.name}' has partner '{partner_name}', "
+                "but no matching guest was found."
+            )
+            continue
+
+        partner = guests_by_id[target_id]
+        if partner.partnerId and partner.partnerId != guest.id:
+            warnings.append(
+                f"Guest '{guest.name}' has partner '{partner.name}', "
+                f"but '{partner.name}' is already partnered with someone else."
+            )
+            continue
+
+        guest.partnerId = target_id
+        partner.partnerId = guest.id
+
     if not guests:
         warnings.append("No valid guests were parsed from the CSV file.")
 
@@ -17,11 +17,22 @@ from fastapi import (
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
-from seating_solver.solver import solve, seating_plan_to_dict
+from seating_solver.feasibility import InfeasibleError
+from seating_solver.solver import (
+    MAX_WORKERS,
+    analyse_conflicts,
+    solve,
+    seating_plan_to_dict,
+    sweep_weights,
+    weight_sweep_to_dict,
+)
 
 from app.schemas import (
+    ConflictOut,
     GenerateRequest,
     SeatingPlanOut,
+    SweepRequest,
+    WeightSweepOut,
     CsvImportResponse,
     EventCreate,
     EventUpdate,
@@ -32,9 +43,11 @@ from app.schemas import (
     WeightConfig,
 )
 from app.converters import (
+    conflict_to_out,
     guest_in_to_solver,
     table_in_to_solver,
     seating_plan_dict_to_out,
+    weight_sweep_dict_to_out,
 )
 from app.importers.wedding_csv import parse_wedding_csv
 from app.database import Base, engine, get_db
@@ -115,6 +128,17 @@ def _validate_guests_and_tables(
         )
 
 
+def _infeasible(e: InfeasibleError) -> HTTPException:
+    """400 response carrying the solver's conflict report."""
+    return HTTPException(
+        status_code=400,
+        detail={
+            "message": str(e),
+            "conflicts": [conflict_to_out(c).dict() for c in e.conflicts],
+        },
+    )
+
+
 # -----------------------------
 # Internal helpers
 # -----------------------------
@@ -193,6 +217,14 @@ def generate_seating(req: GenerateRequest) -> SeatingPlanOut:
             "profile": req.profile,
             "max_attempts": req.maxAttempts,
             "seed": req.seed,
+            "engine": req.engine,
+            "workers": req.workers,
+            "time_budget_ms": req.timeBudgetMs,
+            "target_score": req.targetScore,
+            "stagnation_window": req.stagnationWindow,
+            "hard_must_not": req.hardMustNot,
+            "split_components": req.splitComponents,
+            "pareto": req.pareto,
             "weights": weights_dict,
         },
     )
@@ -205,13 +237,86 @@ def generate_seating(req: GenerateRequest) -> SeatingPlanOut:
             max_attempts=req.maxAttempts,
             seed=req.seed,
             weights=weights_dict,
+            engine=req.engine,
+            engine_options=req.engineOptions,
+            workers=req.workers,
+            time_budget_ms=req.timeBudgetMs,
+            target_score=req.targetScore,
+            stagnation_window=req.stagnationWindow,
+            hard_must_not=req.hardMustNot,
+            split_components=req.splitComponents,
+            pareto=req.pareto,
         )
+    except InfeasibleError as e:
+        raise _infeasible(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
     return seating_plan_dict_to_out(seating_plan_to_dict(plan))
 
 
+@app.post(
+    "/api/seating/conflicts",
+    response_model=List[ConflictOut],
+    tags=["seating"],
+)
+def seating_conflicts(req: GenerateRequest) -> List[ConflictOut]:
+    """
+    Constraint conflicts for a request, found from the constraint graph
+    without running the solver, so data can be fixed before generating.
+    Solver options in the request are ignored.
+    """
+    solver_guests = [guest_in_to_solver(g) for g in req.guests]
+    solver_tables = [table_in_to_solver(t) for t in req.tables]
+
+    try:
+        conflicts = analyse_conflicts(solver_guests, solver_tables)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return [conflict_to_out(c) for c in conflicts]
+
+
+@app.post(
+    "/api/seating/sweep",
+    response_model=WeightSweepOut,
+    tags=["seating"],
+)
+def sweep_seating_weights(req: SweepRequest) -> WeightSweepOut:
+    """
+    Best plan for each of several weight settings (and optionally the
+    Pareto front) from one pool of candidates. The pool is cached, so
+    re-ranking the same guests and tables under new weights is fast.
+    """
+    solver_guests = [guest_in_to_solver(g) for g in req.guests]
+    solver_tables = [table_in_to_solver(t) for t in req.tables]
+
+    logger.debug(
+        "Sweeping seating weights",
+        extra={
+            "profile": req.profile,
+            "seed": req.seed,
+            "pool_size": req.poolSize,
+            "weight_configs": len(req.weightConfigs),
+            "pareto": req.pareto,
+        },
+    )
+
+    try:
+        sweep = sweep_weights(
+            solver_guests,
+            solver_tables,
+            req.weightConfigs,
+            pool_size=req.poolSize,
+            seed=req.seed,
+            pareto=req.pareto,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return weight_sweep_dict_to_out(weight_sweep_to_dict(sweep))
+
+
 # -----------------------------
 # CSV Import
 # -----------------------------
@@ -416,10 +521,19 @@ def generate_seating_for_event(
     event_id: int,
     maxAttempts: int = Query(1000, gt=0),
     seed: Optional[int] = Query(None),
+    engine: str = Query("random"),
+    workers: int = Query(1, gt=0, le=MAX_WORKERS),
+    timeBudgetMs: Optional[int] = Query(None, gt=0),
+    targetScore: Optional[float] = Query(None),
+    stagnationWindow: Optional[int] = Query(None, gt=0),
+    hardMustNot: bool = Query(False),
+    splitComponents: bool = Query(False),
+    pareto: bool = Query(False),
     db: Session = Depends(get_db),
 ) -> SeatingPlanOut:
     """
     Run the solver for a stored event and persist the last plan.
+    With `pareto`, the plan's alternatives are persisted along with it.
 
     Also stores metrics in the Event row if the corresponding columns exist
     (must_not_violations, wants_satisfied, etc.), but does not expose them
@@ -452,6 +566,14 @@ def generate_seating_for_event(
             "profile": db_event.profile,
             "max_attempts": maxAttempts,
             "seed": seed,
+            "engine": engine,
+            "workers": workers,
+            "time_budget_ms": timeBudgetMs,
+            "target_score": targetScore,
+            "stagnation_window": stagnationWindow,
+            "hard_must_not": hardMustNot,
+            "split_components": splitComponents,
+            "pareto": pareto,
             "weights": weights_raw,
         },
     )
@@ -464,7 +586,17 @@ def generate_seating_for_event(
             max_attempts=maxAttempts,
             seed=seed,
             weights=weights_raw,
+            engine=engine,
+            workers=workers,
+            time_budget_ms=timeBudgetMs,
+            target_score=targetScore,
+            stagnation_window=stagnationWindow,
+            hard_must_not=hardMustNot,
+            split_components=splitComponents,
+            pareto=pareto,
         )
+    except InfeasibleError as e:
+        raise _infeasible(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
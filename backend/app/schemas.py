@@ -2,6 +2,8 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from seating_solver.solver import MAX_WORKERS
+
 
 # ---------- Core seating models ----------
 
@@ -10,6 +12,9 @@ class GuestIn(BaseModel):
     name: str
     gender: Optional[str] = None
     maritalStatus: Optional[str] = None
+    partnerId: Optional[str] = None     # guest ID of spouse/partner
+    partyId: Optional[str] = None       # guests sharing a party ID sit at one table
+    partySeat: Optional[int] = None     # if every member has one: fixed seat order
     wantsToSitNextTo: List[str] = Field(default_factory=list)
     mustNotSitNextTo: List[str] = Field(default_factory=list)
     tags: List[str] = Field(default_factory=list)
@@ -40,10 +45,57 @@ class GenerateRequest(BaseModel):
     maxAttempts: int = 1000
     seed: Optional[int] = None
 
+    # "random" (restart only), or restart + "anneal" / "tabu" / "two_phase" /
+    # "partition" / "genetic" / "lns" refinement
+    engine: str = "random"
+    engineOptions: Optional[Dict[str, Any]] = None
+
+    # split the attempt budget across this many processes (at most one per CPU)
+    workers: int = Field(1, ge=1, le=MAX_WORKERS)
+
+    # wall-clock cap; the solver returns the best plan found by the deadline
+    timeBudgetMs: Optional[int] = Field(None, gt=0)
+
+    # stop as soon as a plan's weighted total score is at or below this
+    targetScore: Optional[float] = None
+
+    # stop random restarts after this many attempts without improvement
+    stagnationWindow: Optional[int] = Field(None, gt=0)
+
+    # treat must-not pairs as hard constraints; infeasible input is
+    # rejected with a conflict report instead of being searched
+    hardMustNot: bool = False
+
+    # solve groups of guests with no constraints between them separately
+    # (on separate tables, concurrently with workers > 1) and merge
+    splitComponents: bool = False
+
+    # also return the non-dominated plans seen during the search as
+    # `alternatives`, one per trade-off between the scoring terms
+    pareto: bool = False
+
     # optional for older clients, supports your UI sliders
     weights: Optional[WeightConfig] = None
 
 
+class SweepRequest(BaseModel):
+    guests: List[GuestIn]
+    tables: List[TableIn]
+    profile: str = "wedding_default"
+    seed: Optional[int] = None
+
+    # weight settings to rank the pool under, keyed like the UI sliders
+    # (mustNotWeight, wantsWeight, ...); one best plan is returned per entry
+    weightConfigs: List[Dict[str, float]] = Field(default_factory=list)
+
+    # candidates generated and scored once, then cached for re-ranking;
+    # poolSize x guests may not exceed MAX_POOL_SEATS
+    poolSize: int = Field(2000, ge=1)
+
+    # also return the non-dominated candidates
+    pareto: bool = False
+
+
 class SeatOut(BaseModel):
     seatIndex: int
     guestId: str
@@ -63,10 +115,34 @@ class MetricsOut(BaseModel):
     splitCouples: int
 
 
+class ConflictOut(BaseModel):
+    kind: str
+    guestIds: List[str]
+    message: str
+
+
+class ImprovementOut(BaseModel):
+    attempt: int
+    elapsedMs: float
+    score: float
+
+
 class SeatingPlanOut(BaseModel):
     tables: List[TableOut]
     metrics: MetricsOut
     attemptsMade: int
+    elapsedMs: Optional[float] = None
+    improvementCurve: List[ImprovementOut] = Field(default_factory=list)
+    conflicts: List[ConflictOut] = Field(default_factory=list)
+    alternatives: List["SeatingPlanOut"] = Field(default_factory=list)
+
+
+class WeightSweepOut(BaseModel):
+    plans: List[SeatingPlanOut]
+    pareto: List[SeatingPlanOut] = Field(default_factory=list)
+    poolSize: int
+    cached: bool
+    elapsedMs: float
 
 
 class CsvImportResponse(BaseModel):
@@ -45,10 +45,12 @@ def validate_event_payload(guests: List[GuestIn], tables: List[TableIn]) -> None
         for target in g.mustNotSitNextTo:
             if target not in known_ids:
                 bad_refs.append((g.id, target, "mustNotSitNextTo"))
+        if g.partnerId and g.partnerId not in known_ids:
+            bad_refs.append((g.id, g.partnerId, "partnerId"))
 
     if bad_refs:
         # you can make this more detailed if you want
         raise HTTPException(
             status_code=400,
-            detail=f"Some wants/must-not references point to unknown guest IDs: {bad_refs[:5]}",
+            detail=f"Some wants/must-not/partner references point to unknown guest IDs: {bad_refs[:5]}",
         )
@@ -0,0 +1,114 @@
+# seating_solver/anneal.py
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import List
+
+from .evaluator import PlanEvaluator
+from .models import Weights
+from .parties import party_swap_pairs
+from .problem import Problem
+from .stopping import StopCriteria
+
+
+@dataclass
+class AnnealSchedule:
+    """
+    Geometric cooling schedule for the simulated-annealing phase.
+
+    Temperature falls from `initial_temperature` to `final_temperature`
+    over `steps` proposals. Temperatures are in weighted-score units
+    (a must-not violation costs `Weights.must_not`).
+    """
+    steps: int = 20000
+    initial_temperature: float = 20.0
+    final_temperature: float = 0.05
+    move_probability: float = 0.2   # share of proposals that move a guest to another table
+    party_move_probability: float = 0.1   # share that move a whole party (events with parties)
+
+
+def anneal(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    schedule: AnnealSchedule,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> PlanEvaluator:
+    """
+    Refine a constructed plan with swap / move neighbourhoods under a
+    temperature schedule, using incremental scoring.
+
+    Stops early once `stop` expires or its target is reached.
+    Returns an evaluator holding the best plan seen.
+    """
+    current = PlanEvaluator(problem, seatings, weights)
+    best_score = current.score()
+    best_seatings = [list(s) for s in current.seatings]
+
+    n = problem.num_guests
+    num_tables = problem.num_tables
+    if n < 2 or schedule.steps <= 0:
+        return current
+
+    temperature = schedule.initial_temperature
+    cooling = (
+        (schedule.final_temperature / schedule.initial_temperature) ** (1.0 / schedule.steps)
+        if schedule.initial_temperature > 0 and schedule.final_temperature > 0
+        else 1.0
+    )
+
+    for _ in range(schedule.steps):
+        if stop.expired() or stop.reached(best_score):
+            break
+        pairs = None
+        if problem.parties and rng.random() < schedule.party_move_probability:
+            pairs = party_swap_pairs(current, rng)
+            if pairs is None:
+                temperature *= cooling
+                continue
+            move = False
+            delta = current.delta_swaps(pairs)
+        else:
+            move = num_tables > 1 and rng.random() < schedule.move_probability
+        if move:
+            g = rng.randrange(n)
+            table = rng.randrange(num_tables)
+            if len(current.seatings[current.table_of[g]]) <= 1 or not current.can_move(g, table):
+                temperature *= cooling
+                continue
+            position = rng.randrange(len(current.seatings[table]) + 1)
+            if current.splits_party(table, position):
+                temperature *= cooling
+                continue
+            delta = current.delta_move(g, table, position)
+        elif pairs is None:
+            a = rng.randrange(n)
+            b = rng.randrange(n - 1)
+            if b >= a:
+                b += 1
+            if not current.can_swap(a, b):
+                temperature *= cooling
+                continue
+            delta = current.delta_swap(a, b)
+
+        cost = current.energy(delta)
+        if cost <= 0 or (
+            temperature > 0 and rng.random() < math.exp(-cost / temperature)
+        ):
+            if pairs is not None:
+                current.apply_swaps(pairs)
+            elif move:
+                current.apply_move(g, table, position)
+            else:
+                current.apply_swap(a, b)
+            score = current.score()
+            if score < best_score:
+                best_score = score
+                best_seatings = [list(s) for s in current.seatings]
+
+        temperature *= cooling
+
+    return PlanEvaluator(problem, best_seatings, weights)
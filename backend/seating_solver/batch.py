@@ -0,0 +1,315 @@
+# seating_solver/batch.py
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .models import SeatingMetrics, Weights
+from .problem import Problem
+from .scoring import SCORE_TERMS, unbeatable_from
+
+
+# SeatingMetrics fields, in the column order of BatchEvaluator.metrics_matrix()
+METRIC_FIELDS = (
+    "must_not_violations",
+    "wants_satisfied",
+    "adjacent_singles",
+    "same_gender_adjacencies",
+    "alternating_tables",
+    "split_couples",
+)
+
+
+class BatchEvaluator:
+    """
+    Vectorised metrics for many candidate plans of one Problem at once.
+
+    A batch is an (attempts x seats) integer matrix: each row lists guest
+    indices table by table, with table boundaries given by `table_sizes`
+    (default problem.table_sizes). Every SeatingMetrics field is computed
+    for all rows with array operations over lookup tables (gender,
+    singles, spouses, wants and must-not as n x n boolean matrices), so
+    scoring thousands of candidates is a handful of NumPy calls instead
+    of a Python loop per seat.
+
+    Results match compute_metrics() exactly.
+    """
+
+    def __init__(self, problem: Problem, table_sizes: Optional[List[int]] = None) -> None:
+        self.problem = problem
+        sizes = list(problem.table_sizes if table_sizes is None else table_sizes)
+        self.table_sizes = sizes
+        n = problem.num_guests
+
+        starts = np.cumsum([0] + sizes[:-1]).astype(np.int64)
+        seats = int(sum(sizes))
+        self.num_seats = seats
+        self.starts = starts
+        self.ends = starts + np.asarray(sizes, dtype=np.int64)
+
+        # np.roll by one seat within each table, as seat-position indices
+        table = np.repeat(np.arange(len(sizes)), sizes)
+        offset = np.arange(seats) - starts[table]
+        size = np.asarray(sizes, dtype=np.int64)[table]
+        self.seat_table = table
+        self.right = starts[table] + (offset + 1) % np.maximum(size, 1)
+        self.left = starts[table] + (offset - 1) % np.maximum(size, 1)
+
+        self.gender = np.asarray(problem.gender, dtype=np.int64)
+        self.single = np.asarray(problem.single, dtype=bool)
+        self.wants = np.zeros((n, n), dtype=bool)
+        self.must_not = np.zeros((n, n), dtype=bool)
+        for g in range(n):
+            self.wants[g, list(problem.wants[g])] = True
+            self.must_not[g, list(problem.must_not[g])] = True
+        self.has_wants = self.wants.any(axis=1)
+        self.has_must_not = self.must_not.any(axis=1)
+
+        spouse = np.asarray(problem.spouse, dtype=np.int64)
+        first = np.nonzero(spouse > np.arange(n))[0]
+        self.couples = (first, spouse[first])
+        self.spouse = spouse
+
+        # Seat positions of each table, padded to the largest with its first seat
+        widest = max(sizes, default=0)
+        column = np.arange(widest)
+        self.table_open = column < np.asarray(sizes, dtype=np.int64)[:, None]
+        self.table_seats = np.where(self.table_open, starts[:, None] + column, starts[:, None])
+
+    def to_matrix(self, plans: List[List[List[int]]]) -> np.ndarray:
+        """Stack plans (lists of tables) into a batch matrix."""
+        return np.asarray(
+            [[g for seats in plan for g in seats] for plan in plans], dtype=np.int64
+        ).reshape(len(plans), self.num_seats)
+
+    def to_seatings(self, row) -> List[List[int]]:
+        """One batch row (or flat list of guests) back as a list of tables."""
+        guests = np.asarray(row).tolist()
+        return [guests[s:e] for s, e in zip(self.starts.tolist(), self.ends.tolist())]
+
+    def _per_table(self, per_seat: np.ndarray) -> np.ndarray:
+        """Sum a (attempts x seats) array over each table's seats."""
+        totals = np.zeros((per_seat.shape[0], per_seat.shape[1] + 1), dtype=np.int64)
+        np.cumsum(per_seat, axis=1, out=totals[:, 1:])
+        return totals[:, self.ends] - totals[:, self.starts]
+
+    def count(self, field: str, batch: np.ndarray) -> np.ndarray:
+        """One SeatingMetrics field for every row of `batch`."""
+        batch = np.asarray(batch, dtype=np.int64)
+        attempts = batch.shape[0]
+        if attempts == 0 or self.num_seats == 0:
+            value = len(self.table_sizes) if field == "alternating_tables" else 0
+            return np.full(attempts, value, dtype=np.int64)
+
+        if field == "must_not_violations":
+            refused = self.must_not[batch, batch[:, self.left]] | self.must_not[batch, batch[:, self.right]]
+            return (refused & self.has_must_not[batch]).sum(axis=1)
+        if field == "wants_satisfied":
+            wanted = self.wants[batch, batch[:, self.left]] | self.wants[batch, batch[:, self.right]]
+            return (wanted & self.has_wants[batch]).sum(axis=1)
+        if field == "adjacent_singles":
+            return (self.single[batch] & self.single[batch[:, self.right]]).sum(axis=1)
+        if field in ("same_gender_adjacencies", "alternating_tables"):
+            gender = self.gender[batch]
+            same = (gender != 0) & (gender == self.gender[batch[:, self.right]])
+            if field == "same_gender_adjacencies":
+                return same.sum(axis=1)
+            small = np.asarray(self.table_sizes) <= 1
+            return ((self._per_table(same) == 0) | small).sum(axis=1)
+        if field == "split_couples":
+            first, second = self.couples
+            if not len(first):
+                return np.zeros(attempts, dtype=np.int64)
+            table_of = np.full((attempts, self.problem.num_guests), -1, dtype=np.int64)
+            np.put_along_axis(table_of, batch, np.broadcast_to(self.seat_table, batch.shape), axis=1)
+            ta, tb = table_of[:, first], table_of[:, second]
+            return ((ta != -1) & (tb != -1) & (ta != tb)).sum(axis=1)
+        raise ValueError(f"Unknown metric: {field}")
+
+    def metrics_matrix(self, batch: np.ndarray) -> np.ndarray:
+        """(attempts x 6) metric counts, columns in METRIC_FIELDS order."""
+        batch = np.asarray(batch, dtype=np.int64)
+        out = np.zeros((batch.shape[0], len(METRIC_FIELDS)), dtype=np.int64)
+        for k, field in enumerate(METRIC_FIELDS):
+            out[:, k] = self.count(field, batch)
+        return out
+
+    def _seat_terms(self, field: str, batch: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """count(`field`)'s per-seat terms at `seats` (positions, one row per plan)."""
+        rows = np.arange(batch.shape[0])[:, None]
+        guest = batch[rows, seats]
+        right = batch[rows, self.right[seats]]
+        if field == "must_not_violations":
+            refused = self.must_not[guest, batch[rows, self.left[seats]]] | self.must_not[guest, right]
+            return refused & self.has_must_not[guest]
+        if field == "wants_satisfied":
+            wanted = self.wants[guest, batch[rows, self.left[seats]]] | self.wants[guest, right]
+            return wanted & self.has_wants[guest]
+        if field == "adjacent_singles":
+            return self.single[guest] & self.single[right]
+        gender = self.gender[guest]
+        return (gender != 0) & (gender == self.gender[right])
+
+    def swap_metrics(
+        self,
+        batch: np.ndarray,
+        metrics: np.ndarray,
+        a: np.ndarray,
+        b: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Swap seats a[i] and b[i] in row i of `batch`, given the rows'
+        current metrics_matrix() `metrics`. Returns the swapped batch and
+        its metrics_matrix().
+
+        Only the seats around each swap and the two tables involved are
+        re-counted, so scoring a round of swap proposals costs far less
+        than metrics_matrix() on the swapped plans. Results match
+        metrics_matrix() exactly.
+        """
+        batch = np.asarray(batch, dtype=np.int64)
+        rows = np.arange(batch.shape[0])
+        swapped = batch.copy()
+        swapped[rows, a] = batch[rows, b]
+        swapped[rows, b] = batch[rows, a]
+        if self.num_seats < self.problem.num_guests:
+            # Unseated guests make split couples non-local; count in full
+            return swapped, self.metrics_matrix(swapped)
+
+        # Seats whose neighbours changed; adjacencies are keyed by their left seat
+        seats = np.stack([self.left[a], a, self.right[a], self.left[b], b, self.right[b]], axis=1)
+        pairs = seats[:, [0, 1, 3, 4]]
+        out = np.array(metrics, dtype=np.int64)
+        for k, field in enumerate(METRIC_FIELDS[:4]):
+            at = seats if k < 2 else pairs
+            first = np.ones(at.shape, dtype=bool)
+            for j in range(1, at.shape[1]):
+                first[:, j] = (at[:, :j] != at[:, j:j + 1]).all(axis=1)
+            change = self._seat_terms(field, swapped, at).astype(np.int64)
+            change -= self._seat_terms(field, batch, at)
+            change *= first
+            out[:, k] += change.sum(axis=1)
+
+        # Tables without same-gender adjacencies, before and after, for the
+        # one or two tables touched (`change` is left at the adjacencies')
+        table_a, table_b = self.seat_table[a], self.seat_table[b]
+        moved = table_a != table_b
+        sizes = np.asarray(self.table_sizes, dtype=np.int64)
+        for table, counted in ((table_a, True), (table_b, moved)):
+            same = self._seat_terms("same_gender_adjacencies", batch, self.table_seats[table])
+            before = (same & self.table_open[table]).sum(axis=1)
+            after = before + (change * (self.seat_table[pairs] == table[:, None])).sum(axis=1)
+            small = sizes[table] <= 1
+            alternated = ((after == 0) | small).astype(np.int64) - ((before == 0) | small)
+            out[:, 4] += alternated * counted
+
+        # A guest changing tables splits from or rejoins their spouse
+        guest_a, guest_b = batch[rows, a], batch[rows, b]
+        for guest, other, source, target in (
+            (guest_a, guest_b, table_a, table_b),
+            (guest_b, guest_a, table_b, table_a),
+        ):
+            spouse = self.spouse[guest]
+            counted = moved & (spouse != -1) & (spouse != other)
+            was_with = ((batch[rows[:, None], self.table_seats[source]] == spouse[:, None])
+                        & self.table_open[source]).any(axis=1)
+            is_with = ((swapped[rows[:, None], self.table_seats[target]] == spouse[:, None])
+                       & self.table_open[target]).any(axis=1)
+            out[:, 5] += (was_with.astype(np.int64) - is_with) * counted
+        return swapped, out
+
+    def metrics(self, batch: np.ndarray) -> List[SeatingMetrics]:
+        """SeatingMetrics for every row of `batch`."""
+        return [
+            SeatingMetrics(**dict(zip(METRIC_FIELDS, row)))
+            for row in self.metrics_matrix(batch).tolist()
+        ]
+
+    def scores(self, batch: np.ndarray, weights: Weights) -> np.ndarray:
+        """
+        (attempts x 5) scoring tuples (see scoring_tuple), one row per plan;
+        compare rows lexicographically.
+        """
+        return score_matrix(self.metrics_matrix(batch), weights)
+
+    def scores_if_better(
+        self,
+        batch: np.ndarray,
+        weights: Weights,
+        best_score: Optional[tuple],
+        lower_bound: Optional[tuple] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lazy scores(): terms are computed in priority order, each only for
+        rows that can still beat `best_score` (see score_if_better), and
+        zero-weight terms are skipped.
+
+        Returns the (attempts x 5) scores and a mask of the rows that beat
+        `best_score`; only those rows' scores are complete.
+        """
+        batch = np.asarray(batch, dtype=np.int64)
+        attempts = batch.shape[0]
+        scores = np.zeros((attempts, len(SCORE_TERMS)), dtype=np.int64)
+        alive = np.ones(attempts, dtype=bool)
+        tied = np.ones(attempts, dtype=bool)
+        settled = len(SCORE_TERMS)
+        if best_score is not None:
+            settled = unbeatable_from(best_score, lower_bound)
+
+        for k, (field, attr, sign) in enumerate(SCORE_TERMS):
+            rows = np.nonzero(alive)[0]
+            if not len(rows):
+                break
+            weight = getattr(weights, attr)
+            if weight:
+                scores[rows, k] = sign * weight * self.count(field, batch[rows])
+            if best_score is None:
+                continue
+            values = scores[rows, k]
+            was_tied = tied[rows]
+            alive[rows[was_tied & (values > best_score[k])]] = False
+            tied[rows] = was_tied & (values == best_score[k])
+            if k + 1 >= settled:
+                alive &= ~tied
+        return scores, alive
+
+
+def random_plans(
+    problem: Problem,
+    layout: List[List[int]],
+    gen: np.random.Generator,
+    count: int,
+) -> np.ndarray:
+    """
+    `count` random-restart plans as a batch matrix.
+
+    `layout` gives, seat by seat, a slot in the gender pools: slots below
+    len(problem.males) are males, the rest females. Each row fills the
+    slots from an independent permutation of each pool.
+    """
+    males = gen.permuted(np.tile(np.asarray(problem.males, dtype=np.int64), (count, 1)), axis=1)
+    females = gen.permuted(np.tile(np.asarray(problem.females, dtype=np.int64), (count, 1)), axis=1)
+    pool = np.concatenate([males, females], axis=1)
+    slots = np.asarray([slot for seats in layout for slot in seats], dtype=np.int64)
+    return pool[:, slots]
+
+
+def score_matrix(metrics: np.ndarray, weights: Weights) -> np.ndarray:
+    """scoring_tuple() for every row of a metrics_matrix() result."""
+    columns: Dict[str, int] = {name: i for i, name in enumerate(METRIC_FIELDS)}
+    return np.stack(
+        [
+            weights.must_not * metrics[:, columns["must_not_violations"]],
+            -weights.wants * metrics[:, columns["wants_satisfied"]],
+            -weights.adjacent_singles * metrics[:, columns["adjacent_singles"]],
+            -weights.alternating * metrics[:, columns["alternating_tables"]],
+            -weights.split_couples * metrics[:, columns["split_couples"]],
+        ],
+        axis=1,
+    )
+
+
+def best_row(scores: np.ndarray) -> int:
+    """Index of the lexicographically smallest score row."""
+    return int(np.lexsort(scores.T[::-1])[0])
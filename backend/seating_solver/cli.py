@@ -5,7 +5,7 @@ import sys
 from typing import Any, Dict, List
 
 from .models import guest_from_dict, table_from_dict
-from .solver import solve, seating_plan_to_dict
+from .solver import ENGINES, solve, seating_plan_to_dict
 
 
 def main(argv: List[str] | None = None) -> None:
@@ -34,6 +34,52 @@ def main(argv: List[str] | None = None) -> None:
         default="wedding_default",
         help='Seating profile name (default: "wedding_default")',
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default="random",
+        choices=ENGINES,
+        help='Search engine (default: "random")',
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for parallel restarts, at most one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "--time-budget-ms",
+        type=int,
+        default=None,
+        help="Stop after this many milliseconds and return the best plan so far",
+    )
+    parser.add_argument(
+        "--target-score",
+        type=float,
+        default=None,
+        help="Stop as soon as a plan's weighted total score is at or below this",
+    )
+    parser.add_argument(
+        "--stagnation-window",
+        type=int,
+        default=None,
+        help="Stop random restarts after this many attempts without improvement",
+    )
+    parser.add_argument(
+        "--hard-must-not",
+        action="store_true",
+        help="Treat must-not pairs as hard constraints (fail if infeasible)",
+    )
+    parser.add_argument(
+        "--split-components",
+        action="store_true",
+        help="Solve unconnected guest groups separately and merge the plans",
+    )
+    parser.add_argument(
+        "--pareto",
+        action="store_true",
+        help="Also output the non-dominated plans found as alternatives",
+    )
     args = parser.parse_args(argv)
 
     # Read JSON input
@@ -55,6 +101,14 @@ def main(argv: List[str] | None = None) -> None:
         profile=args.profile,
         max_attempts=args.max_attempts,
         seed=args.seed,
+        engine=args.engine,
+        workers=args.workers,
+        time_budget_ms=args.time_budget_ms,
+        target_score=args.target_score,
+        stagnation_window=args.stagnation_window,
+        hard_must_not=args.hard_must_not,
+        split_components=args.split_components,
+        pareto=args.pareto,
     )
     out = seating_plan_to_dict(plan)
 
@@ -0,0 +1,89 @@
+# seating_solver/components.py
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from .problem import Problem
+
+
+# A packed sub-problem: (guest indices, table indices) of the full Problem
+Group = Tuple[List[int], List[int]]
+
+
+def constraint_components(problem: Problem) -> List[List[int]]:
+    """
+    Connected components of the constraint graph (wants, must-not,
+    couple and party edges, in either direction), largest first. Guests in different
+    components share no constraint.
+    """
+    n = problem.num_guests
+    parent = list(range(n))
+
+    def find(g: int) -> int:
+        while parent[g] != g:
+            parent[g] = parent[parent[g]]
+            g = parent[g]
+        return g
+
+    def union(a: int, b: int) -> None:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+
+    for g in range(n):
+        for x in problem.wants[g]:
+            union(g, x)
+        for x in problem.must_not[g]:
+            union(g, x)
+        if problem.spouse[g] != -1:
+            union(g, problem.spouse[g])
+    for members in problem.parties:
+        for g in members[1:]:
+            union(members[0], g)
+
+    components: dict = {}
+    for g in range(n):
+        components.setdefault(find(g), []).append(g)
+    return sorted(components.values(), key=len, reverse=True)
+
+
+def pack_components(problem: Problem, components: List[List[int]]) -> Optional[List[Group]]:
+    """
+    Pack components onto whole tables, largest component first.
+
+    A group takes tables (largest first) until it has room for the next
+    component and is closed once its spare seats are down to its share of
+    the event's spare seats; small components fill the gaps. Leftover
+    tables join the last group. Returns None if a component cannot be
+    placed, and a single group when nothing could be split off.
+    """
+    order = sorted(range(problem.num_tables), key=lambda t: -problem.tables[t].capacity)
+    total = sum(problem.tables[t].capacity for t in order)
+    slack = total - problem.num_guests
+
+    groups: List[Group] = []
+    guests: List[int] = []
+    tables: List[int] = []
+    room = capacity = 0
+    next_table = 0
+    for component in components:
+        while room < len(component):
+            if next_table == len(order):
+                return None
+            t = order[next_table]
+            next_table += 1
+            tables.append(t)
+            room += problem.tables[t].capacity
+            capacity += problem.tables[t].capacity
+        guests.extend(component)
+        room -= len(component)
+        if room * total <= slack * capacity:
+            groups.append((guests, tables))
+            guests, tables = [], []
+            room = capacity = 0
+
+    if guests:
+        groups.append((guests, tables))
+    if groups:
+        groups[-1][1].extend(order[next_table:])
+    return groups
@@ -0,0 +1,67 @@
+# seating_solver/conflicts.py
+from __future__ import annotations
+
+from typing import Dict, List
+
+from .feasibility import check_feasibility
+from .models import Conflict
+from .problem import Problem
+
+
+def wants_conflicts(problem: Problem) -> List[Conflict]:
+    """
+    "Wants" that cannot all be satisfied, each with a minimal set of guests:
+
+      - wants vs must-not: a guest wants to sit next to someone that one
+        of the two refuses, so satisfying the want is a violation
+      - oversubscribed: three or more guests whose only wish is the same
+        guest, who has at most two neighbours
+
+    A wish is satisfied by one wanted neighbour, so long wants chains
+    split across tables without leaving anyone unsatisfied and are not
+    reported.
+    """
+    conflicts: List[Conflict] = []
+    ids = problem.ids
+    names = [g.name for g in problem.guests]
+
+    seen = set()
+    for g in range(problem.num_guests):
+        for x in sorted(problem.wants[g]):
+            if x == g or (x, g) in seen:
+                continue
+            if x in problem.must_not[g] or g in problem.must_not[x]:
+                seen.add((g, x))
+                conflicts.append(Conflict(
+                    kind="wants_must_not",
+                    guest_ids=[ids[g], ids[x]],
+                    message=f"{names[g]} wants to sit next to {names[x]}, but one refuses the other",
+                ))
+
+    seats = 1 if problem.table_sizes and max(problem.table_sizes) <= 2 else 2
+    only_wish: Dict[int, List[int]] = {}
+    for g in range(problem.num_guests):
+        wished = problem.wants[g] - {g}
+        if len(wished) == 1:
+            only_wish.setdefault(next(iter(wished)), []).append(g)
+    for target, wanters in sorted(only_wish.items()):
+        if len(wanters) > seats:
+            core = wanters[:seats + 1]
+            conflicts.append(Conflict(
+                kind="oversubscribed",
+                guest_ids=[ids[target]] + [ids[g] for g in core],
+                message=(
+                    f"{len(wanters)} guests only want to sit next to {names[target]}, "
+                    f"who has {seats} neighbour(s)"
+                ),
+            ))
+    return conflicts
+
+
+def find_conflicts(problem: Problem) -> List[Conflict]:
+    """
+    Constraint conflicts found from the constraint graph alone, without
+    running the solver: must-not conflicts (see check_feasibility) first,
+    then unsatisfiable wants.
+    """
+    return check_feasibility(problem) + wants_conflicts(problem)
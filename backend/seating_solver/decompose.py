@@ -0,0 +1,223 @@
+# seating_solver/decompose.py
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .evaluator import PlanEvaluator
+from .exact import OrderCache, exact_table_order
+from .models import Weights
+from .parties import alternate_genders, has_fixed_party, seat_table
+from .problem import Problem
+from .stopping import StopCriteria
+
+
+@dataclass
+class TwoPhaseConfig:
+    """
+    Settings for the two-phase engine.
+
+    Phase 1 runs `partition_iterations` swap proposals over table
+    membership; phase 2 runs `ordering_iterations` seat swaps per table.
+    """
+    partition_iterations: int = 20000
+    ordering_iterations: int = 300
+
+
+def pair_affinities(problem: Problem, weights: Weights) -> List[Dict[int, int]]:
+    """
+    Symmetric same-table affinity between related guests.
+
+    Sharing a table is what makes a "wants" satisfiable and a "must not"
+    violable, and is what stops a couple counting as split, so:
+      +wants weight     per direction of a "wants" pair
+      -must_not weight  per direction of a "must not" pair
+      -split_couples    for a couple (sharing a table forfeits that reward)
+    Unrelated pairs have affinity 0 and are not stored.
+    """
+    n = problem.num_guests
+    affinity: List[Dict[int, int]] = [{} for _ in range(n)]
+
+    def add(a: int, b: int, w: int) -> None:
+        if a == b or not w:
+            return
+        affinity[a][b] = affinity[a].get(b, 0) + w
+        affinity[b][a] = affinity[b].get(a, 0) + w
+
+    for a in range(n):
+        for b in problem.wants[a]:
+            add(a, b, weights.wants)
+        for b in problem.must_not[a]:
+            add(a, b, -weights.must_not)
+        b = problem.spouse[a]
+        if b > a:
+            add(a, b, -weights.split_couples)
+
+    for a in range(n):
+        for b in [b for b, w in affinity[a].items() if w == 0]:
+            del affinity[a][b]
+    return affinity
+
+
+# -------------------------
+# Phase 1: table membership
+# -------------------------
+
+def table_swap_gain(
+    affinity: List[Dict[int, int]],
+    table_of: List[int],
+    a: int,
+    b: int,
+) -> int:
+    """Change in same-table affinity if a and b swap tables."""
+    ta, tb = table_of[a], table_of[b]
+    gain = 0
+    for g, src, dst, other in ((a, ta, tb, b), (b, tb, ta, a)):
+        for x, w in affinity[g].items():
+            if x == other:
+                continue
+            tx = table_of[x]
+            if tx == dst:
+                gain += w
+            elif tx == src:
+                gain -= w
+    return gain
+
+
+def partition_tables(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    iterations: int,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> List[List[int]]:
+    """
+    Improve table membership for the inter-table terms only.
+
+    Swaps same-gender guests between tables, so table sizes and each
+    table's gender mix are kept from the starting plan. Candidate swaps
+    are targeted: a guest is pulled towards the table of someone they have
+    positive affinity with, or pushed away from a negative one.
+    """
+    affinity = pair_affinities(problem, weights)
+    members = [list(s) for s in seatings]
+    table_of = [-1] * problem.num_guests
+    for t, seats in enumerate(members):
+        for g in seats:
+            table_of[g] = t
+
+    # Party members change tables only as a unit, which phase 1 does not do
+    related = [
+        g for g in range(problem.num_guests)
+        if affinity[g] and problem.party[g] == -1
+    ]
+    partners = [list(a) for a in affinity]
+    num_tables = len(members)
+    if not related or num_tables < 2:
+        return members
+
+    gender = problem.gender
+    for _ in range(iterations):
+        if stop.expired():
+            break
+
+        a = rng.choice(related)
+        x = rng.choice(partners[a])
+        ta = table_of[a]
+        if affinity[a][x] > 0:
+            target = table_of[x]
+            if target == ta:
+                continue
+        else:
+            if table_of[x] != ta:
+                continue
+            target = rng.randrange(num_tables - 1)
+            if target >= ta:
+                target += 1
+
+        pool = members[target]
+        b = pool[rng.randrange(len(pool))] if pool else -1
+        if b == -1 or gender[b] != gender[a] or problem.party[b] != -1:
+            continue
+
+        gain = table_swap_gain(affinity, table_of, a, b)
+        if gain > 0 or (gain == 0 and rng.random() < 0.1):
+            members[ta][members[ta].index(a)] = b
+            pool[pool.index(b)] = a
+            table_of[a], table_of[b] = target, ta
+
+    return members
+
+
+# -------------------------
+# Phase 2: in-table order
+# -------------------------
+
+def order_table(
+    problem: Problem,
+    members: List[int],
+    weights: Weights,
+    iterations: int,
+    rng: random.Random,
+    cache: Optional[OrderCache] = None,
+) -> List[int]:
+    """
+    Optimise the circular order of one table's guests for the adjacency
+    terms. Touches nothing outside the table, so tables are independent.
+
+    Small tables are ordered exactly (see exact_table_order); larger ones
+    by in-table seat swaps, which never break up a fixed-order party.
+    """
+    exact = exact_table_order(problem, members, weights, cache)
+    if exact is not None:
+        return exact
+
+    if has_fixed_party(problem, members):
+        seats = seat_table(problem, members, rng)
+    else:
+        seats = alternate_genders(problem, members)
+    if len(seats) < 3:
+        return seats
+
+    evaluator = PlanEvaluator(problem, [seats], weights)
+    n = len(seats)
+    for _ in range(iterations):
+        a = evaluator.seatings[0][rng.randrange(n)]
+        b = evaluator.seatings[0][rng.randrange(n)]
+        if a == b or not evaluator.can_swap(a, b):
+            continue
+        if evaluator.energy(evaluator.delta_swap(a, b)) <= 0:
+            evaluator.apply_swap(a, b)
+    return evaluator.seatings[0]
+
+
+def two_phase(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    config: TwoPhaseConfig,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> PlanEvaluator:
+    """
+    Decomposed engine: phase 1 re-partitions guests into tables for the
+    inter-table terms, phase 2 orders each table on its own.
+
+    Returns whichever of the starting plan and the decomposed plan scores
+    better.
+    """
+    members = partition_tables(
+        problem, seatings, weights, config.partition_iterations, rng, stop
+    )
+    cache: OrderCache = {}
+    ordered = [
+        m if stop.expired()
+        else order_table(problem, m, weights, config.ordering_iterations, rng, cache)
+        for m in members
+    ]
+
+    start = PlanEvaluator(problem, seatings, weights)
+    result = PlanEvaluator(problem, ordered, weights)
+    return result if result.score() <= start.score() else start
@@ -0,0 +1,342 @@
+# seating_solver/evaluator.py
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import SeatingMetrics, Weights
+from .problem import Problem
+from .scoring import DEFAULT_WEIGHTS, scalar_score, scoring_tuple
+
+
+# Metric deltas are plain tuples in SeatingMetrics field order:
+#   (must_not_violations, wants_satisfied, adjacent_singles,
+#    same_gender_adjacencies, alternating_tables, split_couples)
+Delta = Tuple[int, int, int, int, int, int]
+
+ZERO_DELTA: Delta = (0, 0, 0, 0, 0, 0)
+
+# A region of a table to rescore: (person positions, edge positions).
+# Person terms (must-not, wants) depend on both neighbours of a seat;
+# edge terms (singles, same gender) depend on the pair (i, i + 1).
+Region = Tuple[Set[int], Set[int]]
+
+# Moves change table sizes, so seat positions shift; tables this small
+# (before the move) are simply rescored in full.
+_SMALL_TABLE = 5
+
+
+def _near(pos: int, n: int) -> Set[int]:
+    return {(pos - 1) % n, pos % n, (pos + 1) % n}
+
+
+def _edges(pos: int, n: int) -> Set[int]:
+    return {(pos - 1) % n, pos % n}
+
+
+def _whole(n: int) -> Region:
+    return set(range(n)), set(range(n))
+
+
+def _alternating(n: int, same_gender: int) -> int:
+    return 1 if n <= 1 or same_gender == 0 else 0
+
+
+class PlanEvaluator:
+    """
+    Holds the current state of a plan and scores local edits incrementally.
+
+    `delta_swap` / `delta_move` return the metric delta of an edit by
+    rescoring only the seats next to the guests involved (and the couples
+    they belong to), so a query costs O(degree) rather than O(guests).
+    `apply_swap` / `apply_move` perform the edit and update the metrics.
+    """
+
+    def __init__(
+        self,
+        problem: Problem,
+        seatings: List[List[int]],
+        weights: Weights = DEFAULT_WEIGHTS,
+    ) -> None:
+        self.problem = problem
+        self.weights = weights
+        self.seatings: List[List[int]] = [list(s) for s in seatings]
+
+        self.table_of = [-1] * problem.num_guests
+        self.seat_of = [-1] * problem.num_guests
+        for t in range(len(self.seatings)):
+            self._reindex(t)
+
+        self.table_same_gender: List[int] = []
+        must_not = wants = singles = same_gender = alternating = 0
+        for seats in self.seatings:
+            mn, w, si, sg = self._terms(seats, _whole(len(seats)))
+            must_not += mn
+            wants += w
+            singles += si
+            same_gender += sg
+            alternating += _alternating(len(seats), sg)
+            self.table_same_gender.append(sg)
+
+        split = self._split_count(range(problem.num_guests))
+        self.counts: List[int] = [must_not, wants, singles, same_gender, alternating, split]
+
+    # -------------------------
+    # Local scoring primitives
+    # -------------------------
+
+    def _terms(self, seats: List[int], region: Region) -> Tuple[int, int, int, int]:
+        p = self.problem
+        n = len(seats)
+        persons, edges = region
+        must_not = wants = singles = same_gender = 0
+        for i in persons:
+            g = seats[i]
+            left = seats[(i - 1) % n]
+            right = seats[(i + 1) % n]
+            mn = p.must_not[g]
+            if mn and (left in mn or right in mn):
+                must_not += 1
+            w = p.wants[g]
+            if w and (left in w or right in w):
+                wants += 1
+        for i in edges:
+            a = seats[i]
+            b = seats[(i + 1) % n]
+            if p.single[a] and p.single[b]:
+                singles += 1
+            code = p.gender[a]
+            if code and code == p.gender[b]:
+                same_gender += 1
+        return must_not, wants, singles, same_gender
+
+    def _split_count(self, guests: Iterable[int]) -> int:
+        """Split couples among the couples that include any of `guests`."""
+        spouse = self.problem.spouse
+        table_of = self.table_of
+        couples = {(min(g, spouse[g]), max(g, spouse[g])) for g in guests if spouse[g] != -1}
+        return sum(
+            1 for a, b in couples
+            if table_of[a] != -1 and table_of[b] != -1 and table_of[a] != table_of[b]
+        )
+
+    def _reindex(self, t: int, start: int = 0) -> None:
+        seats = self.seatings[t]
+        for i in range(start, len(seats)):
+            self.table_of[seats[i]] = t
+            self.seat_of[seats[i]] = i
+
+    # -------------------------
+    # Raw edits (no scoring)
+    # -------------------------
+
+    def _swap(self, a: int, b: int) -> None:
+        ta, pa = self.table_of[a], self.seat_of[a]
+        tb, pb = self.table_of[b], self.seat_of[b]
+        self.seatings[ta][pa] = b
+        self.seatings[tb][pb] = a
+        self.table_of[a], self.seat_of[a] = tb, pb
+        self.table_of[b], self.seat_of[b] = ta, pa
+
+    def _move(self, g: int, table: int, position: int) -> None:
+        src, pos = self.table_of[g], self.seat_of[g]
+        self.seatings[src].pop(pos)
+        self.seatings[table].insert(position, g)
+        self._reindex(src, pos)
+        self._reindex(table, position)
+
+    # -------------------------
+    # Scored edits
+    # -------------------------
+
+    def _edit(self, before: Dict[int, Region], after: Dict[int, Region],
+              guests: Tuple[int, ...], do: Callable[[], None],
+              undo: Callable[[], None], commit: bool) -> Delta:
+        """
+        Score `before` regions, run `do`, score `after` regions and derive
+        the delta. Keeps the edit if `commit`, otherwise runs `undo`.
+        """
+        sizes = {t: len(self.seatings[t]) for t in before}
+        old = {t: self._terms(self.seatings[t], r) for t, r in before.items()}
+        old_split = self._split_count(guests)
+
+        do()
+
+        new = {t: self._terms(self.seatings[t], r) for t, r in after.items()}
+        new_split = self._split_count(guests)
+
+        terms = [0, 0, 0, 0]
+        alternating = 0
+        new_sg: Dict[int, int] = {}
+        for t in before:
+            for k in range(4):
+                terms[k] += new[t][k] - old[t][k]
+            sg = self.table_same_gender[t] + new[t][3] - old[t][3]
+            new_sg[t] = sg
+            alternating += (
+                _alternating(len(self.seatings[t]), sg)
+                - _alternating(sizes[t], self.table_same_gender[t])
+            )
+
+        delta: Delta = (terms[0], terms[1], terms[2], terms[3], alternating, new_split - old_split)
+
+        if commit:
+            for t, sg in new_sg.items():
+                self.table_same_gender[t] = sg
+            for k in range(6):
+                self.counts[k] += delta[k]
+        else:
+            undo()
+        return delta
+
+    def _swap_edit(self, a: int, b: int, commit: bool) -> Delta:
+        if a == b:
+            return ZERO_DELTA
+        regions: Dict[int, Region] = {}
+        for g in (a, b):
+            t = self.table_of[g]
+            n = len(self.seatings[t])
+            persons, edges = regions.setdefault(t, (set(), set()))
+            persons.update(_near(self.seat_of[g], n))
+            edges.update(_edges(self.seat_of[g], n))
+        # Positions do not shift on a swap, so the same regions apply after
+        return self._edit(
+            regions, regions, (a, b),
+            lambda: self._swap(a, b), lambda: self._swap(a, b), commit,
+        )
+
+    def _move_edit(self, g: int, table: int, position: int, commit: bool) -> Delta:
+        src, pos = self.table_of[g], self.seat_of[g]
+        if table == src:
+            raise ValueError("Moves must target a different table; use a swap instead.")
+        n = len(self.seatings[src])
+        m = len(self.seatings[table])
+        if not 0 <= position <= m:
+            raise ValueError(f"Position {position} is outside table of {m} seats.")
+
+        if n <= _SMALL_TABLE:
+            src_before, src_after = _whole(n), _whole(n - 1)
+        else:
+            closed = (pos - 1) % (n - 1)
+            src_before = (_near(pos, n), _edges(pos, n))
+            src_after = ({closed, pos % (n - 1)}, {closed})
+
+        if m <= _SMALL_TABLE:
+            dst_before, dst_after = _whole(m), _whole(m + 1)
+        else:
+            gap = (position - 1) % m
+            dst_before = ({gap, position % m}, {gap})
+            dst_after = (_near(position, m + 1), _edges(position, m + 1))
+
+        return self._edit(
+            {src: src_before, table: dst_before},
+            {src: src_after, table: dst_after},
+            (g,),
+            lambda: self._move(g, table, position),
+            lambda: self._move(g, src, pos),
+            commit,
+        )
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    def delta_swap(self, a: int, b: int) -> Delta:
+        """Metric delta of swapping the seats of guests a and b."""
+        return self._swap_edit(a, b, commit=False)
+
+    def apply_swap(self, a: int, b: int) -> Delta:
+        """Swap the seats of guests a and b and update the metrics."""
+        return self._swap_edit(a, b, commit=True)
+
+    def delta_swaps(self, pairs: List[Tuple[int, int]]) -> Delta:
+        """Metric delta of a sequence of swaps, e.g. a whole party's."""
+        total = ZERO_DELTA
+        for a, b in pairs:
+            total = tuple(t + d for t, d in zip(total, self._swap_edit(a, b, commit=True)))
+        for a, b in reversed(pairs):
+            self._swap_edit(a, b, commit=True)
+        return total
+
+    def apply_swaps(self, pairs: List[Tuple[int, int]]) -> Delta:
+        """Perform a sequence of swaps and update the metrics."""
+        total = ZERO_DELTA
+        for a, b in pairs:
+            total = tuple(t + d for t, d in zip(total, self._swap_edit(a, b, commit=True)))
+        return total
+
+    def can_swap(self, a: int, b: int) -> bool:
+        """
+        True if swapping a and b keeps every party together: party members
+        only change tables as a unit (see parties.party_swap_pairs) and
+        members of a fixed-order party keep their seats.
+        """
+        p = self.problem
+        if p.party[a] == -1 and p.party[b] == -1:
+            return True
+        if self.table_of[a] != self.table_of[b]:
+            return False
+        return not (
+            (p.party[a] != -1 and p.party_fixed[p.party[a]])
+            or (p.party[b] != -1 and p.party_fixed[p.party[b]])
+        )
+
+    def splits_party(self, table: int, position: int) -> bool:
+        """True if inserting a guest at `position` of `table` splits a fixed party."""
+        seats = self.seatings[table]
+        if not seats:
+            return False
+        p = self.problem
+        left = seats[(position - 1) % len(seats)]
+        right = seats[position % len(seats)]
+        k = p.party[left]
+        if k == -1 or k != p.party[right] or not p.party_fixed[k]:
+            return False
+        order = p.parties[k]
+        return order.index(right) == order.index(left) + 1
+
+    def can_move(self, g: int, table: int) -> bool:
+        """
+        True if guest g can move to `table` without exceeding its capacity.
+        Party members never move on their own.
+        """
+        return (
+            table != self.table_of[g]
+            and len(self.seatings[table]) < self.problem.tables[table].capacity
+            and self.problem.party[g] == -1
+        )
+
+    def delta_move(self, g: int, table: int, position: int) -> Delta:
+        """
+        Metric delta of moving guest g to another `table`, inserted at
+        `position` (0..len(table)).
+        """
+        return self._move_edit(g, table, position, commit=False)
+
+    def apply_move(self, g: int, table: int, position: int) -> Delta:
+        """Move guest g to `table` at `position` and update the metrics."""
+        if not self.can_move(g, table):
+            raise ValueError("Target table is full or is the guest's current table.")
+        return self._move_edit(g, table, position, commit=True)
+
+    def metrics(self) -> SeatingMetrics:
+        c = self.counts
+        return SeatingMetrics(
+            must_not_violations=c[0],
+            wants_satisfied=c[1],
+            adjacent_singles=c[2],
+            same_gender_adjacencies=c[3],
+            alternating_tables=c[4],
+            split_couples=c[5],
+        )
+
+    def score(self) -> tuple:
+        """scoring_tuple() of the current plan."""
+        return self.score_delta(tuple(self.counts))
+
+    def score_delta(self, delta: Delta) -> tuple:
+        """scoring_tuple() of a metric delta (the tuple is linear in the metrics)."""
+        return scoring_tuple(delta[0], delta[1], delta[4], delta[5], delta[2], self.weights)
+
+    def energy(self, delta: Optional[Delta] = None) -> float:
+        """Scalar weighted score of the plan, or of a delta if one is given."""
+        return scalar_score(self.score_delta(tuple(self.counts) if delta is None else delta))
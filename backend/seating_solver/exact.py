@@ -0,0 +1,288 @@
+# seating_solver/exact.py
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from .models import Weights
+from .parties import has_fixed_party
+from .problem import Problem
+
+
+# Largest table ordered exactly. The DP is O(2^n * n^2) (pairwise terms)
+# in pure Python: ~20 ms at 10 seats, ~5x that per extra two seats.
+EXACT_ORDER_MAX_SEATS = 10
+
+# Memo of solved tables: sorted guest indices -> seat order. Only
+# meaningful for one Problem and Weights; callers keep one per solve.
+OrderCache = Dict[Tuple[int, ...], List[int]]
+
+_INF = float("inf")
+
+
+def _table_costs(
+    problem: Problem,
+    guests: List[int],
+    weights: Weights,
+) -> Tuple[List[List[int]], List[int], List[int]]:
+    """
+    Edge costs between seat neighbours, plus per-guest local bitmasks of
+    wanted / must-not neighbours at this table.
+
+    Person terms (wants, must-not) count once per guest however many
+    neighbours match, so they are spread over edges and corrected for the
+    "both neighbours match" case in _correction().
+    """
+    n = len(guests)
+    local = {g: i for i, g in enumerate(guests)}
+    wants_mask = [0] * n
+    must_not_mask = [0] * n
+    for i, g in enumerate(guests):
+        for x in problem.wants[g]:
+            if x in local and x != g:
+                wants_mask[i] |= 1 << local[x]
+        for x in problem.must_not[g]:
+            if x in local and x != g:
+                must_not_mask[i] |= 1 << local[x]
+
+    # Costs are scaled so adjacent couples (who do not want each other)
+    # only break ties between otherwise equal orders.
+    scale = n + 1
+    edge = [[0] * n for _ in range(n)]
+    for i, a in enumerate(guests):
+        for j, b in enumerate(guests):
+            if i == j:
+                continue
+            cost = 0
+            for x, k in ((i, j), (j, i)):
+                if wants_mask[x] >> k & 1:
+                    cost -= weights.wants
+                if must_not_mask[x] >> k & 1:
+                    cost += weights.must_not
+            if problem.single[a] and problem.single[b]:
+                cost -= weights.adjacent_singles
+            cost *= scale
+            if problem.spouse[a] == b and not (
+                wants_mask[i] >> j & 1 or wants_mask[j] >> i & 1
+            ):
+                cost += 1 + weights.adjacent_couples * scale
+            edge[i][j] = cost
+    return edge, wants_mask, must_not_mask
+
+
+def _correction(
+    i: int,
+    left: int,
+    right: int,
+    wants_mask: List[int],
+    must_not_mask: List[int],
+    weights: Weights,
+    scale: int,
+) -> int:
+    """Undo the double count when both of guest i's neighbours match."""
+    both = (1 << left) | (1 << right)
+    cost = 0
+    if wants_mask[i] & both == both:
+        cost += weights.wants
+    if must_not_mask[i] & both == both:
+        cost -= weights.must_not
+    return cost * scale
+
+
+def _same_gender(problem: Problem, a: int, b: int) -> bool:
+    code = problem.gender[a]
+    return code != 0 and code == problem.gender[b]
+
+
+def _best_cycle(
+    guests: List[int],
+    edge: List[List[float]],
+    wants_mask: List[int],
+    must_not_mask: List[int],
+    weights: Weights,
+) -> Tuple[float, List[int]]:
+    """
+    Held-Karp over subsets: cheapest circular order of `guests`, as local
+    indices starting at 0.
+
+    Rotation is fixed by seating local guest 0 first; reflection by only
+    adding guest 2 once guest 1 is seated. When some guest has two or
+    more matching neighbours-to-be, the state also carries the previous
+    guest so the person terms can be corrected exactly.
+    """
+    n = len(guests)
+    scale = n + 1
+    heavy = [
+        bin(wants_mask[i]).count("1") > 1 or bin(must_not_mask[i]).count("1") > 1
+        for i in range(n)
+    ]
+    full = (1 << n) - 1
+
+    def allowed(mask: int, nxt: int) -> bool:
+        return nxt != 2 or mask & 2
+
+    if not any(heavy):
+        # State: (seated set, last guest)
+        cost = [[_INF] * n for _ in range(1 << n)]
+        parent = [[-1] * n for _ in range(1 << n)]
+        for s in range(1, n):
+            if allowed(1, s):
+                cost[1 | 1 << s][s] = edge[0][s]
+                parent[1 | 1 << s][s] = 0
+        for mask in range(3, full + 1, 2):
+            row = cost[mask]
+            for last in range(1, n):
+                c = row[last]
+                if c == _INF:
+                    continue
+                e = edge[last]
+                for nxt in range(1, n):
+                    if mask >> nxt & 1 or not allowed(mask, nxt):
+                        continue
+                    v = c + e[nxt]
+                    m = mask | 1 << nxt
+                    if v < cost[m][nxt]:
+                        cost[m][nxt] = v
+                        parent[m][nxt] = last
+
+        best, last = min((cost[full][k] + edge[k][0], k) for k in range(1, n))
+        if best == _INF:
+            return best, []
+        order = []
+        mask = full
+        while last != 0:
+            order.append(last)
+            last, mask = parent[mask][last], mask & ~(1 << last)
+        order.append(0)
+        return best, order[::-1]
+
+    # State: (seated set, previous guest, last guest). Guest 0's own
+    # correction needs the second seat, so rotate a non-heavy guest first
+    # if there is one; otherwise the second seat is fixed per pass.
+    first = next((i for i in range(n) if not heavy[i]), 0)
+    perm = [first] + [i for i in range(n) if i != first]
+    inv = {p: k for k, p in enumerate(perm)}
+    edge = [[edge[perm[a]][perm[b]] for b in range(n)] for a in range(n)]
+    wants_mask = [
+        sum(1 << inv[k] for k in range(n) if wants_mask[perm[a]] >> k & 1) for a in range(n)
+    ]
+    must_not_mask = [
+        sum(1 << inv[k] for k in range(n) if must_not_mask[perm[a]] >> k & 1) for a in range(n)
+    ]
+    heavy = [heavy[p] for p in perm]
+
+    def corr(i: int, left: int, right: int) -> int:
+        if not heavy[i]:
+            return 0
+        return _correction(i, left, right, wants_mask, must_not_mask, weights, scale)
+
+    # step[prev * n + last][nxt]: cost of seating nxt after (prev, last)
+    step = [
+        [edge[last][nxt] + corr(last, prev, nxt) for nxt in range(n)]
+        for prev in range(n)
+        for last in range(n)
+    ]
+
+    passes = [list(range(1, n))] if not heavy[0] else [[s] for s in range(1, n)]
+    best: Tuple[float, List[int]] = (_INF, [])
+    for seconds in passes:
+        # Flat state arrays indexed [mask][prev * n + last]; parent holds
+        # the guest seated before prev (-1 for the first two seats)
+        cost = [[_INF] * (n * n) for _ in range(1 << n)]
+        parent = [[-1] * (n * n) for _ in range(1 << n)]
+        for s in seconds:
+            if allowed(1, s):
+                cost[1 | 1 << s][s] = edge[0][s]
+        for mask in range(3, full, 2):
+            row = cost[mask]
+            for state, c in enumerate(row):
+                if c == _INF:
+                    continue
+                prev, last = divmod(state, n)
+                costs = step[state]
+                base = last * n
+                for nxt in range(1, n):
+                    if mask >> nxt & 1 or not allowed(mask, nxt):
+                        continue
+                    v = c + costs[nxt]
+                    m = mask | 1 << nxt
+                    if v < cost[m][base + nxt]:
+                        cost[m][base + nxt] = v
+                        parent[m][base + nxt] = prev
+
+        for state, c in enumerate(cost[full]):
+            if c == _INF:
+                continue
+            prev, last = divmod(state, n)
+            total = c + step[state][0]
+            if heavy[0]:
+                total += corr(0, last, seconds[0])
+            if total < best[0]:
+                best = (total, _walk(parent, n, full, prev, last))
+
+    return best[0], [perm[i] for i in best[1]]
+
+
+def _walk(parent: List[List[int]], n: int, mask: int, prev: int, last: int) -> List[int]:
+    """Follow parent pointers back from (mask, prev, last) to seat 0."""
+    order = [last, prev]
+    while prev != 0:
+        before = parent[mask][prev * n + last]
+        mask &= ~(1 << last)
+        prev, last = before, prev
+        order.append(prev)
+    return order[::-1]
+
+
+def exact_table_order(
+    problem: Problem,
+    members: List[int],
+    weights: Weights,
+    cache: Optional[OrderCache] = None,
+) -> Optional[List[int]]:
+    """
+    Provably best circular order of one table's guests for the adjacency
+    terms: wants, must-not, adjacent singles and the alternating-gender
+    bonus (split couples do not depend on the order). Among equally good
+    orders, couples who do not want each other are kept apart.
+
+    Returns None for tables larger than EXACT_ORDER_MAX_SEATS or seating
+    a fixed-order party, whose seats are not free to permute. The order
+    minimises the weighted total (the energy the local searches use), and
+    the alternating bonus is handled exactly for a non-negative weight.
+    Results are memoised in `cache` by guest set.
+    """
+    n = len(members)
+    if n > EXACT_ORDER_MAX_SEATS or has_fixed_party(problem, members):
+        return None
+    guests = sorted(members)
+    key = tuple(guests)
+    if cache is not None and key in cache:
+        return list(cache[key])
+    if n <= 3:
+        # Every circular order of three or fewer guests is the same
+        return guests
+
+    edge, wants_mask, must_not_mask = _table_costs(problem, guests, weights)
+    scale = n + 1
+    best_cost, best = _best_cycle(guests, edge, wants_mask, must_not_mask, weights)
+
+    mixed = len({problem.gender[g] for g in guests}) > 1
+    if weights.alternating > 0 and mixed:
+        alternates = not any(
+            _same_gender(problem, guests[best[k]], guests[best[(k + 1) % n]])
+            for k in range(n)
+        )
+        if not alternates:
+            barred = [
+                [_INF if _same_gender(problem, a, b) else edge[i][j]
+                 for j, b in enumerate(guests)]
+                for i, a in enumerate(guests)
+            ]
+            cost, order = _best_cycle(guests, barred, wants_mask, must_not_mask, weights)
+            if cost - weights.alternating * scale < best_cost:
+                best = order
+
+    result = [guests[i] for i in best]
+    if cache is not None:
+        cache[key] = result
+    return list(result)
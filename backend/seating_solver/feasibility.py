@@ -0,0 +1,373 @@
+# seating_solver/feasibility.py
+from __future__ import annotations
+
+import random
+from typing import List, Optional, Set
+
+from .models import Conflict
+from .problem import Problem
+
+
+# Weight given to must-not violations while searching in hard mode, so
+# local search never trades a violation for any amount of soft score.
+HARD_MUST_NOT_WEIGHT = 10 ** 6
+
+# construct_feasible() placements per guest on a first attempt; hard-mode
+# restarts double it after each failure, up to FEASIBLE_NODE_GROWTH times
+FEASIBLE_NODES_PER_GUEST = 50
+FEASIBLE_NODE_GROWTH = 16
+
+
+class InfeasibleError(ValueError):
+    """
+    No plan can avoid every must-not pair, or the search found none;
+    `conflicts` says why.
+    """
+
+    def __init__(
+        self,
+        conflicts: List[Conflict],
+        message: str = "No seating avoids every must-not pair",
+    ) -> None:
+        self.conflicts = conflicts
+        self.reason = message
+        super().__init__(message + ": " + "; ".join(c.message for c in conflicts))
+
+    def __reduce__(self):
+        # Survive pickling back from worker processes
+        return (type(self), (self.conflicts, self.reason))
+
+
+def search_exhausted(attempts: int) -> Conflict:
+    """Conflict reported when hard mode built no violation-free plan."""
+    return Conflict(
+        kind="exhausted",
+        guest_ids=[],
+        message=(
+            f"the search gave up after {attempts} attempt(s); more attempts "
+            "or time may still find a plan"
+        ),
+    )
+
+
+def _unseatable(problem: Problem) -> Conflict:
+    return Conflict(
+        kind="unseatable",
+        guest_ids=[],
+        message=(
+            f"an exhaustive search of every way to seat the {problem.num_guests} "
+            "guests found none"
+        ),
+    )
+
+
+def must_not_graph(problem: Problem) -> List[Set[int]]:
+    """Undirected must-not adjacency: either guest refusing the other."""
+    graph: List[Set[int]] = [set() for _ in range(problem.num_guests)]
+    for a, refused in enumerate(problem.must_not):
+        for b in refused:
+            if a != b:
+                graph[a].add(b)
+                graph[b].add(a)
+    return graph
+
+
+def _separable(size: int) -> int:
+    """Most guests who may not sit next to each other at one round table."""
+    return 1 if size <= 3 else size // 2
+
+
+def _greedy_clique(graph: List[Set[int]], start: int) -> List[int]:
+    clique = [start]
+    candidates = set(graph[start])
+    while candidates:
+        g = max(candidates, key=lambda x: (len(graph[x] & candidates), -x))
+        clique.append(g)
+        candidates &= graph[g]
+    return clique
+
+
+def _odd_cycle(graph: List[Set[int]]) -> Optional[List[int]]:
+    """An odd cycle of `graph` (BFS two-colouring), or None if bipartite."""
+    depth = [-1] * len(graph)
+    parent = [-1] * len(graph)
+    for root in range(len(graph)):
+        if depth[root] != -1:
+            continue
+        depth[root] = 0
+        queue = [root]
+        for u in queue:
+            for v in sorted(graph[u]):
+                if depth[v] == -1:
+                    depth[v] = depth[u] + 1
+                    parent[v] = u
+                    queue.append(v)
+                elif depth[v] % 2 == depth[u] % 2:
+                    # Walk both BFS paths up to their common ancestor
+                    left, right = [u], [v]
+                    while left[-1] != right[-1]:
+                        if depth[left[-1]] >= depth[right[-1]]:
+                            left.append(parent[left[-1]])
+                        else:
+                            right.append(parent[right[-1]])
+                    return left + right[-2::-1]
+    return None
+
+
+def check_feasibility(problem: Problem) -> List[Conflict]:
+    """
+    Fast necessary conditions for a plan with no must-not violations,
+    each reported with a minimal set of guests that breaks it.
+
+      - isolated guests: a guest needs one allowed neighbour at a table of
+        two and two at anything larger, so refusing (almost) everyone
+        cannot be seated
+      - cliques: guests who all refuse each other need pairwise
+        non-adjacent seats, and a round table of n seats has at most
+        n // 2 of those (one for n <= 3)
+      - unseparable cycles: when no table has more than three seats every
+        tablemate is a neighbour, so must-not pairs need different tables;
+        with two tables an odd must-not cycle cannot be split, with one
+        table any must-not pair cannot
+      - fixed parties: members sit next to each other in party order, so
+        consecutive members (and the last and first, when the party fills
+        every table it fits at) must not refuse each other
+
+    Cliques are grown greedily from each guest, so this never reports a
+    false conflict but may miss some. Returns an empty list when no
+    conflict is found.
+    """
+    graph = must_not_graph(problem)
+    n = problem.num_guests
+    sizes = problem.table_sizes
+    conflicts: List[Conflict] = []
+
+    needed = 2
+    if any(s == 2 for s in sizes):
+        needed = 1
+    if any(s <= 1 for s in sizes):
+        needed = 0
+    for g in range(n):
+        allowed = n - 1 - len(graph[g])
+        if allowed < needed:
+            # Refusing n - needed guests is already too many
+            refused = sorted(graph[g], key=lambda x: problem.ids[x])[:n - needed]
+            conflicts.append(Conflict(
+                kind="isolated",
+                guest_ids=[problem.ids[g]] + [problem.ids[x] for x in refused],
+                message=(
+                    f"{problem.guests[g].name} must not sit next to {len(graph[g])} "
+                    f"of the other {n - 1} guests"
+                ),
+            ))
+
+    capacity = sum(_separable(s) for s in sizes)
+    seen = set()
+    for g in sorted(range(n), key=lambda x: -len(graph[x])):
+        if len(graph[g]) + 1 <= capacity:
+            break
+        clique = _greedy_clique(graph, g)[:capacity + 1]
+        key = frozenset(clique)
+        if len(clique) > capacity and key not in seen:
+            seen.add(key)
+            conflicts.append(Conflict(
+                kind="clique",
+                guest_ids=sorted(problem.ids[x] for x in clique),
+                message=(
+                    f"{len(clique)} guests all refuse each other but the tables "
+                    f"have only {capacity} mutually non-adjacent seats"
+                ),
+            ))
+
+    for k, members in enumerate(problem.parties):
+        if not problem.party_fixed[k]:
+            continue
+        pairs = list(zip(members, members[1:]))
+        if len(members) > 2 and all(s == len(members) for s in sizes if s >= len(members)):
+            pairs.append((members[-1], members[0]))
+        for a, b in pairs:
+            if b in graph[a]:
+                conflicts.append(Conflict(
+                    kind="party",
+                    guest_ids=[problem.ids[a], problem.ids[b]],
+                    message=(
+                        f"{problem.guests[a].name} and {problem.guests[b].name} must not "
+                        f"sit next to each other but their party seats them side by side"
+                    ),
+                ))
+
+    if sizes and max(sizes) <= 3 and len(sizes) <= 2 and not conflicts:
+        if len(sizes) == 1:
+            cycle = next(([g, x] for g in range(n) for x in sorted(graph[g]) if x > g), None)
+        else:
+            cycle = _odd_cycle(graph)
+        if cycle:
+            names = ", ".join(problem.guests[g].name for g in cycle)
+            conflicts.append(Conflict(
+                kind="unseparable",
+                guest_ids=[problem.ids[g] for g in cycle],
+                message=(
+                    f"must-not cycle {names} cannot be split across "
+                    f"{len(sizes)} table(s) of at most three seats"
+                ),
+            ))
+    return conflicts
+
+
+def construct_feasible(
+    problem: Problem,
+    rng: random.Random,
+    node_limit: Optional[int] = None,
+) -> Optional[List[List[int]]]:
+    """
+    Build a plan with no must-not violations by depth-first search over
+    seats, table by table, with backtracking.
+
+    Guests with the most must-not pairs are tried first, genders alternate
+    where possible, and a table's second-to-last seat is only filled if
+    some remaining guest could still close the circle (forward checking).
+    Parties share a table and fixed parties fill consecutive seats in
+    their order (never wrapping round, which a rotation of the table
+    avoids), so no table closes with a party half seated. Whether the
+    tables left at a table boundary can be filled then depends only on
+    who is still unseated, so sets found to fail there are remembered
+    and pruned as soon as they come up again in another order.
+    Returns None once `node_limit` placements (default
+    FEASIBLE_NODES_PER_GUEST per guest) have been tried without success,
+    and raises InfeasibleError if the whole search finishes within the
+    limit without a plan, which proves there is none.
+    """
+    graph = must_not_graph(problem)
+    n = problem.num_guests
+    sizes = problem.table_sizes
+    if node_limit is None:
+        node_limit = FEASIBLE_NODES_PER_GUEST * max(n, 1)
+
+    # Unseated guests are pool[:free]; most constrained at the end, where
+    # the scan starts. Seating swaps a guest to pool[free - 1].
+    pool = list(range(n))
+    rng.shuffle(pool)
+    pool.sort(key=lambda g: len(graph[g]))
+    free = n
+
+    seats: List[int] = []
+    bounds = []  # (table start, table size) for every seat position
+    for size in sizes:
+        start = len(bounds)
+        bounds.extend((start, size) for _ in range(size))
+    table_starts = {start for start, _ in bounds if start}
+    dead: Set[frozenset] = set()   # unseated sets that cannot fill the rest
+
+    parties = problem.parties
+    placed = [0] * len(parties)     # seated members of each party
+    pending = 0                     # unseated members of parties already started
+
+    def party_fits(g: int, offset: int, room: int) -> bool:
+        """Party rules for seating g with `room` seats left after it."""
+        if offset:
+            k = problem.party[seats[-1]]
+            if k != -1 and problem.party_fixed[k] and placed[k] < len(parties[k]):
+                return g == parties[k][placed[k]]
+        k = problem.party[g]
+        if k == -1:
+            return pending <= room
+        if problem.party_fixed[k] and g != parties[k][placed[k]]:
+            return False
+        if placed[k] == 0:
+            return pending + len(parties[k]) - 1 <= room
+        return True
+
+    def seat(g: int, step: int) -> None:
+        """Update party counts for seating (step 1) or unseating (-1) g."""
+        nonlocal pending
+        k = problem.party[g]
+        if k == -1:
+            return
+        if step < 0:
+            placed[k] -= 1
+        # The first member seated opens the rest of the party
+        change = len(parties[k]) - 1 if placed[k] == 0 else -1
+        pending += change * step
+        if step > 0:
+            placed[k] += 1
+
+    def fits(g: int, pos: int) -> bool:
+        start, size = bounds[pos]
+        offset = pos - start
+        if parties and not party_fits(g, offset, size - offset - 1):
+            return False
+        if offset and g in graph[seats[-1]]:
+            return False
+        if offset == size - 1 and size > 2 and g in graph[seats[start]]:
+            return False
+        if offset == size - 2 and size > 3:
+            # someone unseated must fit between g and the table's first guest
+            first = seats[start]
+            blocked = graph[g] | graph[first]
+            return any(
+                pool[i] not in blocked for i in range(free) if pool[i] != g
+            )
+        return True
+
+    # Allowed neighbours a guest needs among its tablemates
+    needed = 2 if min(sizes, default=0) > 2 else max(min(sizes, default=1) - 1, 0)
+
+    def seatable(left: frozenset) -> bool:
+        """Every unseated guest still has enough allowed unseated neighbours."""
+        return all(len(left) - 1 - len(graph[g] & left) >= needed for g in left)
+
+    def candidates(pos: int):
+        start, _ = bounds[pos]
+        prefer = None
+        if pos > start:
+            prefer = problem.gender[seats[-1]]
+        for keep in (False, True) if prefer else (True,):
+            for i in range(free - 1, -1, -1):
+                g = pool[i]
+                if prefer and (problem.gender[g] == prefer) != keep:
+                    continue
+                if fits(g, pos):
+                    yield i
+
+    nodes = 0
+    swapped: List[int] = []  # pool index each seated guest was taken from
+    stack = [candidates(0)] if n else []
+    while stack:
+        i = next(stack[-1], None)
+        if i is None:
+            stack.pop()
+            if len(seats) in table_starts:
+                dead.add(frozenset(pool[:free]))
+            if seats:
+                seat(seats.pop(), -1)
+                j = swapped.pop()
+                pool[free], pool[j] = pool[j], pool[free]
+                free += 1
+            continue
+
+        nodes += 1
+        if nodes > node_limit:
+            return None
+        g = pool[i]
+        free -= 1
+        pool[free], pool[i] = pool[i], pool[free]
+        swapped.append(i)
+        seats.append(g)
+        seat(g, 1)
+        if len(seats) == n:
+            break
+        if len(seats) in table_starts:
+            left = frozenset(pool[:free])
+            if left in dead or not seatable(left):
+                stack.append(iter(()))
+                continue
+        stack.append(candidates(len(seats)))
+
+    if len(seats) != n:
+        raise InfeasibleError([_unseatable(problem)])
+    seatings: List[List[int]] = []
+    start = 0
+    for size in sizes:
+        seatings.append(seats[start:start + size])
+        start += size
+    return seatings
@@ -0,0 +1,259 @@
+# seating_solver/genetic.py
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .batch import BatchEvaluator, score_matrix
+from .evaluator import PlanEvaluator
+from .models import Weights
+from .parties import parties_intact
+from .problem import Problem
+from .stopping import StopCriteria
+
+
+@dataclass
+class GeneticConfig:
+    """
+    Settings for the genetic / memetic engine.
+
+    Each generation keeps the `elite` best plans and breeds the rest of a
+    `population` from tournament-selected parents: `crossover` ("ox" or
+    "pmx") with probability `crossover_rate`, then seat-swap mutation
+    with probability `mutation_rate`. With `polish_steps` > 0 every
+    offspring is also improved by that many seat-swap proposals before it
+    is scored (the memetic variant); the whole generation is polished
+    together, POLISH_WIDTH proposals per offspring at a time.
+    """
+    population: int = 24
+    generations: int = 60
+    elite: int = 2
+    tournament: int = 3
+    crossover: str = "ox"
+    crossover_rate: float = 0.9
+    mutation_rate: float = 0.3
+    polish_steps: int = 100
+
+    def __post_init__(self) -> None:
+        if self.crossover not in CROSSOVERS:
+            raise ValueError(f"Unknown crossover: {self.crossover}")
+
+
+# Seat-swap proposals per offspring scored together in each polish round
+POLISH_WIDTH = 10
+
+# A plan is encoded as one permutation of guest indices; the table sizes
+# of the starting plan are the (fixed) cut points.
+Genome = List[int]
+
+
+def _cut(genome: Genome, sizes: List[int]) -> List[List[int]]:
+    seatings: List[List[int]] = []
+    start = 0
+    for size in sizes:
+        seatings.append(genome[start:start + size])
+        start += size
+    return seatings
+
+
+def order_crossover(a: Genome, b: Genome, rng: random.Random) -> Genome:
+    """
+    OX: copy a random slice of `a` in place, then fill the other seats
+    with the remaining guests in the order they appear in `b`.
+    """
+    n = len(a)
+    i, j = sorted(rng.sample(range(n + 1), 2))
+    child = [-1] * n
+    child[i:j] = a[i:j]
+    taken = set(a[i:j])
+    rest = iter(g for g in b[j:] + b[:j] if g not in taken)
+    for k in list(range(j, n)) + list(range(i)):
+        child[k] = next(rest)
+    return child
+
+
+def partially_mapped_crossover(a: Genome, b: Genome, rng: random.Random) -> Genome:
+    """
+    PMX: copy a random slice of `a` in place; other seats keep `b`'s guest,
+    following the slice's mapping when that guest is already seated.
+    """
+    n = len(a)
+    i, j = sorted(rng.sample(range(n + 1), 2))
+    child = list(b)
+    child[i:j] = a[i:j]
+    mapping: Dict[int, int] = {a[k]: b[k] for k in range(i, j)}
+    for k in list(range(i)) + list(range(j, n)):
+        g = b[k]
+        while g in mapping:
+            g = mapping[g]
+        child[k] = g
+    return child
+
+
+CROSSOVERS = {
+    "ox": order_crossover,
+    "pmx": partially_mapped_crossover,
+}
+
+
+def score_population(
+    batch: BatchEvaluator,
+    genomes: List[Genome],
+    weights: Weights,
+) -> List[tuple]:
+    """Score tuples for a whole generation in one vectorised call."""
+    return [tuple(row) for row in batch.scores(np.asarray(genomes), weights).tolist()]
+
+
+def _shuffle_genders(problem: Problem, genome: Genome, rng: random.Random) -> Genome:
+    """
+    Random individual with the same gender in every seat as `genome`.
+    Party members keep their seats.
+    """
+    slots: Dict[int, List[int]] = {}
+    for k, g in enumerate(genome):
+        if problem.party[g] == -1:
+            slots.setdefault(problem.gender[g], []).append(k)
+    child = list(genome)
+    for positions in slots.values():
+        guests = [genome[k] for k in positions]
+        rng.shuffle(guests)
+        for k, g in zip(positions, guests):
+            child[k] = g
+    return child
+
+
+def _mutate(problem: Problem, genome: Genome, rng: random.Random) -> None:
+    """Swap two seats (outside any party) in place."""
+    a, b = rng.sample(range(len(genome)), 2)
+    if problem.party[genome[a]] == -1 and problem.party[genome[b]] == -1:
+        genome[a], genome[b] = genome[b], genome[a]
+
+
+def _no_worse(new: np.ndarray, old: np.ndarray) -> np.ndarray:
+    """Rows where score tuple `new` is lexicographically <= `old`."""
+    diff = new - old
+    first = np.argmax(diff != 0, axis=1)
+    return diff[np.arange(len(diff)), first] <= 0
+
+
+def _polish(
+    problem: Problem,
+    batch: BatchEvaluator,
+    genomes: List[Genome],
+    weights: Weights,
+    steps: int,
+    rng: random.Random,
+) -> Tuple[List[Genome], List[tuple]]:
+    """
+    Seat-swap hill climb on a whole generation at once. Each round
+    proposes POLISH_WIDTH swaps per offspring, scores them all with one
+    batch.swap_metrics() call and applies each offspring's best proposal
+    if it scores no worse, until `steps` proposals each have been tried.
+    Returns the offspring with their scores.
+    """
+    plans = np.asarray(genomes, dtype=np.int64)
+    metrics = batch.metrics_matrix(plans)
+    scores = score_matrix(metrics, weights)
+    n = plans.shape[1]
+    gen = np.random.default_rng(rng.getrandbits(64))
+    party = np.asarray(problem.party, dtype=np.int64)
+    # Same rules as PlanEvaluator.can_swap; party -1 reads the trailing False
+    fixed = np.asarray(problem.party_fixed + [False])[party]
+    width = min(POLISH_WIDTH, steps)
+    rows = np.repeat(np.arange(len(plans)), width)
+    for _ in range(-(-steps // width)):
+        a = gen.integers(n, size=len(rows))
+        b = gen.integers(n, size=len(rows))
+        ga, gb = plans[rows, a], plans[rows, b]
+        loose = (party[ga] == -1) & (party[gb] == -1)
+        movable = (batch.seat_table[a] == batch.seat_table[b]) & ~fixed[ga] & ~fixed[gb]
+        b = np.where(loose | movable, b, a)
+        trial, trial_metrics = batch.swap_metrics(plans[rows], metrics[rows], a, b)
+        trial_scores = score_matrix(trial_metrics, weights)
+        best = np.lexsort([*trial_scores.T[::-1], rows])[::width]
+        keep = best[_no_worse(trial_scores[best], scores)]
+        plans[rows[keep]] = trial[keep]
+        metrics[rows[keep]] = trial_metrics[keep]
+        scores[rows[keep]] = trial_scores[keep]
+    return plans.tolist(), [tuple(row) for row in scores.tolist()]
+
+
+def _tournament(scores: List[tuple], size: int, rng: random.Random) -> int:
+    entrants = [rng.randrange(len(scores)) for _ in range(max(size, 1))]
+    return min(entrants, key=lambda i: scores[i])
+
+
+def genetic(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    config: GeneticConfig,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> PlanEvaluator:
+    """
+    Population-based engine: recombines whole runs of seats from good
+    plans instead of rebuilding from scratch, so well-seated tables
+    survive between generations.
+
+    The starting plan seeds the population; the other individuals keep
+    its gender in every seat with guests shuffled. Offspring that split a
+    party are replaced by a copy of their first parent. Stops early once
+    `stop` expires or its target is reached; returns an evaluator holding
+    the best plan seen (never worse than the starting plan).
+    """
+    crossover = CROSSOVERS[config.crossover]
+
+    start = PlanEvaluator(problem, seatings, weights)
+    n = problem.num_guests
+    if n < 2 or config.generations <= 0 or config.population < 2:
+        return start
+
+    sizes = [len(s) for s in seatings]
+    template = [g for s in seatings for g in s]
+    population = [template] + [
+        _shuffle_genders(problem, template, rng) for _ in range(config.population - 1)
+    ]
+    batch = BatchEvaluator(problem, sizes)
+    scores = score_population(batch, population, weights)
+    elite = min(max(config.elite, 1), config.population - 1)
+
+    for _ in range(config.generations):
+        best = min(scores)
+        if stop.expired() or stop.reached(best):
+            break
+        ranked = sorted(range(len(population)), key=lambda i: scores[i])
+        survivors = [population[i] for i in ranked[:elite]]
+        survivor_scores = [scores[i] for i in ranked[:elite]]
+
+        children: List[Genome] = []
+        for _ in range(config.population - elite):
+            first = population[_tournament(scores, config.tournament, rng)]
+            second = population[_tournament(scores, config.tournament, rng)]
+            if rng.random() < config.crossover_rate:
+                child = crossover(first, second, rng)
+            else:
+                child = list(first)
+            if rng.random() < config.mutation_rate:
+                _mutate(problem, child, rng)
+            if problem.parties and not parties_intact(problem, _cut(child, sizes)):
+                child = list(first)
+            children.append(child)
+
+        if config.polish_steps > 0:
+            children, child_scores = _polish(
+                problem, batch, children, weights, config.polish_steps, rng
+            )
+        else:
+            child_scores = score_population(batch, children, weights)
+
+        population = survivors + children
+        scores = survivor_scores + child_scores
+
+    best = min(range(len(population)), key=lambda i: scores[i])
+    result = PlanEvaluator(problem, _cut(population[best], sizes), weights)
+    return result if result.score() <= start.score() else start
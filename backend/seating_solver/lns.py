@@ -0,0 +1,194 @@
+# seating_solver/lns.py
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .decompose import order_table, pair_affinities
+from .evaluator import PlanEvaluator
+from .exact import OrderCache
+from .models import Weights
+from .problem import Problem
+from .stopping import StopCriteria
+
+
+@dataclass
+class LNSConfig:
+    """
+    Settings for the large-neighbourhood-search engine.
+
+    Each of `iterations` rounds destroys part of the plan and repairs it:
+    with probability `seat_probability` a random set of `destroy_seats`
+    guests, otherwise `destroy_tables` tables drawn from the worst
+    2 * `destroy_tables` by penalty. `ordering_iterations` is the
+    per-table seat-swap budget for rebuilt tables too large to order
+    exactly.
+    """
+    iterations: int = 300
+    destroy_tables: int = 2
+    seat_probability: float = 0.3
+    destroy_seats: int = 8
+    ordering_iterations: int = 200
+
+
+def table_penalty(problem: Problem, seats: List[int], weights: Weights) -> int:
+    """
+    Weighted score a table gives away: guests next to someone they refuse,
+    guests whose wish is unmet, couples sharing the table (forfeiting the
+    split-couples reward) and not alternating genders.
+    """
+    n = len(seats)
+    penalty = 0
+    at_table = set(seats)
+    for i, g in enumerate(seats):
+        neighbours = {seats[(i - 1) % n], seats[(i + 1) % n]} - {g}
+        if neighbours & problem.must_not[g]:
+            penalty += weights.must_not
+        if problem.wants[g] and not neighbours & problem.wants[g]:
+            penalty += weights.wants
+        if problem.spouse[g] > g and problem.spouse[g] in at_table:
+            penalty += weights.split_couples
+        if n > 1 and problem.gender[g] and problem.gender[g] == problem.gender[seats[(i + 1) % n]]:
+            penalty += weights.alternating
+    return penalty
+
+
+def _refill_tables(
+    problem: Problem,
+    guests: List[int],
+    sizes: List[int],
+    affinity: List[Dict[int, int]],
+    rng: random.Random,
+) -> Optional[List[List[int]]]:
+    """
+    Constructive repair: deal `guests` back into tables of `sizes`, party
+    by party and guest by guest in random order, each to the table it has
+    the most affinity with (then the least of its gender, then the most
+    room). Returns None if a party no longer fits.
+    """
+    units: Dict[int, List[int]] = {}
+    for g in guests:
+        k = problem.party[g]
+        units.setdefault(g if k == -1 else -1 - k, []).append(g)
+    order = list(units.values())
+    rng.shuffle(order)
+    order.sort(key=len, reverse=True)
+
+    members: List[List[int]] = [[] for _ in sizes]
+    room = list(sizes)
+    table_of: Dict[int, int] = {}
+    for unit in order:
+        links: Dict[int, int] = {}
+        for g in unit:
+            for x, w in affinity[g].items():
+                if x in table_of:
+                    links[table_of[x]] = links.get(table_of[x], 0) + w
+        code = problem.gender[unit[0]]
+        best_key, best = None, -1
+        for t in range(len(sizes)):
+            if room[t] < len(unit):
+                continue
+            same = sum(1 for x in members[t] if problem.gender[x] == code)
+            key = (links.get(t, 0), len(members[t]) - 2 * same, room[t])
+            if best_key is None or key > best_key:
+                best_key, best = key, t
+        if best == -1:
+            return None
+        for g in unit:
+            members[best].append(g)
+            table_of[g] = best
+        room[best] -= len(unit)
+    return members
+
+
+def _destroy_seats(
+    current: PlanEvaluator,
+    count: int,
+    rng: random.Random,
+) -> None:
+    """
+    Shuffle `count` random guests outside parties among their seats, then
+    re-seat them greedily: each of those seats in turn takes whichever
+    remaining guest scores best there.
+    """
+    problem = current.problem
+    free = [g for g in range(problem.num_guests) if problem.party[g] == -1]
+    if len(free) < 2:
+        return
+    lifted = rng.sample(free, min(count, len(free)))
+    for i in range(len(lifted) - 1):
+        j = rng.randrange(i, len(lifted))
+        if j != i:
+            current.apply_swap(lifted[i], lifted[j])
+    for i, a in enumerate(lifted):
+        best_cost, best_b = None, a
+        for b in lifted[i:]:
+            cost = 0 if b == a else current.energy(current.delta_swap(a, b))
+            if best_cost is None or cost < best_cost:
+                best_cost, best_b = cost, b
+        if best_b != a:
+            current.apply_swap(a, best_b)
+            j = lifted.index(best_b)
+            lifted[i], lifted[j] = lifted[j], lifted[i]
+
+
+def lns(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    config: LNSConfig,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> PlanEvaluator:
+    """
+    Large-neighbourhood search: repeatedly tear down the tables that give
+    away the most score (see table_penalty), or a random handful of
+    seats, and rebuild just that part.
+
+    Torn-down tables are refilled by a greedy affinity construction and
+    reordered with order_table() (exact for small tables); lifted seats
+    are re-seated greedily. A rebuild is kept when the plan scores no
+    worse. Stops early once `stop` expires or its target is reached.
+    """
+    current = PlanEvaluator(problem, seatings, weights)
+    num_tables = problem.num_tables
+    if problem.num_guests < 2 or config.iterations <= 0:
+        return current
+
+    affinity = pair_affinities(problem, weights)
+    cache: OrderCache = {}
+    k = max(1, min(config.destroy_tables, num_tables))
+
+    for _ in range(config.iterations):
+        score = current.score()
+        if stop.expired() or stop.reached(score):
+            break
+
+        if num_tables < 2 or rng.random() < config.seat_probability:
+            saved = [list(s) for s in current.seatings]
+            _destroy_seats(current, config.destroy_seats, rng)
+            if current.score() > score:
+                current = PlanEvaluator(problem, saved, weights)
+            continue
+
+        ranked = sorted(
+            range(num_tables),
+            key=lambda t: (-table_penalty(problem, current.seatings[t], weights), rng.random()),
+        )
+        tables = rng.sample(ranked[:min(2 * k, num_tables)], k)
+        guests = [g for t in tables for g in current.seatings[t]]
+        members = _refill_tables(
+            problem, guests, [len(current.seatings[t]) for t in tables], affinity, rng
+        )
+        if members is None:
+            continue
+
+        candidate = [list(s) for s in current.seatings]
+        for t, m in zip(tables, members):
+            candidate[t] = order_table(problem, m, weights, config.ordering_iterations, rng, cache)
+        rebuilt = PlanEvaluator(problem, candidate, weights)
+        if rebuilt.score() <= score:
+            current = rebuilt
+
+    return current
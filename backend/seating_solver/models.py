@@ -9,6 +9,9 @@ class Guest:
     name: str
     gender: Optional[str] = None
     marital_status: Optional[str] = None
+    partner_id: Optional[str] = None                               # guest ID of spouse/partner
+    party_id: Optional[str] = None                                 # guests sharing it sit at one table
+    party_seat: Optional[int] = None                               # fixed order within the party
     wants_to_sit_next_to: List[str] = field(default_factory=list)  # list of guest IDs
     must_not_sit_next_to: List[str] = field(default_factory=list)  # list of guest IDs
     tags: List[str] = field(default_factory=list)                  # e.g. ["family", "VIP"]
@@ -45,11 +48,49 @@ class TableSeating:
     seats: List[GuestSeat]
 
 
+@dataclass
+class ImprovementPoint:
+    attempt: int        # attempt at which the new best plan was found
+    elapsed_ms: float
+    score: float        # weighted total score (lower is better)
+
+
+@dataclass
+class Conflict:
+    """Why a set of constraints cannot all be met."""
+    kind: str               # e.g. "clique", "isolated", "exhausted"
+    guest_ids: List[str]
+    message: str
+
+
 @dataclass
 class SeatingPlan:
     tables: List[TableSeating]
     metrics: SeatingMetrics
     attempts_made: int
+    elapsed_ms: float = 0.0
+    improvement_curve: List[ImprovementPoint] = field(default_factory=list)
+    conflicts: List[Conflict] = field(default_factory=list)   # see conflicts.find_conflicts
+    alternatives: List["SeatingPlan"] = field(default_factory=list)   # Pareto front, see iter_solve
+
+
+@dataclass
+class SolveProgress:
+    """One improvement reported by iter_solve()."""
+    plan: SeatingPlan
+    attempt: int        # attempt at which this plan was found
+    elapsed_ms: float
+    final: bool = False  # True for the last item, which carries total attempts
+
+
+@dataclass
+class WeightSweep:
+    """Result of sweep_weights(): one candidate pool ranked many ways."""
+    plans: List[SeatingPlan]                                     # best per weight config, in order
+    pareto: List[SeatingPlan] = field(default_factory=list)     # non-dominated candidates
+    pool_size: int = 0
+    cached: bool = False                                        # pool came from the cache
+    elapsed_ms: float = 0.0
 
 
 @dataclass
@@ -71,6 +112,9 @@ def guest_from_dict(d: Dict[str, Any]) -> Guest:
         name=d["name"],
         gender=d.get("gender"),
         marital_status=d.get("maritalStatus"),
+        partner_id=d.get("partnerId"),
+        party_id=d.get("partyId"),
+        party_seat=d.get("partySeat"),
         wants_to_sit_next_to=d.get("wantsToSitNextTo", []),
         must_not_sit_next_to=d.get("mustNotSitNextTo", []),
         tags=d.get("tags", []),
@@ -0,0 +1,105 @@
+# seating_solver/pareto.py
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Tuple
+
+import numpy as np
+
+from .batch import METRIC_FIELDS
+from .models import SeatingMetrics
+from .scoring import SCORE_TERMS
+
+
+# Objectives compared for dominance, in scoring_tuple() order, all
+# minimised: must-not violations, then the rewards negated.
+OBJECTIVES = tuple(field for field, _, _ in SCORE_TERMS)
+_COLUMNS = [METRIC_FIELDS.index(field) for field in OBJECTIVES]
+_SIGNS = np.asarray([sign for _, _, sign in SCORE_TERMS], dtype=np.int64)
+
+
+def objective_matrix(metrics: np.ndarray) -> np.ndarray:
+    """Weight-free objective vectors for rows of a metrics_matrix() result."""
+    return np.asarray(metrics, dtype=np.int64)[:, _COLUMNS] * _SIGNS
+
+
+def pareto_front(points: np.ndarray) -> np.ndarray:
+    """
+    Indices of the non-dominated rows of `points` (minimised in every
+    column), in lexicographic order; of identical rows only the first
+    is kept.
+
+    Rows are visited in lexicographic order, so no later row can dominate
+    an earlier one and each row is only checked against the front so far.
+    """
+    points = np.asarray(points)
+    if not len(points):
+        return np.zeros(0, dtype=np.int64)
+    _, first = np.unique(points, axis=0, return_index=True)
+    order = first[np.lexsort(points[first].T[::-1])]
+
+    front = []
+    kept = np.empty((0, points.shape[1]), dtype=points.dtype)
+    for i in order.tolist():
+        p = points[i]
+        if len(kept) and (kept <= p).all(axis=1).any():
+            continue
+        front.append(i)
+        kept = np.vstack([kept, p])
+    return np.asarray(front, dtype=np.int64)
+
+
+def objective_vector(metrics: SeatingMetrics) -> Tuple[int, ...]:
+    """objective_matrix() for a single SeatingMetrics."""
+    return tuple(sign * getattr(metrics, field) for field, _, sign in SCORE_TERMS)
+
+
+class ParetoArchive:
+    """
+    Non-dominated (objective vector, item) pairs seen so far, all
+    objectives minimised; of identical vectors only the first is kept.
+
+    Entries are kept sorted lexicographically by vector. A point can only
+    be dominated by entries sorted before it and can only dominate entries
+    sorted after it, so add() bisects once and checks each side in one
+    direction only. All objectives are small integers, so the front stays
+    small and the scans are short. Plain lists, so archives pickle across
+    worker processes.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[int, ...]] = []
+        self._items: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def dominated(self, point: Tuple[int, ...]) -> bool:
+        """True if an entry is at least as good as `point` everywhere."""
+        end = bisect_right(self._keys, point)
+        return any(
+            all(a <= b for a, b in zip(key, point)) for key in self._keys[:end]
+        )
+
+    def add(self, point: Tuple[int, ...], item: Any) -> bool:
+        """Insert `item` unless it is dominated; drop entries it dominates."""
+        point = tuple(point)
+        if self.dominated(point):
+            return False
+        i = bisect_left(self._keys, point)
+        keep = [
+            j for j in range(i, len(self._keys))
+            if not all(a <= b for a, b in zip(point, self._keys[j]))
+        ]
+        self._keys[i:] = [point] + [self._keys[j] for j in keep]
+        self._items[i:] = [item] + [self._items[j] for j in keep]
+        return True
+
+    def update(self, other: "ParetoArchive") -> None:
+        """Merge another archive's entries into this one."""
+        for point, item in other.entries():
+            self.add(point, item)
+
+    def entries(self) -> List[Tuple[Tuple[int, ...], Any]]:
+        """(vector, item) pairs in lexicographic order of vector."""
+        return list(zip(self._keys, self._items))
@@ -0,0 +1,167 @@
+# seating_solver/parties.py
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+from .evaluator import PlanEvaluator
+from .problem import Problem, pack_parties
+
+
+def alternate_genders(problem: Problem, guests: List[int]) -> List[int]:
+    """Interleave guests by gender, larger group first."""
+    groups: Dict[int, List[int]] = {}
+    for g in guests:
+        groups.setdefault(problem.gender[g], []).append(g)
+    queues = sorted(groups.values(), key=len, reverse=True)
+    order: List[int] = []
+    while any(queues):
+        for q in queues:
+            if q:
+                order.append(q.pop())
+    return order
+
+
+def has_fixed_party(problem: Problem, seats: List[int]) -> bool:
+    """True if any guest in `seats` belongs to a fixed-order party."""
+    return any(problem.party[g] != -1 and problem.party_fixed[problem.party[g]] for g in seats)
+
+
+def parties_intact(problem: Problem, seatings: List[List[int]]) -> bool:
+    """
+    True if every party shares one table and every fixed party sits in
+    consecutive seats in its order.
+    """
+    table_of: Dict[int, Tuple[int, int]] = {}
+    for t, seats in enumerate(seatings):
+        for i, g in enumerate(seats):
+            table_of[g] = (t, i)
+    for k, members in enumerate(problem.parties):
+        tables = {table_of[g][0] for g in members}
+        if len(tables) != 1:
+            return False
+        if problem.party_fixed[k]:
+            n = len(seatings[tables.pop()])
+            seats = [table_of[g][1] for g in members]
+            if any((b - a) % n != 1 for a, b in zip(seats, seats[1:])):
+                return False
+    return True
+
+
+def seat_table(problem: Problem, members: List[int], rng: random.Random) -> List[int]:
+    """
+    Starting order for one table: guests outside fixed-order parties
+    alternate by gender, and each fixed party is dropped in at a random
+    point as an unbroken block in its own order.
+    """
+    blocks = [
+        list(problem.parties[k]) for k in sorted({problem.party[g] for g in members})
+        if k != -1 and problem.party_fixed[k]
+    ]
+    loose = [g for g in members if not has_fixed_party(problem, [g])]
+    segments = [[g] for g in alternate_genders(problem, loose)]
+    for block in blocks:
+        segments.insert(rng.randrange(len(segments) + 1), block)
+    return [g for segment in segments for g in segment]
+
+
+def construct_with_parties(problem: Problem, rng: random.Random) -> Optional[List[List[int]]]:
+    """
+    One random-restart attempt that treats each party as a single unit.
+
+    Units (parties, then lone guests) are placed largest first at the
+    table with the most room; lone guests prefer tables where their gender
+    is under-represented. If that greedy pass strands a party, parties
+    go where pack_parties() puts them instead. Each table is then ordered
+    by seat_table(). Returns None if the parties cannot be packed into the
+    table sizes.
+    """
+    sizes = problem.table_sizes
+    tables = list(range(len(sizes)))
+    rng.shuffle(tables)
+    loose = [[g] for g in range(problem.num_guests) if problem.party[g] == -1]
+    rng.shuffle(loose)
+    parties = [list(m) for m in problem.parties]
+    rng.shuffle(parties)
+    parties.sort(key=len, reverse=True)
+
+    room = list(sizes)
+    placed: List[List[List[int]]] = [[] for _ in sizes]
+    counts: List[Dict[int, int]] = [{} for _ in sizes]
+
+    def place(unit: List[int], t: int) -> None:
+        placed[t].append(unit)
+        room[t] -= len(unit)
+        for g in unit:
+            counts[t][problem.gender[g]] = counts[t].get(problem.gender[g], 0) + 1
+
+    def best_table(unit: List[int]) -> int:
+        code = problem.gender[unit[0]]
+        best_key, best = None, -1
+        for t in tables:
+            if room[t] < len(unit):
+                continue
+            balance = 0
+            if len(unit) == 1:
+                balance = sizes[t] - room[t] - 2 * counts[t].get(code, 0)
+            key = (balance, room[t])
+            if best_key is None or key > best_key:
+                best_key, best = key, t
+        return best
+
+    stranded = False
+    for unit in parties:
+        t = best_table(unit)
+        if t == -1:
+            stranded = True
+            break
+        place(unit, t)
+    if stranded:
+        packing = pack_parties([len(p) for p in parties], sizes)
+        if packing is None:
+            return None
+        room[:] = sizes
+        for t in tables:
+            placed[t].clear()
+            counts[t].clear()
+        for unit, t in zip(parties, packing):
+            place(unit, t)
+
+    for unit in loose:
+        place(unit, best_table(unit))
+
+    seatings: List[List[int]] = []
+    for units_at in placed:
+        seatings.append(seat_table(problem, [g for u in units_at for g in u], rng))
+    return seatings
+
+
+def party_swap_pairs(
+    evaluator: PlanEvaluator,
+    rng: random.Random,
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Propose moving a random party to another table as a unit: its members
+    swap, in order, with a run of consecutive guests there who belong to
+    no party (so a fixed party lands in consecutive seats).
+
+    Returns the guest swaps for delta_swaps / apply_swaps, or None when
+    the sampled move is not possible.
+    """
+    problem = evaluator.problem
+    if not problem.parties or problem.num_tables < 2:
+        return None
+    members = problem.parties[rng.randrange(len(problem.parties))]
+    source = evaluator.table_of[members[0]]
+    target = rng.randrange(problem.num_tables - 1)
+    if target >= source:
+        target += 1
+
+    seats = evaluator.seatings[target]
+    if len(seats) < len(members):
+        return None
+    start = rng.randrange(len(seats))
+    run = [seats[(start + i) % len(seats)] for i in range(len(members))]
+    if any(problem.party[g] != -1 for g in run):
+        return None
+    return list(zip(members, run))
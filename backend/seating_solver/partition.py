@@ -0,0 +1,243 @@
+# seating_solver/partition.py
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+from .decompose import order_table, pair_affinities, table_swap_gain
+from .evaluator import PlanEvaluator
+from .exact import OrderCache
+from .models import Weights
+from .problem import Problem
+from .stopping import StopCriteria
+
+
+@dataclass
+class PartitionConfig:
+    """
+    Settings for the graph-partitioning engine.
+
+    `passes` bounds the FM refinement sweeps over related guests; each
+    move considers at most `candidates` swap partners at the target table.
+    `ordering_iterations` is the per-table seat-swap budget for tables too
+    large to order exactly.
+    """
+    passes: int = 10
+    candidates: int = 16
+    ordering_iterations: int = 300
+
+
+def coarsen(
+    affinity: List[Dict[int, int]],
+    max_size: int,
+    rng: random.Random,
+    parties: Sequence[List[int]] = (),
+) -> List[List[int]]:
+    """
+    Multilevel coarsening by heavy-edge matching.
+
+    Every party starts as one cluster, everyone else alone. Each level
+    pairs every cluster with the unmatched neighbour it has the strongest
+    positive affinity to, as long as the merged cluster still fits
+    `max_size`; levels repeat until nothing merges. Each level is linear
+    in the number of relationships.
+    """
+    n = len(affinity)
+    clusters: Dict[int, List[int]] = {g: [g] for g in range(n)}
+    owner = list(range(n))
+    for members in parties:
+        head = members[0]
+        for g in members[1:]:
+            del clusters[g]
+            owner[g] = head
+        clusters[head] = list(members)
+
+    merged = True
+    while merged:
+        merged = False
+        matched = set()
+        order = list(clusters)
+        rng.shuffle(order)
+        for c in order:
+            if c in matched or c not in clusters:
+                continue
+            links: Dict[int, int] = {}
+            for g in clusters[c]:
+                for x, w in affinity[g].items():
+                    d = owner[x]
+                    if d != c:
+                        links[d] = links.get(d, 0) + w
+            size = len(clusters[c])
+            best, target = 0, -1
+            for d, w in links.items():
+                if w > best and d not in matched and size + len(clusters[d]) <= max_size:
+                    best, target = w, d
+            if target == -1:
+                continue
+            for g in clusters[target]:
+                owner[g] = c
+            clusters[c].extend(clusters.pop(target))
+            matched.update((c, target))
+            merged = True
+
+    return list(clusters.values())
+
+
+def pack_clusters(
+    problem: Problem,
+    clusters: List[List[int]],
+    affinity: List[Dict[int, int]],
+) -> List[List[int]]:
+    """
+    Greedy initial partition: place clusters largest first at the table
+    they are most attracted to that still has room for them (exact table
+    sizes from problem.table_sizes). Ties go to the table where the
+    guest's gender is least represented, then to the emptiest table.
+    Clusters that fit nowhere are placed party by party and guest by
+    guest.
+    """
+    sizes = problem.table_sizes
+    members: List[List[int]] = [[] for _ in sizes]
+    room = list(sizes)
+    table_of = [-1] * problem.num_guests
+    gender_count: List[Dict[int, int]] = [{} for _ in sizes]
+
+    def place(group: List[int]) -> bool:
+        links: Dict[int, int] = {}
+        for g in group:
+            for x, w in affinity[g].items():
+                t = table_of[x]
+                if t != -1:
+                    links[t] = links.get(t, 0) + w
+        code = problem.gender[group[0]]
+        best_key, best_t = None, -1
+        for t in range(len(sizes)):
+            if room[t] < len(group):
+                continue
+            balance = len(members[t]) - 2 * gender_count[t].get(code, 0)
+            key = (links.get(t, 0), balance, room[t])
+            if best_key is None or key > best_key:
+                best_key, best_t = key, t
+        if best_t == -1:
+            return False
+        for g in group:
+            members[best_t].append(g)
+            table_of[g] = best_t
+            counts = gender_count[best_t]
+            counts[problem.gender[g]] = counts.get(problem.gender[g], 0) + 1
+        room[best_t] -= len(group)
+        return True
+
+    for cluster in sorted(clusters, key=len, reverse=True):
+        if not place(cluster):
+            units: Dict[int, List[int]] = {}
+            for g in cluster:
+                k = problem.party[g]
+                units.setdefault(g if k == -1 else -1 - k, []).append(g)
+            for unit in sorted(units.values(), key=len, reverse=True):
+                place(unit)
+    return members
+
+
+def refine_partition(
+    problem: Problem,
+    members: List[List[int]],
+    affinity: List[Dict[int, int]],
+    config: PartitionConfig,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> List[List[int]]:
+    """
+    FM-style refinement: each related guest looks for the table it is most
+    attracted to and swaps with the same-gender guest there whose swap
+    gains the most, keeping table sizes and gender mix. Sweeps stop once
+    a pass makes no improving swap.
+    """
+    table_of = [-1] * problem.num_guests
+    for t, seats in enumerate(members):
+        for g in seats:
+            table_of[g] = t
+    related = [
+        g for g in range(problem.num_guests)
+        if affinity[g] and problem.party[g] == -1
+    ]
+    gender = problem.gender
+
+    for _ in range(config.passes):
+        if stop.expired():
+            break
+        rng.shuffle(related)
+        improved = False
+        for a in related:
+            ta = table_of[a]
+            links: Dict[int, int] = {}
+            for x, w in affinity[a].items():
+                links[table_of[x]] = links.get(table_of[x], 0) + w
+            own = links.get(ta, 0)
+            targets = sorted(
+                (t for t, w in links.items() if t != ta and w > own),
+                key=lambda t: -links[t],
+            )
+            for t in targets:
+                pool = [
+                    b for b in members[t]
+                    if gender[b] == gender[a] and problem.party[b] == -1
+                ]
+                if len(pool) > config.candidates:
+                    pool = rng.sample(pool, config.candidates)
+                best_gain, best_b = 0, -1
+                for b in pool:
+                    gain = table_swap_gain(affinity, table_of, a, b)
+                    if gain > best_gain:
+                        best_gain, best_b = gain, b
+                if best_b != -1:
+                    members[ta][members[ta].index(a)] = best_b
+                    members[t][members[t].index(best_b)] = a
+                    table_of[a], table_of[best_b] = t, ta
+                    improved = True
+                    break
+        if not improved:
+            break
+
+    return members
+
+
+def partition(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    config: PartitionConfig,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> PlanEvaluator:
+    """
+    Graph-partitioning engine: builds the guest-to-table assignment from
+    the relationship graph (coarsen, pack, refine) instead of from random
+    shuffles, then orders each table (see decompose.order_table).
+
+    Edge weights come from pair_affinities(), so `weights` decides whether
+    couples are pulled together or apart. Returns whichever of the
+    constructed plan and the partitioned plan scores better.
+    """
+    if stop.expired():
+        return PlanEvaluator(problem, seatings, weights)
+    affinity = pair_affinities(problem, weights)
+    max_size = min(problem.table_sizes) if problem.table_sizes else 0
+    clusters = coarsen(affinity, max_size, rng, problem.parties)
+    members = pack_clusters(problem, clusters, affinity)
+    if sum(len(m) for m in members) != problem.num_guests:
+        # A party found no table with room left for it
+        return PlanEvaluator(problem, seatings, weights)
+    members = refine_partition(problem, members, affinity, config, rng, stop)
+
+    cache: OrderCache = {}
+    ordered = [
+        m if stop.expired()
+        else order_table(problem, m, weights, config.ordering_iterations, rng, cache)
+        for m in members
+    ]
+
+    start = PlanEvaluator(problem, seatings, weights)
+    result = PlanEvaluator(problem, ordered, weights)
+    return result if result.score() <= start.score() else start
@@ -0,0 +1,259 @@
+# seating_solver/problem.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
+
+from .models import Guest, Table
+
+
+MARRIED_TO_PREFIX = "Married to "
+
+
+@dataclass
+class Problem:
+    """
+    Compiled, integer-indexed view of a seating problem.
+
+    Guests are referred to by their position in `guests` (0..n-1) so the
+    solver's inner loops only ever compare ints and look up sets of ints,
+    instead of walking Guest dataclasses and matching strings.
+    """
+    guests: List[Guest]
+    tables: List[Table]
+    table_sizes: List[int]          # seats actually used per table
+
+    ids: List[str]                  # index -> guest ID
+    index: Dict[str, int]           # guest ID -> index
+
+    gender: List[int]               # interned gender code, 0 = unknown
+    single: List[bool]              # marital_status == "Single"
+    spouse: List[int]               # index of spouse, -1 if none
+    wants: List[FrozenSet[int]]     # indices this guest wants next to them
+    must_not: List[FrozenSet[int]]  # indices this guest must not sit next to
+
+    males: List[int]                # gender pools used by construction
+    females: List[int]
+
+    party: List[int]                # index into `parties`, -1 if none
+    parties: List[List[int]]        # guests who must share a table
+    party_fixed: List[bool]         # members sit together in list order
+
+    @property
+    def num_guests(self) -> int:
+        return len(self.ids)
+
+    @property
+    def num_tables(self) -> int:
+        return len(self.tables)
+
+
+def parse_married_to(marital_status: Optional[str]) -> Optional[str]:
+    """Extract the partner name from legacy "Married to <name>" text."""
+    ms = (marital_status or "").strip()
+    pos = ms.find(MARRIED_TO_PREFIX)
+    if pos < 0:
+        return None
+    name = ms[pos + len(MARRIED_TO_PREFIX):].strip()
+    return name or None
+
+
+def compute_table_sizes(num_guests: int, tables: List[Table]) -> List[int]:
+    """
+    Decide the actual number of seats used per table
+    (e.g. 39 guests across 2x20 → [20, 19]).
+    """
+    total_capacity = sum(t.capacity for t in tables)
+    if num_guests > total_capacity:
+        raise ValueError(
+            f"Not enough seats: {num_guests} guests but only {total_capacity} seats."
+        )
+
+    num_tables = len(tables)
+    base_size = num_guests // num_tables
+    extra = num_guests % num_tables
+    table_sizes = [base_size + (1 if i < extra else 0) for i in range(num_tables)]
+
+    # Guard: no table size should exceed declared capacity
+    for size, t in zip(table_sizes, tables):
+        if size > t.capacity:
+            raise ValueError(
+                f"Table {t.name} capacity {t.capacity} is too small for assigned {size} guests."
+            )
+
+    return table_sizes
+
+
+def compile_problem(guests: List[Guest], tables: List[Table]) -> Problem:
+    """
+    One-time compile step: turn solver Guests/Tables into a Problem.
+
+    Raises ValueError if the tables cannot seat every guest.
+    """
+    table_sizes = compute_table_sizes(len(guests), tables)
+
+    ids = [g.id for g in guests]
+    index: Dict[str, int] = {}
+    for i, gid in enumerate(ids):
+        index.setdefault(gid, i)
+
+    # Intern gender strings so equality checks are int comparisons
+    gender_codes: Dict[str, int] = {}
+    gender: List[int] = []
+    for g in guests:
+        if g.gender:
+            gender.append(gender_codes.setdefault(g.gender, len(gender_codes) + 1))
+        else:
+            gender.append(0)
+
+    single = [(g.marital_status or "") == "Single" for g in guests]
+
+    def resolve(targets: List[str]) -> FrozenSet[int]:
+        return frozenset(index[t] for t in (targets or []) if t in index)
+
+    wants = [resolve(g.wants_to_sit_next_to) for g in guests]
+    must_not = [resolve(g.must_not_sit_next_to) for g in guests]
+
+    # Resolve couples once: explicit partner IDs first, then fall back to
+    # legacy "Married to <name>" text for guests without a partner_id.
+    name_index: Dict[str, int] = {}
+    for i, g in enumerate(guests):
+        name_index.setdefault(g.name, i)
+
+    spouse = [-1] * len(guests)
+
+    def pair(i: int, j: int) -> None:
+        if j == -1 or j == i or spouse[i] != -1 or spouse[j] != -1:
+            return
+        spouse[i] = j
+        spouse[j] = i
+
+    for i, g in enumerate(guests):
+        if g.partner_id:
+            pair(i, index.get(g.partner_id, -1))
+
+    for i, g in enumerate(guests):
+        if g.partner_id or spouse[i] != -1:
+            continue
+        partner_name = parse_married_to(g.marital_status)
+        if partner_name:
+            pair(i, name_index.get(partner_name, -1))
+
+    # Pre-split by gender; other/unknown genders join the larger pool
+    males = [i for i, g in enumerate(guests) if (g.gender or "").lower().startswith("m")]
+    females = [i for i, g in enumerate(guests) if (g.gender or "").lower().startswith("f")]
+    paired = set(males) | set(females)
+    others = [i for i in range(len(guests)) if i not in paired]
+    if others:
+        if len(males) >= len(females):
+            males.extend(others)
+        else:
+            females.extend(others)
+
+    party, parties, party_fixed = _compile_parties(guests, table_sizes)
+
+    return Problem(
+        guests=guests,
+        tables=tables,
+        table_sizes=table_sizes,
+        ids=ids,
+        index=index,
+        gender=gender,
+        single=single,
+        spouse=spouse,
+        wants=wants,
+        must_not=must_not,
+        males=males,
+        females=females,
+        party=party,
+        parties=parties,
+        party_fixed=party_fixed,
+    )
+
+
+def pack_parties(party_sizes: List[int], table_sizes: List[int]) -> Optional[List[int]]:
+    """
+    A table for every party so that no table holds more party guests than
+    it seats, or None if there is none. Guests outside parties fill the
+    remaining seats, so only parties need packing.
+
+    Exact depth-first search, largest party first; tables with the same
+    room left are tried once, and table rooms that have already failed
+    for the parties still left are remembered.
+    """
+    order = sorted(range(len(party_sizes)), key=lambda k: -party_sizes[k])
+    room = list(table_sizes)
+    table_of = [-1] * len(party_sizes)
+    failed = set()
+
+    def choices(i: int):
+        size = party_sizes[order[i]]
+        tried = set()
+        for t in range(len(room)):
+            if room[t] >= size and room[t] not in tried:
+                tried.add(room[t])
+                yield t
+
+    stack = [choices(0)] if order else []
+    while stack:
+        i = len(stack) - 1
+        k = order[i]
+        if table_of[k] != -1:
+            room[table_of[k]] += party_sizes[k]
+            table_of[k] = -1
+        t = next(stack[-1], None)
+        if t is None:
+            failed.add((i, tuple(sorted(room))))
+            stack.pop()
+            continue
+        room[t] -= party_sizes[k]
+        table_of[k] = t
+        if i + 1 == len(order):
+            return table_of
+        if (i + 1, tuple(sorted(room))) not in failed:
+            stack.append(choices(i + 1))
+    return table_of if not order else None
+
+
+def _compile_parties(guests: List[Guest], table_sizes: List[int]):
+    """
+    Group guests by party_id. Parties of one guest impose nothing and are
+    dropped; a party whose members all have a party_seat is fixed, in
+    party_seat order.
+
+    Raises ValueError if a party is larger than every table, or the
+    parties cannot all be packed into the tables (see pack_parties).
+    """
+    members: Dict[str, List[int]] = {}
+    for i, g in enumerate(guests):
+        if g.party_id:
+            members.setdefault(g.party_id, []).append(i)
+
+    largest = max(table_sizes, default=0)
+    party = [-1] * len(guests)
+    parties: List[List[int]] = []
+    party_fixed: List[bool] = []
+    for party_id, group in members.items():
+        if len(group) < 2:
+            continue
+        if len(group) > largest:
+            raise ValueError(
+                f"Party {party_id} has {len(group)} guests but no table seats more than {largest}."
+            )
+        fixed = all(guests[i].party_seat is not None for i in group)
+        if fixed:
+            group = sorted(group, key=lambda i: guests[i].party_seat)
+        for i in group:
+            party[i] = len(parties)
+        parties.append(group)
+        party_fixed.append(fixed)
+
+    if pack_parties([len(m) for m in parties], table_sizes) is None:
+        raise ValueError(
+            "Parties of "
+            + ", ".join(str(len(m)) for m in parties)
+            + " guests cannot each share a table with tables of "
+            + ", ".join(str(s) for s in table_sizes)
+            + " seats."
+        )
+    return party, parties, party_fixed
@@ -0,0 +1,126 @@
+# seating_solver/scoring.py
+from __future__ import annotations
+
+from typing import Mapping, Optional
+
+from .models import SeatingMetrics, Weights
+
+
+# -------------------------
+# Default weights
+# -------------------------
+
+DEFAULT_WEIGHTS = Weights(
+    must_not=100,
+    wants=10,
+    adjacent_singles=5,
+    alternating=2,
+    split_couples=1,
+)
+
+
+# -------------------------
+# Scoring
+# -------------------------
+
+def scoring_tuple(
+    must_not_violations: int,
+    wants_score: int,
+    alternating_score: int,
+    split_couples: int,
+    adjacent_singles: int,
+    weights: Weights,
+) -> tuple:
+    """
+    Weighted scoring (wedding_default profile).
+
+    Weights:
+      - must_not        → penalty for violations    (higher = harsher)
+      - wants           → reward for satisfied wants
+      - adjacent_singles→ reward
+      - alternating     → reward
+      - split_couples   → reward (or set to 0 to ignore)
+    """
+    return (
+        # minimise weighted must-not violations
+        weights.must_not * must_not_violations,
+        # then maximise others (negative because smaller tuple is "better")
+        -weights.wants * wants_score,
+        -weights.adjacent_singles * adjacent_singles,
+        -weights.alternating * alternating_score,
+        -weights.split_couples * split_couples,
+    )
+
+
+# scoring_tuple() terms in priority order:
+# (SeatingMetrics field, Weights field, sign in the tuple)
+SCORE_TERMS = (
+    ("must_not_violations", "must_not", 1),
+    ("wants_satisfied", "wants", -1),
+    ("adjacent_singles", "adjacent_singles", -1),
+    ("alternating_tables", "alternating", -1),
+    ("split_couples", "split_couples", -1),
+)
+
+
+def unbeatable_from(best: tuple, lower_bound: Optional[tuple]) -> int:
+    """
+    First term index from which `best` already meets `lower_bound` on
+    every remaining term: a candidate tied with `best` on all terms before
+    it cannot beat `best`. len(best) when no bound is known.
+    """
+    k = len(best)
+    if lower_bound is None:
+        return k
+    while k > 0 and best[k - 1] <= lower_bound[k - 1]:
+        k -= 1
+    return k
+
+
+def normalise_weights(weights_input: Optional[Mapping[str, float]]) -> Weights:
+    """
+    Convert the API weights dict (with keys like `mustNotWeight`) into
+    the internal Weights dataclass.
+
+    If None or empty, fall back to DEFAULT_WEIGHTS.
+    """
+    if not weights_input:
+        return DEFAULT_WEIGHTS
+
+    return Weights(
+        must_not=int(weights_input.get("mustNotWeight", DEFAULT_WEIGHTS.must_not)),
+        wants=int(weights_input.get("wantsWeight", DEFAULT_WEIGHTS.wants)),
+        adjacent_singles=int(
+            weights_input.get("adjacentSinglesWeight", DEFAULT_WEIGHTS.adjacent_singles)
+        ),
+        # We don't currently have a separate same-gender weight in Weights;
+        # you can wire that in later if you want it to affect core scoring.
+        alternating=int(
+            weights_input.get("alternatingTablesWeight", DEFAULT_WEIGHTS.alternating)
+        ),
+        split_couples=int(
+            weights_input.get("splitCouplesWeight", DEFAULT_WEIGHTS.split_couples)
+        ),
+    )
+
+
+def metrics_score(metrics: SeatingMetrics, weights: Weights) -> tuple:
+    """scoring_tuple() for a full SeatingMetrics object."""
+    return scoring_tuple(
+        metrics.must_not_violations,
+        metrics.wants_satisfied,
+        metrics.alternating_tables,
+        metrics.split_couples,
+        metrics.adjacent_singles,
+        weights,
+    )
+
+
+def scalar_score(score: tuple) -> float:
+    """
+    Collapse a scoring tuple into a single weighted total (lower is better).
+
+    Local-search engines need a scalar energy; the weights already encode
+    the relative importance of each term.
+    """
+    return sum(score)
@@ -1,48 +1,83 @@
 # seating_solver/solver.py
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import random
-from typing import List, Dict, Any, Optional, Mapping
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import numpy as np
 
 from .models import (
+    Conflict,
     Guest,
     Table,
     SeatingPlan,
     SeatingMetrics,
+    SolveProgress,
+    ImprovementPoint,
     GuestSeat,
     TableSeating,
+    WeightSweep,
     Weights,
 )
-
-# -------------------------
-# Default weights
-# -------------------------
-
-DEFAULT_WEIGHTS = Weights(
-    must_not=100,
-    wants=10,
-    adjacent_singles=5,
-    alternating=2,
-    split_couples=1,
+from .anneal import AnnealSchedule, anneal
+from .batch import METRIC_FIELDS, BatchEvaluator, random_plans, score_matrix
+from .components import constraint_components, pack_components
+from .decompose import TwoPhaseConfig, two_phase
+from .exact import OrderCache, exact_table_order
+from .conflicts import find_conflicts, wants_conflicts
+from .genetic import GeneticConfig, genetic
+from .feasibility import (
+    FEASIBLE_NODE_GROWTH,
+    FEASIBLE_NODES_PER_GUEST,
+    HARD_MUST_NOT_WEIGHT,
+    InfeasibleError,
+    check_feasibility,
+    construct_feasible,
+    search_exhausted,
+)
+from .parties import construct_with_parties, has_fixed_party
+from .lns import LNSConfig, lns
+from .pareto import ParetoArchive, objective_matrix, objective_vector, pareto_front
+from .partition import PartitionConfig, partition
+from .problem import Problem, compile_problem
+from .stopping import StopCriteria, score_lower_bound
+from .sweep import CandidatePool, PoolCache
+from .tabu import TabuConfig, tabu_search
+# scoring_tuple / DEFAULT_WEIGHTS are re-exported for existing callers
+from .scoring import (
+    DEFAULT_WEIGHTS,
+    SCORE_TERMS,
+    metrics_score,
+    normalise_weights,
+    scalar_score,
+    scoring_tuple,
+    unbeatable_from,
 )
 
 
 # -------------------------
 # Helper functions
 # -------------------------
+#
+# All helpers work on a compiled Problem (see problem.py): a table's seating
+# is a list of guest indices, and guests are compared as ints.
 
-def is_married_to(p1: Guest, p2: Guest) -> bool:
-    """Check if p1 and p2 are a married couple based on their marital_status text."""
-    ms1 = (p1.marital_status or "").strip()
-    ms2 = (p2.marital_status or "").strip()
-    return (f"Married to {p2.name}" in ms1) or (f"Married to {p1.name}" in ms2)
+def is_married_to(problem: Problem, a: int, b: int) -> bool:
+    """Check if guests a and b are a married couple."""
+    return problem.spouse[a] == b
 
 
 def build_table_seating(
-    males: List[Guest],
-    females: List[Guest],
+    males: List[int],
+    females: List[int],
     table_size: int,
-) -> Optional[List[Guest]]:
+) -> Optional[List[int]]:
     """
     Build a single table's seating from shared male/female pools, trying to keep
     a reasonable gender balance and alternating where possible.
@@ -88,7 +123,7 @@ def build_table_seating(
     local_males = [males.pop() for _ in range(ideal_males)]
     local_females = [females.pop() for _ in range(ideal_females)]
 
-    seating: List[Guest] = []
+    seating: List[int] = []
     male_turn = len(local_males) >= len(local_females)
 
     while local_males or local_females:
@@ -105,312 +140,1092 @@ def build_table_seating(
     return seating
 
 
-def ensure_no_adjacent_couples(table: List[Guest]) -> List[Guest]:
+def ensure_no_adjacent_couples(problem: Problem, table: List[int]) -> List[int]:
     """
     Try to rearrange a single table so no married couples sit adjacent (circular),
     UNLESS they explicitly want to sit together.
     """
+    spouse = problem.spouse
+    wants = problem.wants
     n = len(table)
     for i in range(n):
         j = (i + 1) % n
-        if is_married_to(table[i], table[j]):
+        if spouse[table[i]] == table[j]:
             # If they explicitly want to sit together, respect that
-            wants_i = table[i].wants_to_sit_next_to or []
-            wants_j = table[j].wants_to_sit_next_to or []
-            if table[j].id in wants_i or table[i].id in wants_j:
+            if table[j] in wants[table[i]] or table[i] in wants[table[j]]:
                 continue
 
             # Otherwise, try to separate them
             for k in range(2, n):
                 a = (i + k) % n
                 b = (i + k + 1) % n
-                if (not is_married_to(table[i], table[a]) and
-                        not is_married_to(table[j], table[b])):
+                if (spouse[table[i]] != table[a] and
+                        spouse[table[j]] != table[b]):
                     table[j], table[a] = table[a], table[j]
                     break
     return table
 
 
-def valid_alternating_seating(table: List[Guest]) -> bool:
+def valid_alternating_seating(problem: Problem, table: List[int]) -> bool:
     """True if genders alternate for all adjacent seats around the table."""
     n = len(table)
     if n <= 1:
         return True
+    gender = problem.gender
     for i in range(n):
-        g1 = table[i].gender
-        g2 = table[(i + 1) % n].gender
-        if g1 and g2 and g1 == g2:
+        g1 = gender[table[i]]
+        if g1 and g1 == gender[table[(i + 1) % n]]:
             return False
     return True
 
 
-def count_adjacent_singles(table: List[Guest]) -> int:
+def count_adjacent_singles(problem: Problem, table: List[int]) -> int:
     """Count adjacent single–single pairs around the table (circular)."""
     n = len(table)
     if n == 0:
         return 0
+    single = problem.single
     count = 0
     for i in range(n):
-        if ((table[i].marital_status or "") == "Single" and
-                (table[(i + 1) % n].marital_status or "") == "Single"):
+        if single[table[i]] and single[table[(i + 1) % n]]:
             count += 1
     return count
 
 
-def count_split_couples(seating1: List[Guest], seating2: List[Guest]) -> int:
-    """Count unique married couples split between two tables."""
-    split = set()
-    for p1 in seating1:
-        for p2 in seating2:
-            if is_married_to(p1, p2):
-                key = tuple(sorted((p1.id, p2.id)))
-                split.add(key)
-    return len(split)
+def count_split_couples(problem: Problem, table_of: List[int]) -> int:
+    """
+    Count unique married couples split between tables.
+
+    `table_of[g]` is the table index guest g is seated at (-1 if unseated).
+    """
+    spouse = problem.spouse
+    split = 0
+    for a, b in enumerate(spouse):
+        if b > a and table_of[a] != -1 and table_of[b] != -1 and table_of[a] != table_of[b]:
+            split += 1
+    return split
 
 
-def count_wants_score(seating: List[Guest]) -> int:
+def count_wants_score(problem: Problem, seating: List[int]) -> int:
     """Count how many 'wants to sit next to' constraints are satisfied at a table."""
     n = len(seating)
+    wants_all = problem.wants
     score = 0
     for i, person in enumerate(seating):
-        wants = person.wants_to_sit_next_to or []
+        wants = wants_all[person]
         if not wants:
             continue
-        left = seating[(i - 1) % n]
-        right = seating[(i + 1) % n]
-        if left.id in wants or right.id in wants:
+        if seating[(i - 1) % n] in wants or seating[(i + 1) % n] in wants:
             score += 1
     return score
 
 
-def count_must_not_violations(seating: List[Guest]) -> int:
+def count_must_not_violations(problem: Problem, seating: List[int]) -> int:
     """Count violations of 'must not sit next to' at a table."""
     n = len(seating)
+    must_not_all = problem.must_not
     violations = 0
     for i, person in enumerate(seating):
-        must_not = person.must_not_sit_next_to or []
+        must_not = must_not_all[person]
         if not must_not:
             continue
-        left = seating[(i - 1) % n]
-        right = seating[(i + 1) % n]
-        if left.id in must_not or right.id in must_not:
+        if seating[(i - 1) % n] in must_not or seating[(i + 1) % n] in must_not:
             violations += 1
     return violations
 
 
-def count_same_gender_adjacencies(table: List[Guest]) -> int:
+def count_same_gender_adjacencies(problem: Problem, table: List[int]) -> int:
     """Count adjacent MM or FF pairs around a table (circular)."""
     n = len(table)
     if n == 0:
         return 0
+    gender = problem.gender
     count = 0
     for i in range(n):
-        g1 = table[i].gender
-        g2 = table[(i + 1) % n].gender
-        if g1 and g2 and g1 == g2:
+        g1 = gender[table[i]]
+        if g1 and g1 == gender[table[(i + 1) % n]]:
             count += 1
     return count
 
 
-def scoring_tuple(
-    must_not_violations: int,
-    wants_score: int,
-    alternating_score: int,
-    split_couples: int,
-    adjacent_singles: int,
-    weights: Weights,
-) -> tuple:
-    """
-    Weighted scoring (wedding_default profile).
-
-    Weights:
-      - must_not        → penalty for violations    (higher = harsher)
-      - wants           → reward for satisfied wants
-      - adjacent_singles→ reward
-      - alternating     → reward
-      - split_couples   → reward (or set to 0 to ignore)
-    """
-    return (
-        # minimise weighted must-not violations
-        weights.must_not * must_not_violations,
-        # then maximise others (negative because smaller tuple is "better")
-        -weights.wants * wants_score,
-        -weights.adjacent_singles * adjacent_singles,
-        -weights.alternating * alternating_score,
-        -weights.split_couples * split_couples,
+def table_assignment(problem: Problem, seatings: List[List[int]]) -> List[int]:
+    """Map each guest index to the index of the table they are seated at."""
+    table_of = [-1] * problem.num_guests
+    for t, seating in enumerate(seatings):
+        for g in seating:
+            table_of[g] = t
+    return table_of
+
+
+def compute_metrics(problem: Problem, seatings: List[List[int]]) -> SeatingMetrics:
+    """Compute every SeatingMetrics field for a full plan."""
+    return SeatingMetrics(
+        must_not_violations=sum(count_must_not_violations(problem, s) for s in seatings),
+        wants_satisfied=sum(count_wants_score(problem, s) for s in seatings),
+        adjacent_singles=sum(count_adjacent_singles(problem, s) for s in seatings),
+        same_gender_adjacencies=sum(
+            count_same_gender_adjacencies(problem, s) for s in seatings
+        ),
+        alternating_tables=sum(
+            1 for s in seatings if valid_alternating_seating(problem, s)
+        ),
+        split_couples=count_split_couples(problem, table_assignment(problem, seatings)),
     )
 
 
-def normalise_weights(weights_input: Optional[Mapping[str, float]]) -> Weights:
-    """
-    Convert the API weights dict (with keys like `mustNotWeight`) into
-    the internal Weights dataclass.
+# SeatingMetrics counts for scoring_tuple()'s terms, in SCORE_TERMS order
+_TERM_COUNTS = (
+    lambda problem, seatings: sum(count_must_not_violations(problem, s) for s in seatings),
+    lambda problem, seatings: sum(count_wants_score(problem, s) for s in seatings),
+    lambda problem, seatings: sum(count_adjacent_singles(problem, s) for s in seatings),
+    lambda problem, seatings: sum(1 for s in seatings if valid_alternating_seating(problem, s)),
+    lambda problem, seatings: count_split_couples(problem, table_assignment(problem, seatings)),
+)
+
 
-    If None or empty, fall back to DEFAULT_WEIGHTS.
+def score_if_better(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    best_score: Optional[tuple],
+    lower_bound: Optional[tuple] = None,
+) -> Optional[tuple]:
     """
-    if not weights_input:
-        return DEFAULT_WEIGHTS
+    The plan's scoring tuple if it beats `best_score`, else None.
 
-    return Weights(
-        must_not=int(weights_input.get("mustNotWeight", DEFAULT_WEIGHTS.must_not)),
-        wants=int(weights_input.get("wantsWeight", DEFAULT_WEIGHTS.wants)),
-        adjacent_singles=int(
-            weights_input.get("adjacentSinglesWeight", DEFAULT_WEIGHTS.adjacent_singles)
-        ),
-        # We don't currently have a separate same-gender weight in Weights;
-        # you can wire that in later if you want it to affect core scoring.
-        alternating=int(
-            weights_input.get("alternatingTablesWeight", DEFAULT_WEIGHTS.alternating)
-        ),
-        split_couples=int(
-            weights_input.get("splitCouplesWeight", DEFAULT_WEIGHTS.split_couples)
-        ),
-    )
+    Terms are computed in priority order and the rest skipped as soon as
+    the plan is behind `best_score`, or tied with it while `best_score`
+    already meets `lower_bound` on every remaining term. Zero-weight terms
+    are never computed.
+    """
+    if best_score is None:
+        return metrics_score(compute_metrics(problem, seatings), weights)
+    settled = unbeatable_from(best_score, lower_bound)
+    score = []
+    tied = True
+    for k, (_, attr, sign) in enumerate(SCORE_TERMS):
+        weight = getattr(weights, attr)
+        value = sign * weight * _TERM_COUNTS[k](problem, seatings) if weight else 0
+        score.append(value)
+        if tied:
+            if value > best_score[k]:
+                return None
+            if value < best_score[k]:
+                tied = False
+            elif k + 1 >= settled:
+                return None
+    return tuple(score)
 
 
 # -------------------------
 # Core solver
 # -------------------------
 
-def solve(
-    guests: List[Guest],
-    tables: List[Table],
-    profile: str = "wedding_default",
-    weights: Optional[Dict[str, float]] = None,
-    max_attempts: int = 1000,
-    seed: Optional[int] = None,
-) -> SeatingPlan:
+# Improvement phases run on the best constructed plan: engine name ->
+# (config dataclass built from engine_options, refine function).
+REFINERS = {
+    "anneal": (AnnealSchedule, anneal),
+    "tabu": (TabuConfig, tabu_search),
+    "two_phase": (TwoPhaseConfig, two_phase),
+    "partition": (PartitionConfig, partition),
+    "genetic": (GeneticConfig, genetic),
+    "lns": (LNSConfig, lns),
+}
+
+ENGINES = ("random",) + tuple(REFINERS)
+
+# Random-restart attempts generated and scored per NumPy batch
+CONSTRUCTION_BATCH = 256
+
+# More worker processes than cores only add fork and pickling overhead
+MAX_WORKERS = os.cpu_count() or 1
+
+
+def _engine_config(config_cls, options: Optional[Dict[str, Any]]):
+    """Build an engine's config dataclass from API/CLI options."""
+    try:
+        return config_cls(**(options or {}))
+    except TypeError as e:
+        raise ValueError(f"Invalid engine options: {e}") from e
+
+
+@dataclass
+class _SearchSettings:
+    """Everything a search needs besides the problem and the RNG (picklable)."""
+    weights: Weights
+    max_attempts: int
+    engine: str
+    engine_config: Any
+    stagnation_window: Optional[int] = None
+    hard_must_not: bool = False
+    split_components: bool = False
+    pareto: bool = False
+
+
+@dataclass
+class _SearchResult:
+    score: Optional[tuple]
+    seatings: List[List[int]]
+    metrics: SeatingMetrics
+    attempts: int               # attempt the plan was found at (total if final)
+    final: bool = False
+    archive: Optional[ParetoArchive] = None     # (seatings, metrics) items, final only
+
+
+def _construct(problem: Problem, rng: random.Random) -> Optional[List[List[int]]]:
     """
-    Core solver entrypoint.
+    One random-restart attempt: shuffle the gender pools and build every
+    table, or place parties as units (see construct_with_parties) when the
+    event has any.
+    """
+    if problem.parties:
+        seatings = construct_with_parties(problem, rng)
+        if seatings is None:
+            return None
+        return [
+            s if has_fixed_party(problem, s) else ensure_no_adjacent_couples(problem, s)
+            for s in seatings
+        ]
 
-    `weights` is expected to be a dict from the API (keys like mustNotWeight).
+    males = problem.males[:]
+    females = problem.females[:]
+    rng.shuffle(males)
+    rng.shuffle(females)
+
+    seatings: List[List[int]] = []
+
+    # Build each table from gender pools
+    for size in problem.table_sizes:
+        table_seating = build_table_seating(males, females, size)
+        if table_seating is None or len(table_seating) != size:
+            return None
+        seatings.append(table_seating)
+
+    # Apply couple separation heuristic (but respect explicit "wants")
+    return [ensure_no_adjacent_couples(problem, s) for s in seatings]
+
+
+def construction_layout(problem: Problem) -> Optional[List[List[int]]]:
     """
+    Where _construct() seats each gender-pool slot, table by table.
 
-    if seed is not None:
-        random.seed(seed)
+    The per-table male / female quotas in build_table_seating() depend
+    only on how many guests are left in each pool, never on who they are,
+    so every attempt fills the same slots; this runs it once on slot
+    numbers (males first, then females) instead of guests. None if the
+    tables cannot be built from the pools.
+    """
+    num_males = len(problem.males)
+    males = list(range(num_males))
+    females = list(range(num_males, num_males + len(problem.females)))
+    layout: List[List[int]] = []
+    for size in problem.table_sizes:
+        table_seating = build_table_seating(males, females, size)
+        if table_seating is None or len(table_seating) != size:
+            return None
+        layout.append(table_seating)
+    return layout
 
-    # Normalise weights dict -> Weights dataclass
-    effective_weights = normalise_weights(weights)
 
-    total_capacity = sum(t.capacity for t in tables)
-    if len(guests) > total_capacity:
-        raise ValueError(
-            f"Not enough seats: {len(guests)} guests but only {total_capacity} seats."
-        )
+def separate_couples(problem: Problem, batch: BatchEvaluator, plans: np.ndarray) -> np.ndarray:
+    """
+    ensure_no_adjacent_couples() on every table of every row of a batch
+    matrix, as _construct() applies it, so rows score as the plans they
+    become. Only rows with a couple seated side by side are touched.
+    """
+    spouse = np.asarray(problem.spouse, dtype=np.int64)
+    adjacent = (spouse[plans] == plans[:, batch.right]).any(axis=1)
+    for r in np.nonzero(adjacent)[0].tolist():
+        tables = [ensure_no_adjacent_couples(problem, s) for s in batch.to_seatings(plans[r])]
+        plans[r] = [g for seats in tables for g in seats]
+    return plans
 
-    num_tables = len(tables)
-    total_guests = len(guests)
 
-    # Decide actual number of seats per table (e.g. 39 guests across 2x20 → [20, 19])
-    base_size = total_guests // num_tables
-    extra = total_guests % num_tables
-    table_sizes = [base_size + (1 if i < extra else 0) for i in range(num_tables)]
+def _order_exactly(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    stop: StopCriteria,
+) -> List[List[int]]:
+    """
+    Reorder every table small enough for exact_table_order(); larger
+    tables keep the ensure_no_adjacent_couples() order from construction.
+    """
+    cache: OrderCache = {}
+    ordered = []
+    for seats in seatings:
+        order = None if stop.expired() else exact_table_order(problem, seats, weights, cache)
+        ordered.append(order or seats)
+    return ordered
+
+
+def _iter_search(
+    problem: Problem,
+    settings: _SearchSettings,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> Iterator[_SearchResult]:
+    """
+    Random-restart construction, exact seat ordering of the best plan's
+    small tables, then the engine's improvement phase.
+
+    Yields every new best plan as it is found, then a final result carrying
+    the total attempt count. Stops at `max_attempts`, when `stop` expires,
+    as soon as a plan reaches the proven bound / target score, or after
+    `stagnation_window` attempts without improvement (handing over to the
+    engine's improvement phase, if any); at least one attempt is always made.
+
+    With `hard_must_not`, plans are built by construct_feasible() (which
+    keeps parties together) and the later phases search with must-not
+    violations weighted out of reach.
+
+    With `pareto`, every constructed plan is offered to a ParetoArchive
+    (so every restart is fully scored), as are the exactly ordered and
+    refined plans; the final result carries it.
+    """
+    weights = settings.weights
+    search_weights = weights
+    if settings.hard_must_not:
+        search_weights = replace(weights, must_not=HARD_MUST_NOT_WEIGHT)
+    best = _SearchResult(
+        score=None,
+        seatings=[[] for _ in range(problem.num_tables)],
+        metrics=SeatingMetrics(
+            must_not_violations=10 ** 9,
+            wants_satisfied=-1,
+            adjacent_singles=-1,
+            same_gender_adjacencies=-1,
+            alternating_tables=-1,
+            split_couples=-1,
+        ),
+        attempts=0,
+    )
+    attempts_made = 0
+    window = settings.stagnation_window
+    archive = ParetoArchive() if settings.pareto else None
+    # construct_feasible() restarts get a doubled node budget after each
+    # failure, so small instances are eventually searched exhaustively
+    node_limit = FEASIBLE_NODES_PER_GUEST * max(problem.num_guests, 1)
+    max_node_limit = FEASIBLE_NODE_GROWTH * node_limit
+
+    def archive_plan(seatings: List[List[int]], metrics: SeatingMetrics) -> None:
+        if archive is not None:
+            archive.add(objective_vector(metrics), (seatings, metrics))
+
+    # Plain random restarts are built, couple-separated and scored
+    # CONSTRUCTION_BATCH at a time; only rows that beat the best so far
+    # become Python plans.
+    batched = not settings.hard_must_not and not problem.parties
+    if batched:
+        layout = construction_layout(problem)
+        batch = BatchEvaluator(problem)
+        gen = np.random.default_rng(rng.getrandbits(64))
+        pending: List[Tuple[list, np.ndarray]] = []
+
+    for attempt in range(1, settings.max_attempts + 1):
+        attempts_made += 1
 
-    # Guard: no table size should exceed declared capacity
-    for size, t in zip(table_sizes, tables):
-        if size > t.capacity:
-            raise ValueError(
-                f"Table {t.name} capacity {t.capacity} is too small for assigned {size} guests."
+        if batched:
+            seatings = None
+            if layout is not None:
+                if not pending:
+                    count = min(CONSTRUCTION_BATCH, settings.max_attempts - attempt + 1)
+                    plans = separate_couples(
+                        problem, batch, random_plans(problem, layout, gen, count)
+                    )
+                    if archive is None:
+                        scores, better = batch.scores_if_better(
+                            plans, weights, best.score, stop.lower_bound
+                        )
+                    else:
+                        metrics_rows = batch.metrics_matrix(plans)
+                        scores = score_matrix(metrics_rows, weights)
+                        better = np.ones(count, dtype=bool)
+                        objectives = objective_matrix(metrics_rows)
+                        for r in pareto_front(objectives).tolist():
+                            counts = dict(zip(METRIC_FIELDS, metrics_rows[r].tolist()))
+                            archive_plan(batch.to_seatings(plans[r]), SeatingMetrics(**counts))
+                    pending = [
+                        (tuple(score) if keep else None, row)
+                        for score, keep, row in zip(scores.tolist(), better.tolist(), plans)
+                    ]
+                    pending.reverse()
+                row_score, row = pending.pop()
+                if row_score is not None and (best.score is None or row_score < best.score):
+                    seatings = batch.to_seatings(row)
+        elif settings.hard_must_not:
+            seatings = construct_feasible(problem, rng, node_limit)
+            if seatings is None:
+                node_limit = min(2 * node_limit, max_node_limit)
+        else:
+            seatings = _construct(problem, rng)
+        if not batched and seatings is not None and archive is not None:
+            archive_plan(seatings, compute_metrics(problem, seatings))
+        if seatings is not None:
+            current_score = score_if_better(
+                problem, seatings, weights, best.score, stop.lower_bound
             )
+            if current_score is not None:
+                metrics = compute_metrics(problem, seatings)
+                archive_plan(seatings, metrics)
+                best = _SearchResult(current_score, seatings, metrics, attempt)
+                yield best
+                if stop.reached(best.score):
+                    break
 
-    # Pre-split by gender (Other/None are ignored for now)
-    males_all = [g for g in guests if (g.gender or "").lower().startswith("m")]
-    females_all = [g for g in guests if (g.gender or "").lower().startswith("f")]
+        if stop.expired():
+            break
+        if window is not None and attempt - best.attempts >= window:
+            break
+
+    # Provably best seat order for the small tables of the best plan
+    if best.score is not None and not stop.reached(best.score):
+        seatings = _order_exactly(problem, best.seatings, search_weights, stop)
+        metrics = compute_metrics(problem, seatings)
+        archive_plan(seatings, metrics)
+        current_score = metrics_score(metrics, weights)
+        if current_score < best.score:
+            best = _SearchResult(current_score, seatings, metrics, attempts_made)
+            yield best
+
+    # Optional improvement phase on the best constructed plan
+    refiner = REFINERS.get(settings.engine)
+    if refiner and best.score is not None and not stop.reached(best.score):
+        refined = refiner[1](
+            problem, best.seatings, search_weights, settings.engine_config, rng, stop
+        )
+        metrics = refined.metrics()
+        archive_plan(refined.seatings, metrics)
+        best = _SearchResult(
+            metrics_score(metrics, weights), refined.seatings, metrics, attempts_made
+        )
 
-    # If there are guests with other/unknown genders, just add them to the larger pool
-    others = [g for g in guests if g not in males_all and g not in females_all]
-    if others:
-        if len(males_all) >= len(females_all):
-            males_all.extend(others)
-        else:
-            females_all.extend(others)
-
-    best_seatings: List[List[Guest]] = [[] for _ in range(num_tables)]
-    best_score: Optional[tuple] = None
-    best_metrics = SeatingMetrics(
-        must_not_violations=10 ** 9,
-        wants_satisfied=-1,
-        adjacent_singles=-1,
-        same_gender_adjacencies=-1,
-        alternating_tables=-1,
-        split_couples=-1,
+    yield _SearchResult(
+        best.score, best.seatings, best.metrics, attempts_made, final=True, archive=archive
     )
-    attempts_made = 0
 
-    for attempt in range(1, max_attempts + 1):
-        attempts_made += 1
 
-        males = males_all[:]
-        females = females_all[:]
-        random.shuffle(males)
-        random.shuffle(females)
+def _search(
+    problem: Problem,
+    settings: _SearchSettings,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> _SearchResult:
+    """Run _iter_search() to completion and return the final result."""
+    result = None
+    for result in _iter_search(problem, settings, rng, stop):
+        pass
+    return result
 
-        seatings: List[List[Guest]] = []
-        success = True
 
-        # Build each table from gender pools
-        for size in table_sizes:
-            table_seating = build_table_seating(males, females, size)
-            if table_seating is None or len(table_seating) != size:
-                success = False
-                break
-            seatings.append(table_seating)
+def _deadline(time_budget_ms: Optional[float], started: float) -> Optional[float]:
+    if time_budget_ms is None:
+        return None
+    return started + time_budget_ms / 1000.0
 
-        if not success:
-            continue
 
-        # Apply couple separation heuristic (but respect explicit "wants")
-        seatings = [ensure_no_adjacent_couples(s) for s in seatings]
+# -------------------------
+# Parallel restarts
+# -------------------------
 
-        # Compute metrics
-        total_adjacent_singles = sum(count_adjacent_singles(s) for s in seatings)
-        split_couples = sum(
-            count_split_couples(s1, s2)
-            for i, s1 in enumerate(seatings)
-            for s2 in seatings[i + 1:]
-        )
-        alternating_tables_count = sum(
-            1 for s in seatings if valid_alternating_seating(s)
-        )
-        total_wants_score = sum(count_wants_score(s) for s in seatings)
-        total_must_not_violations = sum(count_must_not_violations(s) for s in seatings)
-        same_gender_adjacent = sum(count_same_gender_adjacencies(s) for s in seatings)
-
-        current_score = scoring_tuple(
-            total_must_not_violations,
-            total_wants_score,
-            alternating_tables_count,
-            split_couples,
-            total_adjacent_singles,
-            effective_weights,
-        )
+def worker_seed(seed: int, worker: int) -> int:
+    """
+    Derive an independent, reproducible seed for one worker from the
+    request seed (string seeds are hashed with SHA-512 by `random`).
+    """
+    return random.Random(f"{seed}:{worker}").getrandbits(64)
+
+
+def _search_worker(
+    problem: Problem,
+    settings: _SearchSettings,
+    seed: int,
+    stop: StopCriteria,
+    time_budget_ms: Optional[float],
+) -> _SearchResult:
+    rng = random.Random(seed)
+    # Deadlines are taken per process: perf_counter() is not shared
+    stop = replace(stop, deadline=_deadline(time_budget_ms, time.perf_counter()))
+    return _search(problem, settings, rng, stop)
+
+
+def _iter_parallel_search(
+    problem: Problem,
+    settings: _SearchSettings,
+    seed: Optional[int],
+    workers: int,
+    rng: random.Random,
+    stop: StopCriteria,
+    time_budget_ms: Optional[float],
+) -> Iterator[_SearchResult]:
+    """
+    Split the attempt budget across a process pool and merge the results.
+
+    Workers are merged in index order (ties go to the lower index), so the
+    same seed and worker count always give the same plan. Yields the merged
+    best as it improves, then a final result with the total attempt count.
+    """
+    if seed is None:
+        seed = rng.getrandbits(64)
+
+    max_attempts = settings.max_attempts
+    workers = min(workers, max_attempts)
+    budgets = [
+        max_attempts // workers + (1 if i < max_attempts % workers else 0)
+        for i in range(workers)
+    ]
 
-        if best_score is None or current_score < best_score:
-            best_score = current_score
-            best_seatings = seatings
-            best_metrics = SeatingMetrics(
-                must_not_violations=total_must_not_violations,
-                wants_satisfied=total_wants_score,
-                adjacent_singles=total_adjacent_singles,
-                same_gender_adjacencies=same_gender_adjacent,
-                alternating_tables=alternating_tables_count,
-                split_couples=split_couples,
+    best: Optional[_SearchResult] = None
+    attempts_made = 0
+    archive = ParetoArchive() if settings.pareto else None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _search_worker,
+                problem,
+                replace(settings, max_attempts=budget),
+                worker_seed(seed, i),
+                stop,
+                time_budget_ms,
             )
+            for i, budget in enumerate(budgets)
+        ]
+        for future in futures:
+            r = future.result()
+            attempts_made += r.attempts
+            if archive is not None and r.archive is not None:
+                archive.update(r.archive)
+            if best is None or (
+                r.score is not None and (best.score is None or r.score < best.score)
+            ):
+                best = _SearchResult(r.score, r.seatings, r.metrics, attempts_made)
+                if best.score is not None:
+                    yield best
+
+    yield _SearchResult(
+        best.score, best.seatings, best.metrics, attempts_made, final=True, archive=archive
+    )
+
+
+# -------------------------
+# Independent components
+# -------------------------
+
+# A sub-problem and the full problem's indices of its guests and tables
+_Component = Tuple[Problem, List[int], List[int]]
 
-    # Convert best_seatings into SeatingPlan
+
+def _component_problems(problem: Problem) -> Optional[List[_Component]]:
+    """
+    Split `problem` into independent sub-problems (see pack_components),
+    or None if it does not split or a part cannot seat its guests. Parts
+    only get the tables packed for them, so a part whose must-not pairs
+    cannot all be met there (check_feasibility) also leaves the problem
+    whole.
+    """
+    groups = pack_components(problem, constraint_components(problem))
+    if not groups or len(groups) < 2:
+        return None
+    parts: List[_Component] = []
+    for guests, tables in groups:
+        try:
+            sub = compile_problem(
+                [problem.guests[g] for g in guests],
+                [problem.tables[t] for t in tables],
+            )
+        except ValueError:
+            return None
+        if check_feasibility(sub):
+            return None
+        parts.append((sub, guests, tables))
+    return parts
+
+
+def _iter_component_search(
+    problem: Problem,
+    parts: List[_Component],
+    settings: _SearchSettings,
+    seed: Optional[int],
+    workers: int,
+    rng: random.Random,
+    stop: StopCriteria,
+    time_budget_ms: Optional[float],
+    started: float,
+) -> Iterator[_SearchResult]:
+    """
+    Solve independent sub-problems (in a process pool with `workers` > 1)
+    and merge them into one plan for `problem`.
+
+    Part i is searched with seed worker_seed(seed, i) whatever the worker
+    count, so results do not depend on it. Each part stops at its own
+    proven bound; the target score only applies to the whole plan.
+
+    `max_attempts` and the time budget are shared out in proportion to
+    part size. Parts run one after another get their share of the time
+    still left when they start, so time a part does not use passes on to
+    the next. If any part cannot be solved, the whole problem is searched
+    as usual instead.
+    """
+    if seed is None:
+        seed = rng.getrandbits(64)
+
+    sizes = [sub.num_guests for sub, _, _ in parts]
+    total = sum(sizes) or 1
+    budgets = [max(1, round(settings.max_attempts * n / total)) for n in sizes]
+    part_settings = [replace(settings, max_attempts=b) for b in budgets]
+    stops = [
+        replace(stop, lower_bound=score_lower_bound(sub, settings.weights), target=None)
+        for sub, _, _ in parts
+    ]
+
+    def remaining_ms() -> Optional[float]:
+        if time_budget_ms is None:
+            return None
+        return max(time_budget_ms - (time.perf_counter() - started) * 1000.0, 1.0)
+
+    results: List[_SearchResult] = []
+    try:
+        if workers > 1:
+            slots = min(workers, len(parts))
+            left = remaining_ms()
+            # Parts share `slots` processes, so each gets its share of that much time
+            part_ms = [None if left is None else min(left, left * slots * n / total) for n in sizes]
+            with ProcessPoolExecutor(max_workers=slots) as pool:
+                futures = [
+                    pool.submit(
+                        _search_worker, sub, part_settings[i], worker_seed(seed, i), s, part_ms[i]
+                    )
+                    for i, ((sub, _, _), s) in enumerate(zip(parts, stops))
+                ]
+                results = [f.result() for f in futures]
+        else:
+            for i, ((sub, _, _), s) in enumerate(zip(parts, stops)):
+                left = remaining_ms()
+                if left is not None:
+                    left *= sizes[i] / sum(sizes[i:])
+                s = replace(s, deadline=_deadline(left, time.perf_counter()))
+                rng_i = random.Random(worker_seed(seed, i))
+                results.append(_search(sub, part_settings[i], rng_i, s))
+    except InfeasibleError:
+        # A part cannot be seated on its own tables; the whole problem may be
+        results = []
+
+    if not results or any(r.score is None for r in results):
+        stop = replace(stop, deadline=_deadline(time_budget_ms, started))
+        yield from _iter_search(problem, settings, rng, stop)
+        return
+
+    seatings: List[List[int]] = [[] for _ in range(problem.num_tables)]
+    for (_, guests, tables), r in zip(parts, results):
+        for t, seats in zip(tables, r.seatings):
+            seatings[t] = [guests[g] for g in seats]
+    attempts = sum(r.attempts for r in results)
+    metrics = compute_metrics(problem, seatings)
+    yield _SearchResult(metrics_score(metrics, settings.weights), seatings, metrics, attempts, final=True)
+
+
+# -------------------------
+# Entry points
+# -------------------------
+
+def _to_plan(
+    problem: Problem,
+    result: _SearchResult,
+    elapsed_ms: float,
+    curve: List[ImprovementPoint],
+    conflicts: List[Conflict],
+) -> SeatingPlan:
+    """Convert a search result's index seatings into a SeatingPlan."""
     table_seatings: List[TableSeating] = []
-    for table, guest_list in zip(tables, best_seatings):
+    for table, guest_list in zip(problem.tables, result.seatings):
         seats = [
-            GuestSeat(seat_index=i, guest_id=g.id)
+            GuestSeat(seat_index=i, guest_id=problem.ids[g])
             for i, g in enumerate(guest_list)
         ]
         table_seatings.append(TableSeating(table_id=table.id, seats=seats))
 
     return SeatingPlan(
         tables=table_seatings,
-        metrics=best_metrics,
-        attempts_made=attempts_made,
+        metrics=result.metrics,
+        attempts_made=result.attempts,
+        elapsed_ms=elapsed_ms,
+        improvement_curve=curve,
+        conflicts=conflicts,
+    )
+
+
+def iter_solve(
+    guests: List[Guest],
+    tables: List[Table],
+    profile: str = "wedding_default",
+    weights: Optional[Dict[str, float]] = None,
+    max_attempts: int = 1000,
+    seed: Optional[int] = None,
+    engine: str = "random",
+    engine_options: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+    rng: Optional[random.Random] = None,
+    time_budget_ms: Optional[float] = None,
+    target_score: Optional[float] = None,
+    stagnation_window: Optional[int] = None,
+    hard_must_not: bool = False,
+    split_components: bool = False,
+    pareto: bool = False,
+) -> Iterator[SolveProgress]:
+    """
+    Anytime solver: yields a SolveProgress for each new best plan as soon
+    as it is found, then a final one (`final=True`) whose plan carries the
+    total attempts made. Callers may stop iterating at any point.
+
+    Arguments are the same as solve(). Input errors raise ValueError here,
+    before the first plan is produced. If no plan at all can be built,
+    ValueError is raised at the final step instead of yielding an empty
+    plan.
+
+    `weights` is expected to be a dict from the API (keys like mustNotWeight).
+    Guests and tables are compiled once into an integer-indexed Problem
+    before any attempt is made.
+
+    `engine` selects what happens after random-restart construction:
+      - "random" → keep the best constructed plan
+      - "anneal" → refine it with simulated annealing; `engine_options`
+                   are passed to AnnealSchedule (steps, temperatures, ...)
+      - "tabu"   → refine it with tabu search; `engine_options` are
+                   passed to TabuConfig (iterations, tenure, ...)
+      - "two_phase" → re-partition guests into tables for the inter-table
+                   terms, then order each table on its own; `engine_options`
+                   are passed to TwoPhaseConfig
+      - "partition" → build the table assignment by graph partitioning of
+                   the wants / must-not / couple graph, then order each
+                   table; `engine_options` are passed to PartitionConfig
+      - "genetic" → evolve a population seeded from it with permutation
+                   crossover, swap mutation and seat-swap polishing;
+                   `engine_options` are passed to GeneticConfig
+      - "lns"    → repeatedly rebuild its worst tables (or a random set of
+                   seats) and keep rebuilds that score no worse;
+                   `engine_options` are passed to LNSConfig
+
+    With `workers` > 1 the attempt budget is split across a process pool,
+    each worker seeded from `worker_seed(seed, i)`. Values above
+    MAX_WORKERS (the CPU count) are clamped to it.
+
+    All randomness comes from `rng` (default: `random.Random(seed)`), never
+    the global `random` module, so concurrent solves in one process do not
+    interfere and a given seed always reproduces the same plan.
+
+    `time_budget_ms` caps wall-clock time: the solver stops at the deadline
+    (or at `max_attempts`, whichever comes first) and returns the best plan
+    so far. Plans report `attempts_made` and `elapsed_ms`.
+
+    The search also stops as soon as a plan provably cannot be beaten (it
+    matches score_lower_bound()) or its weighted total (scalar_score) is
+    at or below `target_score`.
+
+    With `stagnation_window`, random restarts stop after that many attempts
+    without improving the best score; the engine's improvement phase (if
+    any) then takes over. Plans carry the improvement curve (attempt,
+    elapsed time and weighted score of each new best).
+
+    With `hard_must_not`, must-not pairs are hard constraints: the instance
+    is checked up front (check_feasibility) and an InfeasibleError carrying
+    the conflicts is raised if no plan can satisfy them; otherwise only
+    violation-free plans are built and searched. If the search ends without
+    building any, InfeasibleError is raised during iteration instead, with
+    an "exhausted" conflict. Either way, every plan lists the conflicts
+    found in the constraint graph (see analyse_conflicts()).
+
+    With `split_components`, guests with no constraint path between them
+    are packed onto separate sets of tables and each part is solved on its
+    own (concurrently with `workers` > 1), then merged into one plan. Parts
+    cannot trade seats, so adjacent-singles and alternation across parts
+    are not optimised jointly.
+
+    With `pareto`, the search also keeps every plan no other plan seen
+    beats on all five scoring terms (see ParetoArchive), and the final
+    plan lists them as `alternatives`, one per trade-off, in scoring_tuple
+    order. The winner under `weights` is still chosen as usual. None are
+    collected when `split_components` splits the event, since its parts
+    are only merged once.
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}."
+        )
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    if time_budget_ms is not None and time_budget_ms <= 0:
+        raise ValueError("time_budget_ms must be positive.")
+    if stagnation_window is not None and stagnation_window < 1:
+        raise ValueError("stagnation_window must be at least 1.")
+
+    started = time.perf_counter()
+    workers = min(workers, MAX_WORKERS)
+
+    refiner = REFINERS.get(engine)
+    engine_config = _engine_config(refiner[0], engine_options) if refiner else None
+
+    settings = _SearchSettings(
+        # Normalise weights dict -> Weights dataclass
+        weights=normalise_weights(weights),
+        max_attempts=max_attempts,
+        engine=engine,
+        engine_config=engine_config,
+        stagnation_window=stagnation_window,
+        hard_must_not=hard_must_not,
+        split_components=split_components,
+        pareto=pareto,
+    )
+
+    # One-time compile: guests become dense indices, constraints become sets
+    problem = compile_problem(guests, tables)
+
+    # Constraint-graph analysis is cheap; plans report what it finds
+    conflicts = check_feasibility(problem)
+    if hard_must_not and conflicts:
+        raise InfeasibleError(conflicts)
+    conflicts += wants_conflicts(problem)
+
+    if rng is None:
+        rng = random.Random(seed)
+
+    stop = StopCriteria(
+        lower_bound=score_lower_bound(problem, settings.weights),
+        target=target_score,
+    )
+
+    return _iter_progress(
+        problem, settings, seed, workers, rng, stop, time_budget_ms, started, conflicts
+    )
+
+
+def _iter_progress(
+    problem: Problem,
+    settings: _SearchSettings,
+    seed: Optional[int],
+    workers: int,
+    rng: random.Random,
+    stop: StopCriteria,
+    time_budget_ms: Optional[float],
+    started: float,
+    conflicts: List[Conflict],
+) -> Iterator[SolveProgress]:
+    parts = _component_problems(problem) if settings.split_components else None
+    if parts:
+        results = _iter_component_search(
+            problem, parts, settings, seed, workers, rng, stop, time_budget_ms, started
+        )
+    elif workers > 1 and settings.max_attempts > 1:
+        remaining_ms = None
+        if time_budget_ms is not None:
+            remaining_ms = max(time_budget_ms - (time.perf_counter() - started) * 1000.0, 1.0)
+        results = _iter_parallel_search(
+            problem, settings, seed, workers, rng, stop, remaining_ms
+        )
+    else:
+        stop = replace(stop, deadline=_deadline(time_budget_ms, started))
+        results = _iter_search(problem, settings, rng, stop)
+
+    curve: List[ImprovementPoint] = []
+    for result in results:
+        if result.final and settings.hard_must_not and (
+            result.score is None or result.metrics.must_not_violations
+        ):
+            raise InfeasibleError(
+                [search_exhausted(result.attempts)],
+                message="No seating without must-not violations was found",
+            )
+        if result.final and result.score is None:
+            raise ValueError(
+                f"Could not construct any seating plan in {result.attempts} attempt(s)."
+            )
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if result.score is not None:
+            score = scalar_score(result.score)
+            if not curve or score < curve[-1].score:
+                curve.append(ImprovementPoint(result.attempts, elapsed_ms, score))
+        plan = _to_plan(problem, result, elapsed_ms, list(curve), conflicts)
+        if result.archive is not None:
+            plan.alternatives = [
+                _to_plan(
+                    problem,
+                    _SearchResult(None, seatings, metrics, result.attempts),
+                    elapsed_ms,
+                    [],
+                    [],
+                )
+                for _, (seatings, metrics) in result.archive.entries()
+            ]
+        yield SolveProgress(
+            plan=plan,
+            attempt=result.attempts,
+            elapsed_ms=elapsed_ms,
+            final=result.final,
+        )
+
+
+def analyse_conflicts(guests: List[Guest], tables: List[Table]) -> List[Conflict]:
+    """
+    Report constraints that cannot all be met, each with a small set of
+    guests involved, without running the solver (see find_conflicts).
+    Raises ValueError for input the solver would also reject.
+    """
+    return find_conflicts(compile_problem(guests, tables))
+
+
+# Candidate pools kept between sweep_weights() calls
+_POOLS = PoolCache()
+
+# Largest pool_size x guests a sweep may build (int32 plans: 40 MB per pool)
+MAX_POOL_SEATS = 10_000_000
+
+
+def candidate_pool(problem: Problem, size: int, rng: random.Random) -> CandidatePool:
+    """
+    Generate and score `size` random-restart plans once, CONSTRUCTION_BATCH
+    at a time (as NumPy batches, or one by one for events with parties),
+    so only the int32 plans and their metrics stay in memory.
+    """
+    batch = BatchEvaluator(problem)
+    layout = None if problem.parties else construction_layout(problem)
+    gen = np.random.default_rng(rng.getrandbits(64)) if layout is not None else None
+    plans, metrics = [], []
+    for start in range(0, size, CONSTRUCTION_BATCH):
+        count = min(CONSTRUCTION_BATCH, size - start)
+        if layout is not None:
+            chunk = separate_couples(problem, batch, random_plans(problem, layout, gen, count))
+        else:
+            built = [_construct(problem, rng) for _ in range(count)]
+            chunk = batch.to_matrix([s for s in built if s is not None])
+        plans.append(chunk.astype(np.int32))
+        metrics.append(batch.metrics_matrix(chunk))
+    return CandidatePool(problem, batch, np.concatenate(plans), np.concatenate(metrics))
+
+
+def _pool_key(guests: List[Guest], tables: List[Table], size: int, seed: Optional[int]) -> str:
+    content = json.dumps(
+        [[asdict(g) for g in guests], [asdict(t) for t in tables], size, seed],
+        sort_keys=True,
+        default=str,
     )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def sweep_weights(
+    guests: List[Guest],
+    tables: List[Table],
+    weight_configs: List[Optional[Dict[str, float]]],
+    pool_size: int = 2000,
+    seed: Optional[int] = None,
+    pareto: bool = False,
+    use_cache: bool = True,
+) -> WeightSweep:
+    """
+    Best plan for each of several weight settings from one shared pool of
+    `pool_size` random-restart candidates.
+
+    Candidate metrics do not depend on the weights, so the pool is built
+    and scored once and each weight config (API dicts, see
+    normalise_weights) only re-ranks it. Pools are cached by guests,
+    tables, pool size and seed, so a repeat call with new weights skips
+    straight to ranking. With `pareto`, the candidates no other candidate
+    beats on every scoring term are returned as well.
+
+    Raises ValueError for input solve() would also reject, a pool larger
+    than MAX_POOL_SEATS seats in total, or an empty pool.
+    """
+    started = time.perf_counter()
+    if pool_size < 1:
+        raise ValueError("pool_size must be at least 1")
+    if pool_size * len(guests) > MAX_POOL_SEATS:
+        raise ValueError(
+            f"pool_size {pool_size} is too large for {len(guests)} guests; "
+            f"at most {MAX_POOL_SEATS // max(len(guests), 1)} candidates fit."
+        )
+    weights_list = [normalise_weights(w) for w in weight_configs]
+
+    key = _pool_key(guests, tables, pool_size, seed)
+    pool = _POOLS.get(key) if use_cache else None
+    cached = pool is not None
+    if pool is None:
+        pool = candidate_pool(compile_problem(guests, tables), pool_size, random.Random(seed))
+        if pool.size == 0:
+            raise ValueError("Could not construct any candidate plan.")
+        if use_cache:
+            _POOLS.put(key, pool)
+
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+    def plan(row: int) -> SeatingPlan:
+        seatings = pool.seatings(row)
+        metrics = SeatingMetrics(**dict(zip(METRIC_FIELDS, pool.metrics[row].tolist())))
+        result = _SearchResult(None, seatings, metrics, pool.size)
+        return _to_plan(pool.problem, result, elapsed_ms, [], [])
+
+    plans = [plan(pool.best_for(w)) for w in weights_list]
+    front = [plan(row) for row in pool.pareto_rows()] if pareto else []
+    return WeightSweep(
+        plans=plans,
+        pareto=front,
+        pool_size=pool.size,
+        cached=cached,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+def solve(
+    guests: List[Guest],
+    tables: List[Table],
+    profile: str = "wedding_default",
+    weights: Optional[Dict[str, float]] = None,
+    max_attempts: int = 1000,
+    seed: Optional[int] = None,
+    engine: str = "random",
+    engine_options: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+    rng: Optional[random.Random] = None,
+    time_budget_ms: Optional[float] = None,
+    target_score: Optional[float] = None,
+    stagnation_window: Optional[int] = None,
+    hard_must_not: bool = False,
+    split_components: bool = False,
+    pareto: bool = False,
+) -> SeatingPlan:
+    """
+    Core solver entrypoint: runs iter_solve() to completion and returns
+    the final plan. See iter_solve() for the arguments.
+    """
+    progress = None
+    for progress in iter_solve(
+        guests,
+        tables,
+        profile=profile,
+        weights=weights,
+        max_attempts=max_attempts,
+        seed=seed,
+        engine=engine,
+        engine_options=engine_options,
+        workers=workers,
+        rng=rng,
+        time_budget_ms=time_budget_ms,
+        target_score=target_score,
+        stagnation_window=stagnation_window,
+        hard_must_not=hard_must_not,
+        split_components=split_components,
+        pareto=pareto,
+    ):
+        pass
+    return progress.plan
+
+
+def weight_sweep_to_dict(sweep: WeightSweep) -> Dict[str, Any]:
+    """Convert WeightSweep to a JSON-serialisable dict."""
+    return {
+        "plans": [seating_plan_to_dict(p) for p in sweep.plans],
+        "pareto": [seating_plan_to_dict(p) for p in sweep.pareto],
+        "poolSize": sweep.pool_size,
+        "cached": sweep.cached,
+        "elapsedMs": sweep.elapsed_ms,
+    }
 
 
 def seating_plan_to_dict(plan: SeatingPlan) -> Dict[str, Any]:
@@ -435,4 +1250,14 @@ def seating_plan_to_dict(plan: SeatingPlan) -> Dict[str, Any]:
             "splitCouples": plan.metrics.split_couples,
         },
         "attemptsMade": plan.attempts_made,
+        "elapsedMs": plan.elapsed_ms,
+        "improvementCurve": [
+            {"attempt": p.attempt, "elapsedMs": p.elapsed_ms, "score": p.score}
+            for p in plan.improvement_curve
+        ],
+        "conflicts": [
+            {"kind": c.kind, "guestIds": c.guest_ids, "message": c.message}
+            for c in plan.conflicts
+        ],
+        "alternatives": [seating_plan_to_dict(p) for p in plan.alternatives],
     }
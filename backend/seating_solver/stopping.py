@@ -0,0 +1,67 @@
+# seating_solver/stopping.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from .models import Weights
+from .problem import Problem
+from .scoring import scalar_score, scoring_tuple
+
+
+def score_lower_bound(problem: Problem, weights: Weights) -> tuple:
+    """
+    Cheap optimistic bound on scoring_tuple() for any plan of `problem`.
+
+    Each term is taken at its best achievable value on its own:
+      - must-not violations: 0
+      - wants satisfied:     guests with at least one (other) wanted guest
+      - adjacent singles:    number of singles (each seat starts one edge)
+      - alternating tables:  number of tables
+      - split couples:       number of couples (0 with a single table)
+    A plan scoring exactly this bound is provably optimal.
+    """
+    n = problem.num_guests
+    wants = sum(1 for g in range(n) if problem.wants[g] - {g})
+    singles = sum(problem.single)
+    couples = sum(1 for g, s in enumerate(problem.spouse) if s > g)
+    if problem.num_tables < 2:
+        couples = 0
+
+    def best(weight: int, upper: int) -> int:
+        # Rewards enter the tuple negated; a negative weight flips the optimum
+        return upper if weight >= 0 else 0
+
+    return scoring_tuple(
+        0 if weights.must_not >= 0 else n,
+        best(weights.wants, wants),
+        best(weights.alternating, problem.num_tables),
+        best(weights.split_couples, couples),
+        best(weights.adjacent_singles, singles),
+        weights,
+    )
+
+
+@dataclass
+class StopCriteria:
+    """
+    When a search may stop before exhausting its budget.
+
+    `deadline` is a time.perf_counter() value; `lower_bound` a proven
+    optimum (see score_lower_bound); `target` a caller-supplied weighted
+    total (scalar_score) that is "good enough".
+    """
+    deadline: Optional[float] = None
+    lower_bound: Optional[tuple] = None
+    target: Optional[float] = None
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def reached(self, score: Optional[tuple]) -> bool:
+        if score is None:
+            return False
+        if self.lower_bound is not None and score <= self.lower_bound:
+            return True
+        return self.target is not None and scalar_score(score) <= self.target
@@ -0,0 +1,81 @@
+# seating_solver/sweep.py
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, List, Optional
+
+import numpy as np
+
+from .batch import BatchEvaluator, best_row, score_matrix
+from .models import Weights
+from .pareto import objective_matrix, pareto_front
+from .problem import Problem
+
+
+@dataclass
+class CandidatePool:
+    """
+    Scored candidate plans for one Problem. Metrics do not depend on the
+    weights, so one pool can be re-ranked under any number of weight
+    settings without scoring a plan again.
+    """
+    problem: Problem
+    batch: BatchEvaluator
+    plans: np.ndarray       # (candidates x seats) int32 batch matrix
+    metrics: np.ndarray     # (candidates x 6), METRIC_FIELDS order
+
+    @property
+    def size(self) -> int:
+        return len(self.plans)
+
+    @property
+    def nbytes(self) -> int:
+        return self.plans.nbytes + self.metrics.nbytes
+
+    def seatings(self, row: int) -> List[List[int]]:
+        return self.batch.to_seatings(self.plans[row])
+
+    def best_for(self, weights: Weights) -> int:
+        """Row of the best candidate under `weights`."""
+        return best_row(score_matrix(self.metrics, weights))
+
+    def pareto_rows(self) -> List[int]:
+        """Rows whose metrics no other candidate beats on every term."""
+        return pareto_front(objective_matrix(self.metrics)).tolist()
+
+
+class PoolCache:
+    """
+    Small thread-safe LRU of candidate pools, keyed by request content.
+    Holds at most `max_entries` pools and, beyond the newest one, at most
+    `max_bytes` of plans and metrics.
+    """
+
+    def __init__(self, max_entries: int = 8, max_bytes: int = 128 * 2**20) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._pools: "OrderedDict[Hashable, CandidatePool]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CandidatePool]:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is not None:
+                self._pools.move_to_end(key)
+            return pool
+
+    def put(self, key: Hashable, pool: CandidatePool) -> None:
+        with self._lock:
+            self._pools[key] = pool
+            self._pools.move_to_end(key)
+            while len(self._pools) > self.max_entries or (
+                len(self._pools) > 1
+                and sum(p.nbytes for p in self._pools.values()) > self.max_bytes
+            ):
+                self._pools.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pools.clear()
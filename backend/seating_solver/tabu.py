@@ -0,0 +1,133 @@
+# seating_solver/tabu.py
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .evaluator import PlanEvaluator
+from .models import Weights
+from .parties import party_swap_pairs
+from .problem import Problem
+from .stopping import StopCriteria
+
+
+@dataclass
+class TabuConfig:
+    """
+    Settings for the tabu-search phase.
+
+    Each iteration samples `candidates` neighbours (seat swaps and, with
+    `move_probability`, inter-table moves) and takes the best one that is
+    not tabu. Moves stay tabu for `tenure` iterations. In events with
+    parties, `party_move_probability` of the neighbours move a whole party.
+    """
+    iterations: int = 2000
+    tenure: int = 12
+    candidates: int = 40
+    move_probability: float = 0.2
+    party_move_probability: float = 0.1
+
+
+# Tabu keys are guest pairs: a swap of a and b forbids swapping them back
+# (a, b); moving g away from table t forbids (g, -1 - t), i.e. moving g
+# back to t. A party move is keyed like a move of its first member.
+TabuKey = Tuple[int, int]
+
+
+def _add(score: tuple, delta: tuple) -> tuple:
+    return tuple(s + d for s, d in zip(score, delta))
+
+
+def tabu_search(
+    problem: Problem,
+    seatings: List[List[int]],
+    weights: Weights,
+    config: TabuConfig,
+    rng: random.Random,
+    stop: StopCriteria,
+) -> PlanEvaluator:
+    """
+    Refine a constructed plan with tabu search over seat swaps and
+    inter-table moves.
+
+    Tabu moves are still taken when they beat the best score seen so far
+    (aspiration). Stops early once `stop` expires or its target is reached.
+    Returns an evaluator holding the best plan seen.
+    """
+    current = PlanEvaluator(problem, seatings, weights)
+    best_score = current.score()
+    best_seatings = [list(s) for s in current.seatings]
+
+    n = problem.num_guests
+    num_tables = problem.num_tables
+    if n < 2 or config.iterations <= 0:
+        return current
+
+    tabu_until: Dict[TabuKey, int] = {}
+
+    for it in range(config.iterations):
+        if stop.expired() or stop.reached(best_score):
+            break
+        score = current.score()
+        chosen: Optional[Tuple[tuple, tuple]] = None
+
+        for _ in range(config.candidates):
+            if problem.parties and rng.random() < config.party_move_probability:
+                pairs = party_swap_pairs(current, rng)
+                if pairs is None:
+                    continue
+                delta = current.delta_swaps(pairs)
+                key = (pairs[0][0], -1 - current.table_of[pairs[0][1]])
+                move = ("party", pairs)
+            elif num_tables > 1 and rng.random() < config.move_probability:
+                g = rng.randrange(n)
+                table = rng.randrange(num_tables)
+                if len(current.seatings[current.table_of[g]]) <= 1 or not current.can_move(g, table):
+                    continue
+                position = rng.randrange(len(current.seatings[table]) + 1)
+                if current.splits_party(table, position):
+                    continue
+                delta = current.delta_move(g, table, position)
+                key = (g, -1 - table)
+                move: tuple = ("move", g, table, position)
+            else:
+                a = rng.randrange(n)
+                b = rng.randrange(n - 1)
+                if b >= a:
+                    b += 1
+                if not current.can_swap(a, b):
+                    continue
+                delta = current.delta_swap(a, b)
+                key = (min(a, b), max(a, b))
+                move = ("swap", a, b)
+
+            new_score = _add(score, current.score_delta(delta))
+            if tabu_until.get(key, -1) > it and not new_score < best_score:
+                continue
+            if chosen is None or new_score < chosen[0]:
+                chosen = (new_score, move)
+
+        if chosen is None:
+            continue
+
+        new_score, move = chosen
+        if move[0] == "party":
+            pairs = move[1]
+            g = pairs[0][0]
+            tabu_until[(g, -1 - current.table_of[g])] = it + config.tenure
+            current.apply_swaps(pairs)
+        elif move[0] == "move":
+            _, g, table, position = move
+            tabu_until[(g, -1 - current.table_of[g])] = it + config.tenure
+            current.apply_move(g, table, position)
+        else:
+            _, a, b = move
+            tabu_until[(min(a, b), max(a, b))] = it + config.tenure
+            current.apply_swap(a, b)
+
+        if new_score < best_score:
+            best_score = new_score
+            best_seatings = [list(s) for s in current.seatings]
+
+    return PlanEvaluator(problem, best_seatings, weights)
@@ -2,6 +2,7 @@ import pytest
 from httpx import AsyncClient, ASGITransport
 
 from app.main import app
+from seating_solver.solver import MAX_POOL_SEATS, MAX_WORKERS
 
 
 @pytest.mark.asyncio
@@ -93,3 +94,189 @@ async def test_generate_seating_rejects_over_capacity():
         resp = await ac.post("/api/seating/generate", json=payload)
         assert resp.status_code == 400
         assert "Not enough seats" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_generate_seating_rejects_more_workers_than_cpus():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        payload = {
+            "guests": [{"id": "g1", "name": "A"}, {"id": "g2", "name": "B"}],
+            "tables": [{"id": "t1", "name": "Table 1", "shape": "round", "capacity": 2}],
+            "maxAttempts": 10,
+            "workers": MAX_WORKERS + 1,
+        }
+
+        resp = await ac.post("/api/seating/generate", json=payload)
+        assert resp.status_code == 422
+
+        payload["workers"] = MAX_WORKERS
+        resp = await ac.post("/api/seating/generate", json=payload)
+        assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_generate_seating_rejects_parties_that_cannot_be_packed():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        payload = {
+            "guests": [
+                {"id": f"g{i}", "name": f"Guest {i}", "gender": "Male" if i % 2 else "Female",
+                 "partyId": f"p{i // 2}"}
+                for i in range(6)
+            ],
+            "tables": [
+                {"id": f"t{i}", "name": f"Table {i}", "shape": "round", "capacity": 3}
+                for i in range(2)
+            ],
+            "maxAttempts": 10,
+            "seed": 1,
+        }
+
+        resp = await ac.post("/api/seating/generate", json=payload)
+        assert resp.status_code == 400
+        assert "cannot each share a table" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_generate_seating_engine_selection():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        payload = {
+            "guests": [
+                {"id": f"g{i}", "name": f"Guest {i}", "gender": "Male" if i % 2 else "Female"}
+                for i in range(8)
+            ],
+            "tables": [
+                {"id": "t1", "name": "Table 1", "shape": "round", "capacity": 4},
+                {"id": "t2", "name": "Table 2", "shape": "round", "capacity": 4},
+            ],
+            "maxAttempts": 10,
+            "seed": 5,
+            "engine": "anneal",
+            "engineOptions": {"steps": 200},
+        }
+
+        resp = await ac.post("/api/seating/generate", json=payload)
+        assert resp.status_code == 200
+        seated = {s["guestId"] for t in resp.json()["tables"] for s in t["seats"]}
+        assert seated == {f"g{i}" for i in range(8)}
+
+        payload["pareto"] = True
+        resp = await ac.post("/api/seating/generate", json=payload)
+        assert resp.status_code == 200
+        alternatives = resp.json()["alternatives"]
+        assert alternatives
+        assert all(len(a["tables"]) == 2 for a in alternatives)
+
+        payload["engine"] = "unknown"
+        resp = await ac.post("/api/seating/generate", json=payload)
+        assert resp.status_code == 400
+        assert "Unknown engine" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_generate_seating_hard_must_not_reports_conflicts():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        # Five guests who all refuse each other cannot share one table of eight
+        feuding = [f"g{i}" for i in range(5)]
+        payload = {
+            "guests": [
+                {
+                    "id": f"g{i}",
+                    "name": f"Guest {i}",
+                    "mustNotSitNextTo": [g for g in feuding if g != f"g{i}"] if i < 5 else [],
+                }
+                for i in range(8)
+            ],
+            "tables": [{"id": "t1", "name": "Table 1", "shape": "round", "capacity": 8}],
+            "maxAttempts": 10,
+            "seed": 1,
+            "hardMustNot": True,
+        }
+
+        resp = await ac.post("/api/seating/generate", json=payload)
+        assert resp.status_code == 400
+        detail = resp.json()["detail"]
+        assert "must-not" in detail["message"]
+        assert detail["conflicts"] == [
+            {"kind": "clique", "guestIds": feuding, "message": detail["conflicts"][0]["message"]}
+        ]
+
+
+@pytest.mark.asyncio
+async def test_seating_conflicts_endpoint_reports_minimal_cores():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        payload = {
+            "guests": [
+                {"id": "a", "name": "Ann", "wantsToSitNextTo": ["b"], "mustNotSitNextTo": ["b"]},
+                {"id": "b", "name": "Ben"},
+                {"id": "c", "name": "Cat", "wantsToSitNextTo": ["f"]},
+                {"id": "d", "name": "Dan", "wantsToSitNextTo": ["f"]},
+                {"id": "e", "name": "Eve", "wantsToSitNextTo": ["f"]},
+                {"id": "f", "name": "Fay"},
+            ],
+            "tables": [{"id": "t1", "name": "Table 1", "shape": "round", "capacity": 6}],
+        }
+
+        resp = await ac.post("/api/seating/conflicts", json=payload)
+        assert resp.status_code == 200
+        conflicts = resp.json()
+        assert [(c["kind"], c["guestIds"]) for c in conflicts] == [
+            ("wants_must_not", ["a", "b"]),
+            ("oversubscribed", ["f", "c", "d", "e"]),
+        ]
+
+        resp = await ac.post("/api/seating/generate", json={**payload, "maxAttempts": 5})
+        assert resp.status_code == 200
+        assert len(resp.json()["conflicts"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_weight_sweep_ranks_one_cached_pool():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        guests = [
+            {
+                "id": f"g{i}",
+                "name": f"Guest {i}",
+                "gender": "Male" if i % 2 else "Female",
+                "maritalStatus": "Single" if i % 3 == 0 else None,
+                "wantsToSitNextTo": [f"g{(i + 5) % 16}"],
+                "mustNotSitNextTo": [f"g{(i + 1) % 16}"],
+            }
+            for i in range(16)
+        ]
+        tables = [
+            {"id": f"t{i}", "name": f"Table {i}", "shape": "round", "capacity": 4}
+            for i in range(4)
+        ]
+        payload = {
+            "guests": guests,
+            "tables": tables,
+            "seed": 9,
+            "poolSize": 300,
+            "weightConfigs": [{}, {"mustNotWeight": 0, "wantsWeight": 100}],
+            "pareto": True,
+        }
+
+        resp = await ac.post("/api/seating/sweep", json=payload)
+        assert resp.status_code == 200
+        first = resp.json()
+        assert len(first["plans"]) == 2
+        assert first["poolSize"] == 300
+        wants = [p["metrics"]["wantsSatisfied"] for p in first["plans"]]
+        assert wants[1] >= wants[0]
+        assert first["pareto"]
+
+        payload["weightConfigs"] = [{"splitCouplesWeight": 50}]
+        resp = await ac.post("/api/seating/sweep", json=payload)
+        assert resp.status_code == 200
+        assert resp.json()["cached"] is True
+
+        payload["poolSize"] = MAX_POOL_SEATS // len(guests) + 1
+        resp = await ac.post("/api/seating/sweep", json=payload)
+        assert resp.status_code == 400
+        assert "too large" in resp.json()["detail"]
@@ -0,0 +1,633 @@
+import itertools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from seating_solver.batch import BatchEvaluator, random_plans
+from seating_solver.decompose import TwoPhaseConfig, two_phase
+from seating_solver.evaluator import PlanEvaluator
+from seating_solver.exact import EXACT_ORDER_MAX_SEATS, exact_table_order
+from seating_solver.feasibility import InfeasibleError
+from seating_solver.genetic import order_crossover, partially_mapped_crossover
+from seating_solver.models import Guest, Table
+from seating_solver.parties import parties_intact
+from seating_solver.pareto import ParetoArchive, objective_vector, pareto_front
+from seating_solver.partition import PartitionConfig, partition
+from seating_solver.problem import compile_problem
+from seating_solver.scoring import DEFAULT_WEIGHTS, metrics_score
+from seating_solver.solver import (
+    CONSTRUCTION_BATCH,
+    MAX_WORKERS,
+    analyse_conflicts,
+    build_table_seating,
+    candidate_pool,
+    compute_metrics,
+    construction_layout,
+    ensure_no_adjacent_couples,
+    iter_solve,
+    separate_couples,
+    solve,
+)
+from seating_solver.stopping import StopCriteria
+from seating_solver.sweep import PoolCache
+
+
+def make_event(num_guests=60, per_table=6, seed=0):
+    """Random event with couples, wants and a fairly dense must-not graph."""
+    rng = random.Random(seed)
+    guests = []
+    for i in range(num_guests):
+        guests.append(
+            Guest(
+                id=f"g{i}",
+                name=f"Guest {i}",
+                gender="Male" if i % 2 else "Female",
+                marital_status="Single" if rng.random() < 0.3 else None,
+                wants_to_sit_next_to=[f"g{rng.randrange(num_guests)}"],
+                must_not_sit_next_to=[f"g{rng.randrange(num_guests)}" for _ in range(3)],
+            )
+        )
+    for i in range(0, num_guests - 1, 4):
+        guests[i].partner_id = guests[i + 1].id
+    tables = [
+        Table(id=f"t{i}", name=f"Table {i}", shape="round", capacity=per_table)
+        for i in range(num_guests // per_table)
+    ]
+    return guests, tables
+
+
+def plan_score(plan):
+    return metrics_score(plan.metrics, DEFAULT_WEIGHTS)
+
+
+def same_plan(a, b):
+    return (a.tables, a.metrics, a.attempts_made) == (b.tables, b.metrics, b.attempts_made)
+
+
+def assert_valid_plan(plan, guests, tables):
+    seated = [s.guest_id for t in plan.tables for s in t.seats]
+    assert sorted(seated) == sorted(g.id for g in guests)
+    capacity = {t.id: t.capacity for t in tables}
+    for t in plan.tables:
+        assert len(t.seats) <= capacity[t.table_id]
+
+
+def test_anneal_never_worse_than_construction():
+    guests, tables = make_event()
+    base = solve(guests, tables, max_attempts=50, seed=3)
+    refined = solve(
+        guests,
+        tables,
+        max_attempts=50,
+        seed=3,
+        engine="anneal",
+        engine_options={"steps": 5000},
+    )
+
+    assert_valid_plan(refined, guests, tables)
+    assert plan_score(refined) <= plan_score(base)
+    assert refined.metrics.must_not_violations == 0
+
+
+def test_unknown_engine_and_options_rejected():
+    guests, tables = make_event(12, 6)
+    with pytest.raises(ValueError, match="Unknown engine"):
+        solve(guests, tables, engine="quantum")
+    with pytest.raises(ValueError, match="Invalid engine options"):
+        solve(guests, tables, engine="anneal", engine_options={"bogus": 1})
+
+
+def test_tabu_is_seedable_and_never_worse_than_construction():
+    guests, tables = make_event(seed=1)
+    base = solve(guests, tables, max_attempts=50, seed=9)
+    options = {"iterations": 300, "candidates": 20}
+    first = solve(guests, tables, max_attempts=50, seed=9, engine="tabu", engine_options=options)
+    second = solve(guests, tables, max_attempts=50, seed=9, engine="tabu", engine_options=options)
+
+    assert_valid_plan(first, guests, tables)
+    assert same_plan(first, second)
+    assert plan_score(first) <= plan_score(base)
+
+
+def test_parallel_restarts_are_reproducible():
+    guests, tables = make_event(seed=2)
+    first = solve(guests, tables, max_attempts=40, seed=11, workers=3)
+    second = solve(guests, tables, max_attempts=40, seed=11, workers=3)
+
+    assert_valid_plan(first, guests, tables)
+    assert same_plan(first, second)
+    assert first.attempts_made == 40
+
+
+def test_workers_are_clamped_to_cpu_count():
+    guests, tables = make_event(seed=2)
+    capped = solve(guests, tables, max_attempts=20, seed=4, workers=MAX_WORKERS)
+    over = solve(guests, tables, max_attempts=20, seed=4, workers=MAX_WORKERS + 8)
+
+    assert same_plan(capped, over)
+
+
+def test_concurrent_solves_do_not_share_rng():
+    guests, tables = make_event(seed=4)
+    expected = solve(guests, tables, max_attempts=30, seed=21, engine="anneal",
+                     engine_options={"steps": 500})
+
+    state = random.getstate()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        plans = list(pool.map(
+            lambda _: solve(guests, tables, max_attempts=30, seed=21, engine="anneal",
+                            engine_options={"steps": 500}),
+            range(8),
+        ))
+
+    assert all(same_plan(p, expected) for p in plans)
+    # The global module RNG is never reseeded or drawn from
+    assert random.getstate() == state
+
+
+def test_time_budget_stops_early_and_reports_elapsed():
+    guests, tables = make_event(120, 8, seed=5)
+    plan = solve(guests, tables, max_attempts=10 ** 6, seed=1, time_budget_ms=100)
+
+    assert_valid_plan(plan, guests, tables)
+    assert 1 <= plan.attempts_made < 10 ** 6
+    assert 100 <= plan.elapsed_ms < 2000
+
+
+def test_iter_solve_yields_improving_plans_then_final():
+    guests, tables = make_event(seed=6)
+    progress = list(iter_solve(guests, tables, max_attempts=200, seed=2))
+
+    scores = [plan_score(p.plan) for p in progress]
+    assert all(b < a for a, b in zip(scores[:-2], scores[1:-1]))
+    assert [p.final for p in progress] == [False] * (len(progress) - 1) + [True]
+    assert progress[-1].plan.attempts_made == 200
+    assert progress[-1].plan.metrics == progress[-2].plan.metrics
+
+    final = solve(guests, tables, max_attempts=200, seed=2)
+    assert same_plan(final, progress[-1].plan)
+
+
+def test_iter_solve_can_stop_early():
+    guests, tables = make_event(seed=6)
+    first = next(iter_solve(guests, tables, max_attempts=10 ** 6, seed=2))
+    assert first.attempt == 1
+    assert not first.final
+
+
+def test_stagnation_window_stops_restarts_and_reports_curve():
+    guests, tables = make_event(seed=7)
+    plan = solve(guests, tables, max_attempts=10 ** 6, seed=4, stagnation_window=25)
+
+    curve = plan.improvement_curve
+    assert curve
+    # The last point may be the exact reordering done after construction
+    restarts = [p for p in curve if p.attempt < plan.attempts_made]
+    assert plan.attempts_made == restarts[-1].attempt + 25
+    assert all(b.score < a.score for a, b in zip(curve, curve[1:]))
+    assert [p.attempt for p in curve] == sorted(p.attempt for p in curve)
+
+
+def test_two_phase_keeps_table_sizes_and_never_worse():
+    guests, tables = make_event(seed=5)
+    base = solve(guests, tables, max_attempts=30, seed=13)
+    refined = solve(guests, tables, max_attempts=30, seed=13, engine="two_phase",
+                    engine_options={"partition_iterations": 3000})
+
+    assert_valid_plan(refined, guests, tables)
+    assert plan_score(refined) <= plan_score(base)
+    assert same_plan(
+        refined,
+        solve(guests, tables, max_attempts=30, seed=13, engine="two_phase",
+              engine_options={"partition_iterations": 3000}),
+    )
+
+
+def test_exact_table_order_beats_every_permutation():
+    guests, tables = make_event(8, 8, seed=6)
+    problem = compile_problem(guests, tables)
+    members = list(range(8))
+
+    def energy(order):
+        return PlanEvaluator(problem, [order], DEFAULT_WEIGHTS).energy()
+
+    cache = {}
+    order = exact_table_order(problem, members, DEFAULT_WEIGHTS, cache)
+    best = min(energy([0, *rest]) for rest in itertools.permutations(members[1:]))
+
+    assert sorted(order) == members
+    assert energy(order) == best
+    assert exact_table_order(problem, members[::-1], DEFAULT_WEIGHTS, cache) == order
+    assert exact_table_order(problem, list(range(EXACT_ORDER_MAX_SEATS + 1)), DEFAULT_WEIGHTS) is None
+
+
+def test_partition_engine_groups_wanted_guests():
+    guests, tables = make_event(120, 10, seed=8)
+    base = solve(guests, tables, max_attempts=20, seed=2)
+    plan = solve(guests, tables, max_attempts=20, seed=2, engine="partition")
+
+    assert_valid_plan(plan, guests, tables)
+    assert plan.metrics.must_not_violations == 0
+    assert plan.metrics.wants_satisfied > base.metrics.wants_satisfied
+    assert same_plan(plan, solve(guests, tables, max_attempts=20, seed=2, engine="partition"))
+
+
+@pytest.mark.parametrize("refine", [two_phase, partition])
+def test_decomposed_engines_keep_the_plan_once_time_is_up(refine):
+    guests, tables = make_event(seed=8)
+    problem = compile_problem(guests, tables)
+    plans = random_plans(problem, construction_layout(problem), np.random.default_rng(8), 1)
+    seatings = BatchEvaluator(problem).to_seatings(plans[0])
+    config = TwoPhaseConfig() if refine is two_phase else PartitionConfig()
+    expired = StopCriteria(deadline=time.perf_counter())
+
+    refined = refine(problem, seatings, DEFAULT_WEIGHTS, config, random.Random(8), expired)
+    assert refined.seatings == seatings
+
+
+@pytest.mark.parametrize("parties", [None, "loose", "fixed"])
+def test_hard_must_not_builds_only_feasible_plans(parties):
+    guests, tables = make_event(60, 6, seed=9)
+    for g in guests:
+        g.must_not_sit_next_to = [f"g{(int(g.id[1:]) + k) % 60}" for k in (1, 2, 3, 7)]
+    if parties:
+        # Ten two-person parties among guests with random must-not pairs
+        # (no party pair refuses each other for this seed)
+        guests, tables = make_event(60, 15, seed=2)
+        rng = random.Random(2)
+        for g in guests:
+            g.must_not_sit_next_to = [f"g{rng.randrange(60)}" for _ in range(4)]
+        for i, g in enumerate(guests[:20]):
+            g.party_id = f"p{i // 2}"
+            g.party_seat = i % 2 if parties == "fixed" else None
+    # Without parties, also check annealing keeps plans feasible; with them,
+    # construction alone must (it used to leave must-not pairs in place)
+    engine = "random" if parties else "anneal"
+    hard = solve(guests, tables, max_attempts=20, seed=3, hard_must_not=True, engine=engine,
+                 engine_options={"steps": 2000} if engine == "anneal" else None)
+
+    assert_valid_plan(hard, guests, tables)
+    assert hard.metrics.must_not_violations == 0
+    if parties:
+        problem = compile_problem(guests, tables)
+        index = {gid: i for i, gid in enumerate(problem.ids)}
+        seatings = [[index[s.guest_id] for s in t.seats] for t in hard.tables]
+        assert parties_intact(problem, seatings)
+
+
+def make_feuding_event(seed, num_guests=12, per_table=6):
+    """Alternating genders, each guest refusing 3-6 random others."""
+    rng = random.Random(seed)
+    ids = [f"g{i}" for i in range(num_guests)]
+    refused = [rng.sample([x for x in ids if x != g], rng.randint(3, 6)) for g in ids]
+    guests = [
+        Guest(id=g, name=g, gender="Male" if i % 2 else "Female", must_not_sit_next_to=refused[i])
+        for i, g in enumerate(ids)
+    ]
+    tables = [
+        Table(id=f"t{t}", name=f"Table {t}", shape="round", capacity=per_table)
+        for t in range(num_guests // per_table)
+    ]
+    return guests, tables
+
+
+def test_hard_must_not_solves_feasible_instances_the_clique_check_passes():
+    # Feasible, but the first-attempt node limit used to fail on every restart
+    guests, tables = make_feuding_event(147)
+    assert not analyse_conflicts(guests, tables)
+    plan = solve(guests, tables, max_attempts=50, seed=0, hard_must_not=True)
+
+    assert_valid_plan(plan, guests, tables)
+    assert plan.metrics.must_not_violations == 0
+
+
+def test_hard_must_not_raises_instead_of_returning_an_empty_plan():
+    # Infeasible, but no clique / isolated / cycle conflict shows it
+    guests, tables = make_feuding_event(3)
+    assert not analyse_conflicts(guests, tables)
+
+    with pytest.raises(InfeasibleError) as info:
+        solve(guests, tables, max_attempts=1000, seed=0, hard_must_not=True)
+    assert [c.kind for c in info.value.conflicts] == ["unseatable"]
+
+
+def test_hard_must_not_fails_fast_on_isolated_guest():
+    guests, tables = make_event(12, 6, seed=10)
+    guests[0].must_not_sit_next_to = [g.id for g in guests[1:]]
+
+    with pytest.raises(InfeasibleError) as info:
+        solve(guests, tables, hard_must_not=True)
+    assert [c.kind for c in info.value.conflicts] == ["isolated"]
+    assert info.value.conflicts[0].guest_ids[0] == "g0"
+
+
+def test_hard_must_not_rejects_fixed_party_neighbours_who_refuse_each_other():
+    guests, tables = make_event(12, 6, seed=10)
+    for seat, g in enumerate(guests[:3]):
+        g.party_id = "p"
+        g.party_seat = seat
+    guests[1].must_not_sit_next_to = ["g2"]
+
+    with pytest.raises(InfeasibleError) as info:
+        solve(guests, tables, hard_must_not=True)
+    assert [(c.kind, c.guest_ids) for c in info.value.conflicts] == [("party", ["g1", "g2"])]
+
+
+def test_conflict_cores_for_small_tables():
+    guests, tables = make_event(6, 3, seed=11)
+    for g in guests:
+        g.wants_to_sit_next_to = []
+        g.must_not_sit_next_to = []
+    # A must-not 5-cycle cannot be split across two tables of three
+    for i in range(5):
+        guests[i].must_not_sit_next_to.append(f"g{(i + 1) % 5}")
+
+    conflicts = analyse_conflicts(guests, tables)
+    assert [c.kind for c in conflicts] == ["unseparable"]
+    assert sorted(conflicts[0].guest_ids) == [f"g{i}" for i in range(5)]
+    assert solve(guests, tables, max_attempts=5).conflicts == conflicts
+
+
+def test_split_components_solves_parts_and_merges():
+    # Two sides of 30 guests with no constraint between them
+    left, tables = make_event(30, 6, seed=12)
+    right, more = make_event(30, 6, seed=13)
+    for g in right:
+        g.id = "r" + g.id[1:]
+        g.wants_to_sit_next_to = ["r" + x[1:] for x in g.wants_to_sit_next_to]
+        g.must_not_sit_next_to = ["r" + x[1:] for x in g.must_not_sit_next_to]
+        g.partner_id = g.partner_id and "r" + g.partner_id[1:]
+    for i, t in enumerate(more):
+        t.id = f"t{len(tables) + i}"
+    guests, tables = left + right, tables + more
+
+    serial = solve(guests, tables, max_attempts=30, seed=5, split_components=True)
+    parallel = solve(guests, tables, max_attempts=30, seed=5, split_components=True, workers=2)
+
+    assert_valid_plan(serial, guests, tables)
+    assert same_plan(serial, parallel)
+    for t in serial.tables:
+        assert len({s.guest_id[0] for s in t.seats}) == 1
+
+
+def test_split_components_with_hard_must_not_falls_back_to_the_whole_event():
+    # Four guests who all refuse each other land on a part too small for them
+    feuding = {7, 12, 14, 15}
+    guests = [
+        Guest(
+            id=f"g{i}",
+            name=f"Guest {i}",
+            gender="Male" if i % 2 else "Female",
+            must_not_sit_next_to=[f"g{j}" for j in sorted(feuding - {i})] if i in feuding else [],
+        )
+        for i in range(16)
+    ]
+    tables = [
+        Table(id=f"t{i}", name=f"Table {i}", shape="round", capacity=c)
+        for i, c in enumerate((8, 7, 6))
+    ]
+    plan = solve(guests, tables, max_attempts=50, seed=0, hard_must_not=True,
+                 split_components=True)
+    assert_valid_plan(plan, guests, tables)
+    assert plan.metrics.must_not_violations == 0
+
+    # A part only an exhaustive search proves unseatable on its own tables
+    guests, tables = make_feuding_event(3)
+    guests += [
+        Guest(id=f"x{i}", name=f"Extra {i}", gender="Male" if i % 2 else "Female")
+        for i in range(12)
+    ]
+    tables += [Table(id=f"u{i}", name=f"Extra {i}", shape="round", capacity=6) for i in range(2)]
+    for workers in (1, 2):
+        plan = solve(guests, tables, max_attempts=50, seed=0, hard_must_not=True,
+                     split_components=True, workers=workers)
+        assert_valid_plan(plan, guests, tables)
+        assert plan.metrics.must_not_violations == 0
+
+
+def test_split_components_shares_the_budgets_across_parts():
+    # Two 60-guest departments with no constraint between them
+    left, tables = make_event(60, 6, seed=1)
+    right, more = make_event(60, 6, seed=2)
+    for g in right:
+        g.id = "h" + g.id[1:]
+        g.wants_to_sit_next_to = ["h" + x[1:] for x in g.wants_to_sit_next_to]
+        g.must_not_sit_next_to = ["h" + x[1:] for x in g.must_not_sit_next_to]
+        g.partner_id = g.partner_id and "h" + g.partner_id[1:]
+    for i, t in enumerate(more):
+        t.id = f"t{len(tables) + i}"
+    guests, tables = left + right, tables + more
+
+    plan = solve(guests, tables, max_attempts=40, seed=1, split_components=True)
+    assert plan.attempts_made == 40
+
+    # The first part used to take the whole budget, leaving one attempt
+    timed = solve(guests, tables, max_attempts=10 ** 6, time_budget_ms=200, seed=1,
+                  split_components=True)
+    assert_valid_plan(timed, guests, tables)
+    assert timed.metrics.must_not_violations == 0
+
+
+@pytest.mark.parametrize(
+    "engine", ["random", "anneal", "tabu", "two_phase", "partition", "genetic", "lns"]
+)
+def test_parties_share_a_table_in_fixed_order(engine):
+    guests, tables = make_event(48, 6, seed=21)
+    for g in guests[:3]:
+        g.party_id = "loose"
+    for i, g in enumerate(guests[10:14]):
+        g.party_id = "fixed"
+        g.party_seat = 3 - i
+    fixed = [g.id for g in reversed(guests[10:14])]
+
+    plan = solve(guests, tables, max_attempts=20, seed=4, engine=engine)
+
+    assert_valid_plan(plan, guests, tables)
+    seats_of = {t.table_id: [s.guest_id for s in t.seats] for t in plan.tables}
+    table_of = {g: t for t, seats in seats_of.items() for g in seats}
+    assert len({table_of[g.id] for g in guests[:3]}) == 1
+    seats = seats_of[table_of[fixed[0]]]
+    start = seats.index(fixed[0])
+    assert [seats[(start + k) % len(seats)] for k in range(4)] == fixed
+
+
+def test_party_larger_than_every_table_is_rejected():
+    guests, tables = make_event(12, 6)
+    for g in guests[:7]:
+        g.party_id = "big"
+    with pytest.raises(ValueError, match="Party big has 7 guests"):
+        solve(guests, tables)
+
+
+def test_parties_that_cannot_all_be_packed_are_rejected():
+    guests, tables = make_event(6, 3)
+    for i, g in enumerate(guests):
+        g.party_id = f"p{i // 2}"
+    with pytest.raises(ValueError, match="cannot each share a table"):
+        solve(guests, tables)
+
+
+def test_parties_the_greedy_pass_strands_are_still_packed():
+    # Largest-room-first puts 4 and 3 on different tables; 4+3 | 3+2+2 fits
+    guests, tables = make_event(14, 7)
+    sizes = [4, 3, 3, 2, 2]
+    for k, size in enumerate(sizes):
+        for g in guests[sum(sizes[:k]):sum(sizes[:k + 1])]:
+            g.party_id = f"p{k}"
+    plan = solve(guests, tables, max_attempts=5, seed=0)
+
+    assert_valid_plan(plan, guests, tables)
+    table_of = {s.guest_id: t.table_id for t in plan.tables for s in t.seats}
+    for k in range(len(sizes)):
+        assert len({table_of[g.id] for g in guests if g.party_id == f"p{k}"}) == 1
+
+
+@pytest.mark.parametrize("crossover", [order_crossover, partially_mapped_crossover])
+def test_crossover_yields_permutations(crossover):
+    rng = random.Random(8)
+    for _ in range(50):
+        a = rng.sample(range(20), 20)
+        b = rng.sample(range(20), 20)
+        child = crossover(a, b, rng)
+        assert sorted(child) == list(range(20))
+        assert crossover(a, a, rng) == a
+
+
+def test_genetic_engine_is_seedable_and_never_worse():
+    guests, tables = make_event(48, 6, seed=9)
+    base = solve(guests, tables, max_attempts=20, seed=6)
+    options = {"population": 10, "generations": 8, "crossover": "pmx"}
+    first = solve(guests, tables, max_attempts=20, seed=6, engine="genetic", engine_options=options)
+    second = solve(guests, tables, max_attempts=20, seed=6, engine="genetic", engine_options=options)
+
+    assert_valid_plan(first, guests, tables)
+    assert same_plan(first, second)
+    assert plan_score(first) <= plan_score(base)
+    with pytest.raises(ValueError, match="Unknown crossover"):
+        solve(guests, tables, engine="genetic", engine_options={"crossover": "uniform"})
+
+
+def test_lns_rebuilds_worst_tables_and_never_worse():
+    guests, tables = make_event(60, 6, seed=14)
+    base = solve(guests, tables, max_attempts=30, seed=2)
+    options = {"iterations": 150, "destroy_tables": 3}
+    first = solve(guests, tables, max_attempts=30, seed=2, engine="lns", engine_options=options)
+    second = solve(guests, tables, max_attempts=30, seed=2, engine="lns", engine_options=options)
+
+    assert_valid_plan(first, guests, tables)
+    assert same_plan(first, second)
+    assert plan_score(first) < plan_score(base)
+
+
+def test_batched_construction_fills_the_same_gender_slots():
+    guests, tables = make_event(56, 8, seed=15)
+    problem = compile_problem(guests, tables)
+    layout = construction_layout(problem)
+    plans = random_plans(problem, layout, np.random.default_rng(0), 64)
+
+    males, females = problem.males[:], problem.females[:]
+    reference = [build_table_seating(males, females, size) for size in problem.table_sizes]
+    pattern = [problem.gender[g] for seats in reference for g in seats]
+    for row in plans.tolist():
+        assert sorted(row) == list(range(problem.num_guests))
+        assert [problem.gender[g] for g in row] == pattern
+
+
+@pytest.mark.parametrize("per_table", [2, 5])
+def test_swap_metrics_match_a_full_recount(per_table):
+    guests, tables = make_event(40, per_table, seed=16)
+    problem = compile_problem(guests, tables)
+    batch = BatchEvaluator(problem)
+    gen = np.random.default_rng(16)
+    plans = np.stack([gen.permutation(problem.num_guests) for _ in range(200)])
+    a = gen.integers(problem.num_guests, size=200)
+    b = gen.integers(problem.num_guests, size=200)
+
+    swapped, metrics = batch.swap_metrics(plans, batch.metrics_matrix(plans), a, b)
+    assert (swapped[np.arange(200), a] == plans[np.arange(200), b]).all()
+    assert (metrics == batch.metrics_matrix(swapped)).all()
+
+
+def test_batched_construction_separates_couples_before_scoring():
+    guests, tables = make_event(56, 8, seed=15)
+    problem = compile_problem(guests, tables)
+    batch = BatchEvaluator(problem)
+    plans = random_plans(problem, construction_layout(problem), np.random.default_rng(1), 200)
+    expected = [
+        [g for seats in batch.to_seatings(row) for g in ensure_no_adjacent_couples(problem, seats)]
+        for row in plans
+    ]
+
+    separated = separate_couples(problem, batch, plans.copy())
+    assert separated.tolist() == expected
+    assert separated.tolist() != plans.tolist()
+    for row, metrics in zip(separated, batch.metrics(separated)):
+        assert metrics == compute_metrics(problem, batch.to_seatings(row))
+
+
+def test_pareto_front_keeps_exactly_the_non_dominated_points():
+    rng = np.random.default_rng(3)
+    points = rng.integers(0, 6, size=(300, 3))
+    front = set(pareto_front(points).tolist())
+
+    for i, p in enumerate(points):
+        dominated = any(
+            (q <= p).all() and (q < p).any() for q in points
+        )
+        duplicate = any((points[j] == p).all() for j in range(i))
+        assert (i in front) == (not dominated and not duplicate)
+
+
+def test_pareto_archive_matches_pareto_front_in_any_insertion_order():
+    rng = np.random.default_rng(4)
+    points = rng.integers(0, 6, size=(300, 3))
+    expected = {tuple(points[i]) for i in pareto_front(points).tolist()}
+
+    archive = ParetoArchive()
+    for i in rng.permutation(len(points)).tolist():
+        archive.add(tuple(points[i].tolist()), i)
+    keys = [key for key, _ in archive.entries()]
+    assert set(keys) == expected
+    assert keys == sorted(keys)
+
+
+def test_candidate_pool_is_built_in_chunks_and_the_cache_bounded_by_bytes():
+    guests, tables = make_event(40, 8, seed=5)
+    problem = compile_problem(guests, tables)
+    pool = candidate_pool(problem, CONSTRUCTION_BATCH * 2 + 7, random.Random(5))
+
+    assert pool.plans.shape == (CONSTRUCTION_BATCH * 2 + 7, problem.num_guests)
+    assert pool.plans.dtype == np.int32
+    assert (np.sort(pool.plans, axis=1) == np.arange(problem.num_guests)).all()
+    assert (pool.metrics == pool.batch.metrics_matrix(pool.plans)).all()
+
+    cache = PoolCache(max_bytes=pool.nbytes * 2)
+    for key in range(3):
+        cache.put(key, pool)
+    assert cache.get(0) is None
+    assert cache.get(1) is pool and cache.get(2) is pool
+
+
+@pytest.mark.parametrize("engine", ["random", "anneal"])
+def test_solve_pareto_returns_a_non_dominated_set_without_changing_the_winner(engine):
+    guests, tables = make_event(40, 8)
+    plain = solve(guests, tables, max_attempts=300, seed=6, engine=engine)
+    plan = solve(guests, tables, max_attempts=300, seed=6, engine=engine, pareto=True)
+
+    assert plan.metrics == plain.metrics
+    assert not plain.alternatives
+    vectors = [objective_vector(a.metrics) for a in plan.alternatives]
+    assert vectors and len(set(vectors)) == len(vectors)
+    for a in vectors:
+        assert not any(b != a and all(x <= y for x, y in zip(b, a)) for b in vectors)
+    # the winner's trade-off is on (or dominated by) the front
+    best = objective_vector(plan.metrics)
+    assert any(all(x <= y for x, y in zip(v, best)) for v in vectors)
+
+    problem = compile_problem(guests, tables)
+    for alt in plan.alternatives:
+        seated = sorted(s.guest_id for t in alt.tables for s in t.seats)
+        assert seated == sorted(problem.ids)
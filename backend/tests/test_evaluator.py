@@ -0,0 +1,138 @@
+import random
+from dataclasses import replace
+
+from seating_solver.batch import BatchEvaluator, best_row
+from seating_solver.evaluator import PlanEvaluator
+from seating_solver.models import Guest, Table
+from seating_solver.problem import compile_problem
+from seating_solver.scoring import DEFAULT_WEIGHTS, metrics_score
+from seating_solver.solver import compute_metrics, score_if_better
+
+
+def make_problem(num_guests, capacities, seed=0):
+    rng = random.Random(seed)
+    guests = []
+    for i in range(num_guests):
+        guests.append(
+            Guest(
+                id=f"g{i}",
+                name=f"Guest {i}",
+                gender=rng.choice(["Male", "Female", None]),
+                marital_status="Single" if rng.random() < 0.4 else None,
+                wants_to_sit_next_to=[f"g{rng.randrange(num_guests)}" for _ in range(rng.randrange(3))],
+                must_not_sit_next_to=[f"g{rng.randrange(num_guests)}" for _ in range(rng.randrange(3))],
+            )
+        )
+    for i in range(0, num_guests - 1, 3):
+        guests[i].partner_id = guests[i + 1].id
+    tables = [
+        Table(id=f"t{i}", name=f"Table {i}", shape="round", capacity=c)
+        for i, c in enumerate(capacities)
+    ]
+    return compile_problem(guests, tables)
+
+
+def initial_seatings(problem):
+    seatings, start = [], 0
+    for size in problem.table_sizes:
+        seatings.append(list(range(start, start + size)))
+        start += size
+    return seatings
+
+
+def test_incremental_deltas_match_full_rescoring():
+    rng = random.Random(42)
+    # Moves shrink and grow tables, exercising wrap-around on tiny tables
+    problem = make_problem(30, [10] * 6, seed=3)
+    evaluator = PlanEvaluator(problem, initial_seatings(problem))
+    assert evaluator.metrics() == compute_metrics(problem, evaluator.seatings)
+
+    for _ in range(2000):
+        if rng.random() < 0.5:
+            a, b = rng.sample(range(problem.num_guests), 2)
+            predicted = evaluator.delta_swap(a, b)
+            before = compute_metrics(problem, evaluator.seatings)
+            assert evaluator.apply_swap(a, b) == predicted
+        else:
+            g = rng.randrange(problem.num_guests)
+            targets = [t for t in range(problem.num_tables) if evaluator.can_move(g, t)]
+            if not targets or len(evaluator.seatings[evaluator.table_of[g]]) == 1:
+                continue
+            t = rng.choice(targets)
+            pos = rng.randrange(len(evaluator.seatings[t]) + 1)
+            predicted = evaluator.delta_move(g, t, pos)
+            before = compute_metrics(problem, evaluator.seatings)
+            assert evaluator.apply_move(g, t, pos) == predicted
+
+        after = compute_metrics(problem, evaluator.seatings)
+        assert evaluator.metrics() == after
+        assert predicted == tuple(
+            getattr(after, f) - getattr(before, f)
+            for f in (
+                "must_not_violations",
+                "wants_satisfied",
+                "adjacent_singles",
+                "same_gender_adjacencies",
+                "alternating_tables",
+                "split_couples",
+            )
+        )
+
+
+def test_delta_queries_leave_plan_untouched():
+    problem = make_problem(12, [6, 6], seed=1)
+    seatings = initial_seatings(problem)
+    evaluator = PlanEvaluator(problem, seatings)
+
+    evaluator.delta_swap(0, 7)
+    evaluator.delta_move(3, 1, 2)
+
+    assert evaluator.seatings == seatings
+    assert evaluator.metrics() == compute_metrics(problem, seatings)
+
+
+def test_batch_metrics_match_compute_metrics():
+    rng = random.Random(7)
+    problem = make_problem(30, [10] * 6, seed=5)
+    # Uneven sizes, including one- and two-seat tables
+    for sizes in (problem.table_sizes, [1, 2, 3, 24], [0, 4, 26]):
+        batch = BatchEvaluator(problem, sizes)
+        plans = []
+        for _ in range(40):
+            guests = rng.sample(range(problem.num_guests), problem.num_guests)
+            plans.append(batch.to_seatings(guests))
+        matrix = batch.to_matrix(plans)
+        expected = [compute_metrics(problem, plan) for plan in plans]
+        assert batch.metrics(matrix) == expected
+
+        scores = [metrics_score(m, DEFAULT_WEIGHTS) for m in expected]
+        assert [tuple(r) for r in batch.scores(matrix, DEFAULT_WEIGHTS).tolist()] == scores
+        assert scores[best_row(batch.scores(matrix, DEFAULT_WEIGHTS))] == min(scores)
+
+
+def test_lazy_scores_prune_exactly_the_plans_that_cannot_win():
+    rng = random.Random(11)
+    problem = make_problem(30, [6] * 5, seed=8)
+    batch = BatchEvaluator(problem)
+    plans = []
+    for _ in range(200):
+        plans.append(batch.to_seatings(rng.sample(range(problem.num_guests), problem.num_guests)))
+    matrix = batch.to_matrix(plans)
+
+    for weights in (DEFAULT_WEIGHTS, replace(DEFAULT_WEIGHTS, wants=0, alternating=0)):
+        full = [metrics_score(compute_metrics(problem, p), weights) for p in plans]
+        best = sorted(full)[20]
+        # best already meets this bound on its last two terms
+        bound = (0, -10 ** 6, -10 ** 6, best[3], best[4])
+        for lower_bound in (None, bound):
+            scores, better = batch.scores_if_better(matrix, weights, best, lower_bound)
+            for plan, score, row, keep in zip(plans, full, scores.tolist(), better.tolist()):
+                expected = score < best
+                if lower_bound is not None and score[:3] == best[:3]:
+                    expected = False
+                assert keep == expected
+                assert score_if_better(problem, plan, weights, best, lower_bound) == (
+                    score if expected else None
+                )
+                if keep:
+                    assert tuple(row) == score
@@ -0,0 +1,84 @@
+import pytest
+
+from seating_solver.models import Guest, Table
+from seating_solver.problem import compile_problem
+from seating_solver.solver import compute_metrics
+
+
+def make_guest(id, name, gender, marital=None, wants=None, must_not=None):
+    return Guest(
+        id=id,
+        name=name,
+        gender=gender,
+        marital_status=marital,
+        wants_to_sit_next_to=wants or [],
+        must_not_sit_next_to=must_not or [],
+    )
+
+
+def test_compile_problem_indexes_constraints_and_couples():
+    guests = [
+        make_guest("g1", "Nick", "Male", marital="Married to Charlotte", wants=["g2"]),
+        make_guest("g2", "Charlotte", "Female", marital="Married to Nick"),
+        make_guest("g3", "Sam", "Male", marital="Single", must_not=["g1", "unknown"]),
+        make_guest("g4", "Alex", None, marital="Single"),
+    ]
+    tables = [Table(id="t1", name="Table 1", shape="round", capacity=4)]
+
+    problem = compile_problem(guests, tables)
+
+    assert problem.index == {"g1": 0, "g2": 1, "g3": 2, "g4": 3}
+    assert problem.spouse == [1, 0, -1, -1]
+    assert problem.wants[0] == frozenset({1})
+    assert problem.must_not[2] == frozenset({0})  # unknown IDs are dropped
+    assert problem.single == [False, False, True, True]
+    assert problem.gender[0] == problem.gender[2] != problem.gender[1]
+    assert problem.gender[3] == 0
+    assert problem.table_sizes == [4]
+
+
+def test_compute_metrics_on_index_seatings():
+    guests = [
+        make_guest("a", "A", "Male", marital="Married to B", wants=["b"]),
+        make_guest("b", "B", "Female", marital="Married to A"),
+        make_guest("c", "C", "Male", marital="Single", must_not=["d"]),
+        make_guest("d", "D", "Female", marital="Single"),
+    ]
+    tables = [
+        Table(id="t1", name="Table 1", shape="round", capacity=2),
+        Table(id="t2", name="Table 2", shape="round", capacity=2),
+    ]
+    problem = compile_problem(guests, tables)
+
+    together = compute_metrics(problem, [[0, 1], [2, 3]])
+    assert together.wants_satisfied == 1
+    assert together.must_not_violations == 1
+    assert together.split_couples == 0
+    assert together.alternating_tables == 2
+
+    apart = compute_metrics(problem, [[0, 2], [1, 3]])
+    assert apart.wants_satisfied == 0
+    assert apart.must_not_violations == 0
+    assert apart.split_couples == 1
+    assert apart.alternating_tables == 0
+
+
+def test_compile_problem_rejects_over_capacity():
+    guests = [make_guest(f"g{i}", f"G{i}", "Male") for i in range(3)]
+    tables = [Table(id="t1", name="Table 1", shape="round", capacity=2)]
+    with pytest.raises(ValueError, match="Not enough seats"):
+        compile_problem(guests, tables)
+
+
+def test_partner_id_takes_precedence_over_marital_text():
+    guests = [
+        make_guest("g1", "Nick", "Male", marital="Married to Charlie"),
+        make_guest("g2", "Charlotte", "Female", marital="Married"),
+        make_guest("g3", "Charlie", "Male", marital="Single"),
+    ]
+    guests[0].partner_id = "g2"
+    tables = [Table(id="t1", name="Table 1", shape="round", capacity=3)]
+
+    problem = compile_problem(guests, tables)
+
+    assert problem.spouse == [1, 0, -1]
@@ -115,3 +115,27 @@ def test_attributes_and_tags_do_not_break_solver():
     # Just sanity check metrics exist and are ints
     assert isinstance(plan.metrics.wants_satisfied, int)
     assert isinstance(plan.metrics.must_not_violations, int)
+
+
+def test_stops_early_when_plan_is_provably_optimal():
+    g1 = make_guest("g1", "Nick", "Male", marital="Married to Charlotte", wants=["g2"])
+    g2 = make_guest("g2", "Charlotte", "Female", marital="Married to Nick", wants=["g1"])
+    table = Table(id="t1", name="Table 1", shape="round", capacity=4)
+
+    plan = solve([g1, g2], [table], max_attempts=1000, seed=42)
+
+    # Both wants satisfied on an alternating table: nothing left to improve
+    assert plan.metrics.wants_satisfied == 2
+    assert plan.attempts_made == 1
+
+
+def test_stops_early_at_target_score():
+    guests = [
+        make_guest(f"g{i}", f"G{i}", "Male" if i % 2 else "Female", must_not=[f"g{(i + 1) % 12}"])
+        for i in range(12)
+    ]
+    tables = [Table(id=f"t{i}", name=f"Table {i}", shape="round", capacity=6) for i in range(2)]
+
+    plan = solve(guests, tables, max_attempts=1000, seed=3, target_score=10 ** 6)
+
+    assert plan.attempts_made == 1
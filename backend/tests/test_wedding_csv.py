@@ -0,0 +1,31 @@
+from app.importers.wedding_csv import parse_wedding_csv
+
+
+def test_partners_resolved_from_legacy_marital_status():
+    csv_bytes = (
+        "Name,Gender,Marital_Status,Wants to sit next to,Must not sit next to\n"
+        "Nick,Male,Married to Charlotte,,\n"
+        "Charlotte,Female,Married,,\n"
+        "Tim,Male,Married to Nobody,,\n"
+    ).encode("utf-8")
+
+    guests, warnings = parse_wedding_csv(csv_bytes)
+    by_name = {g.name: g for g in guests}
+
+    # Resolved once at import, and kept symmetric
+    assert by_name["Nick"].partnerId == by_name["Charlotte"].id
+    assert by_name["Charlotte"].partnerId == by_name["Nick"].id
+    assert by_name["Tim"].partnerId is None
+    assert any("Nobody" in w for w in warnings)
+
+
+def test_partner_column_takes_precedence():
+    csv_bytes = (
+        "Name,Gender,Marital_Status,Partner,Wants to sit next to,Must not sit next to\n"
+        "Nick,Male,Married to Someone Else,Charlotte,,\n"
+        "Charlotte,Female,,,,\n"
+    ).encode("utf-8")
+
+    guests, _ = parse_wedding_csv(csv_bytes)
+    assert guests[0].partnerId == guests[1].id
+    assert guests[1].partnerId == guests[0].id
@@ -2,6 +2,7 @@
 import {
   API_BASE_URL,
   SeatingPlanResponse,
+  WeightSweepResponse,
   CsvImportResponse,
   Weights,
   Guest,
@@ -16,6 +17,12 @@ export async function generateSeating(params: {
   profile: string;
   maxAttempts: number;
   seed?: number;
+  engine?: string;
+  timeBudgetMs?: number;
+  stagnationWindow?: number;
+  hardMustNot?: boolean;
+  splitComponents?: boolean;
+  pareto?: boolean;
   weights: Weights;
 }): Promise<SeatingPlanResponse> {
   const res = await fetch(`${API_BASE_URL}/api/seating/generate`, {
@@ -34,13 +41,45 @@ export async function generateSeating(params: {
   }
 
   if (!res.ok) {
-    const detail = (data as any)?.detail || `API error (${res.status})`;
-    throw new Error(detail);
+    const detail = (data as any)?.detail;
+    // Infeasible hard constraints come back as { message, conflicts }
+    throw new Error(detail?.message || detail || `API error (${res.status})`);
   }
 
   return data as SeatingPlanResponse;
 }
 
+export async function sweepWeights(params: {
+  guests: any[];
+  tables: any[];
+  profile: string;
+  seed?: number;
+  poolSize?: number;
+  pareto?: boolean;
+  weightConfigs: Weights[];
+}): Promise<WeightSweepResponse> {
+  const res = await fetch(`${API_BASE_URL}/api/seating/sweep`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(params),
+  });
+
+  let data: unknown;
+  try {
+    data = await res.json();
+  } catch {
+    throw new Error(
+      `API returned a non-JSON response (${res.status} ${res.statusText}).`
+    );
+  }
+
+  if (!res.ok) {
+    throw new Error((data as any)?.detail || `API error (${res.status})`);
+  }
+
+  return data as WeightSweepResponse;
+}
+
 export async function importGuestsCsv(
   file: File,
   profile: string
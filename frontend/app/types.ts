@@ -13,6 +13,26 @@ export type SeatingPlanResponse = {
     splitCouples: number;
   };
   attemptsMade: number;
+  elapsedMs?: number;
+  improvementCurve?: { attempt: number; elapsedMs: number; score: number }[];
+  conflicts?: Conflict[];
+  // non-dominated trade-offs kept during the search (pareto: true)
+  alternatives?: SeatingPlanResponse[];
+};
+
+// Best plan per weight setting from one cached candidate pool
+export type WeightSweepResponse = {
+  plans: SeatingPlanResponse[];
+  pareto: SeatingPlanResponse[];
+  poolSize: number;
+  cached: boolean;
+  elapsedMs: number;
+};
+
+export type Conflict = {
+  kind: string;
+  guestIds: string[];
+  message: string;
 };
 
 export type Guest = {
@@ -20,6 +40,9 @@ export type Guest = {
   name: string;
   gender?: string | null;
   maritalStatus?: string | null;
+  partnerId?: string | null;
+  partyId?: string | null;
+  partySeat?: number | null;
   wantsToSitNextTo: string[];
   mustNotSitNextTo: string[];
   tags: string[];